@@ -229,12 +229,9 @@ def render_optimizer_tab(contractor_configs, sidebar_config):
                 km15_trucks += num_trucks
     
     # Load Excel data for calculations
-    import pandas as pd
-    try:
-        time_df = pd.read_excel('Time_Data.xlsx', sheet_name='Time-Data')
-    except:
+    time_df = load_time_data('Time_Data.xlsx')
+    if time_df is None:
         st.warning("⚠️ Time_Data.xlsx not found. Using fallback calculations.")
-        time_df = None
     
     # ========================================================================
     # SECTION 1: CURRENT SYSTEM ANALYSIS
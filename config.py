@@ -3,6 +3,9 @@ Configuration settings and constants for the Truck-Dump Waiting-Time Optimiser
 ============================================================================
 """
 
+import functools
+from types import MappingProxyType
+
 # Mining Operation Constants
 OPERATIONAL_HOURS = {
     'start': 5.0,  # 5:00 AM
@@ -59,18 +62,25 @@ FENI_DUMP_POINTS = {
     }
 }
 
+# Excel-level FENI site codes (backward-compatible main dump locations)
+FENI_SITES = frozenset(config['location_code'] for config in FENI_DUMP_POINTS.values())
+
 # Helper functions for FENI management
+# Sub-point name -> main FENI location (reversed so the first definition wins)
+_SUBPOINT_TO_MAIN = {
+    sub_point: main_feni
+    for main_feni, config in reversed(FENI_DUMP_POINTS.items())
+    for sub_point in config['sub_points']
+}
+
 def get_main_feni_from_sub_point(sub_point_name):
     """Get the main FENI location from a sub-point name."""
-    for main_feni, config in FENI_DUMP_POINTS.items():
-        if sub_point_name in config['sub_points']:
-            return main_feni
-    return None
+    return _SUBPOINT_TO_MAIN.get(sub_point_name)
 
 def get_distance_base_for_feni(dump_location):
     """Get the base location code for distance calculations."""
     # Direct match for backward compatibility
-    if dump_location in ['FENI KM0', 'FENI KM15']:
+    if dump_location in FENI_SITES:
         return dump_location
     
     # Check if it's a sub-point
@@ -80,14 +90,19 @@ def get_distance_base_for_feni(dump_location):
     
     return dump_location  # Fallback
 
-def get_all_feni_dump_options():
-    """Get all available FENI dump point options for UI selection."""
+@functools.lru_cache(maxsize=1)
+def _sorted_feni_dump_options():
+    """Sorted sub-point names, computed once since FENI_DUMP_POINTS is constant."""
     options = []
     for main_feni, config in FENI_DUMP_POINTS.items():
         # Only add sub-points, NOT the main FENI location codes
         # Users must select specific sub-FENI lines, not general locations
         options.extend(list(config['sub_points'].keys()))
-    return sorted(options)
+    return tuple(sorted(options))
+
+def get_all_feni_dump_options():
+    """Get all available FENI dump point options for UI selection."""
+    return list(_sorted_feni_dump_options())
 
 def get_active_sub_fenis_for_main(main_feni, contractor_configs):
     """Get list of active sub-FENI points being used for a main FENI location."""
@@ -168,7 +183,7 @@ MINING_INTELLIGENCE = {
 }
 
 # Default truck configurations (updated to use real location codes and new FENI sub-points)
-DEFAULT_TRUCK_CONFIG = {
+_DEFAULT_TRUCK_CONFIG = {
     'RIM': {
         'TF': {
             'loading_location': 'TF',
@@ -229,6 +244,33 @@ DEFAULT_TRUCK_CONFIG = {
     }
 }
 
+# Shared read-only view of the defaults, so no caller can edit them in place
+DEFAULT_TRUCK_CONFIG = MappingProxyType({
+    contractor: MappingProxyType({
+        parking: MappingProxyType(settings) for parking, settings in routes.items()
+    })
+    for contractor, routes in _DEFAULT_TRUCK_CONFIG.items()
+})
+
+def get_default_truck_config():
+    """Get an editable copy of the default truck configuration."""
+    return {
+        contractor: {parking: dict(settings) for parking, settings in routes.items()}
+        for contractor, routes in DEFAULT_TRUCK_CONFIG.items()
+    }
+
+# Default trucks per route for each contractor when loading from Excel,
+# based on contractor size
+CONTRACTOR_TRUCK_COUNTS = {
+    'RIM': 30,  # Major contractor
+    'GMG': 25,  # Medium contractor
+    'CKB': 20,  # Smaller contractor
+    'SSS': 35,  # Large contractor with multiple routes
+    'PPP': 15,  # Smaller contractor
+    'HJS': 20,  # Medium contractor
+}
+DEFAULT_CONTRACTOR_TRUCK_COUNT = 25
+
 # UI Configuration
 UI_CONFIG = {
     'page_title': 'Truck Scheduler',
@@ -6,6 +6,10 @@ All mathematical and algorithmic logic for optimization, waiting times, and perf
 
 import pandas as pd  
 import numpy as np
+import functools
+import os
+import re
+import weakref
 from collections import defaultdict
 from typing import Dict, Tuple, List, Optional, Union
 import time
@@ -25,6 +29,66 @@ logger = logging.getLogger(__name__)
 if not logger.handlers:
     logger.addHandler(logging.NullHandler())
 
+# Departure times are entered as ``H:MM``/``HH:MM`` strings and the same
+# handful of values is parsed for every route on every refresh, so parsed
+# results are memoised per string.
+_DEPARTURE_TIME_RE = re.compile(r'^\s*(\d{1,2}):(\d{2})\s*$')
+
+@functools.lru_cache(maxsize=1024)
+def _departure_hour(departure_time_str: str) -> Optional[float]:
+    """Decimal hours of a departure time string, or ``None`` if it cannot be parsed."""
+    match = _DEPARTURE_TIME_RE.match(departure_time_str)
+    if match:
+        return int(match.group(1)) + int(match.group(2)) / 60.0
+    # Lenient path for values such as "6:30:00" or "6.5:00"
+    try:
+        parts = departure_time_str.split(':')
+        return float(parts[0]) + float(parts[1]) / 60
+    except (ValueError, IndexError):
+        return None
+
+def parse_departure_hour(departure_time_str: str, default: Optional[float] = None) -> Optional[float]:
+    """
+    Convert a departure time string such as ``"6:30"`` into decimal hours.
+
+    Args:
+        departure_time_str: Departure time in ``H:MM`` format
+        default: Value returned when the string cannot be parsed
+
+    Returns:
+        Departure time in hours (e.g. 6.5), or ``default`` if invalid
+    """
+    if not isinstance(departure_time_str, str):
+        return default
+    hour = _departure_hour(departure_time_str)
+    return default if hour is None else hour
+
+TIME_DATA_FILE = 'Time_Data.xlsx'
+TIME_DATA_SHEET = 'Time-Data'
+
+@functools.lru_cache(maxsize=1)
+def _load_time_data(filepath: str, mtime: float) -> pd.DataFrame:
+    """Read the Time-Data sheet; ``mtime`` is part of the cache key so a replaced file is re-read."""
+    from departure_optimizer import load_time_data
+    df = load_time_data(filepath)
+    if df is None:
+        raise ValueError(f"cannot read the {TIME_DATA_SHEET} sheet of {filepath}")
+    # Hour columns are small values (0-24 h), float32 is ample and halves their size
+    hour_columns = [c for c in df.select_dtypes(include='float64').columns if c.endswith('(h)')]
+    df[hour_columns] = df[hour_columns].astype('float32')
+    return df
+
+def get_time_data(filepath: str = TIME_DATA_FILE) -> pd.DataFrame:
+    """
+    Return the shared Time-Data DataFrame, reading the workbook only when it changes.
+
+    The returned frame is shared between all callers and must not be modified in place.
+
+    Raises:
+        OSError: If the Excel file does not exist
+    """
+    return _load_time_data(filepath, os.path.getmtime(filepath))
+
 def calculate_travel_time(from_location: str, to_location: str, speed_kmh: float, is_loaded: bool = False) -> float:
     """
     Calculate travel time between two locations using real Excel data or fallback distances.
@@ -185,8 +249,7 @@ def calculate_cycle_times(contractor_configs, loaded_speed, empty_speed):
     
     # Load real mining data from Excel
     try:
-        import pandas as pd
-        excel_data = pd.read_excel('Time_Data.xlsx', sheet_name='Time-Data')
+        excel_data = get_time_data()
         
         # Create lookup dictionary from real Excel data
         real_cycle_times = {}
@@ -364,17 +427,16 @@ def calculate_cycle_times(contractor_configs, loaded_speed, empty_speed):
             
             # Add departure time impact (traffic factor)
             departure_time = config.get('departure_time', '7:00')
-            try:
-                departure_hour = float(departure_time.split(':')[0]) + float(departure_time.split(':')[1]) / 60
-                if departure_hour < 6.0:  # Very early departure
-                    traffic_factor = 0.90
-                elif departure_hour < 7.0:  # Early departure
-                    traffic_factor = 0.95
-                elif departure_hour > 8.0:  # Late departure  
-                    traffic_factor = 1.10
-                else:
-                    traffic_factor = 1.0
-            except:
+            departure_hour = parse_departure_hour(departure_time)
+            if departure_hour is None:
+                traffic_factor = 1.0
+            elif departure_hour < 6.0:  # Very early departure
+                traffic_factor = 0.90
+            elif departure_hour < 7.0:  # Early departure
+                traffic_factor = 0.95
+            elif departure_hour > 8.0:  # Late departure  
+                traffic_factor = 1.10
+            else:
                 traffic_factor = 1.0
             
             # Apply traffic factor to travel times only
@@ -584,7 +646,6 @@ def calculate_loading_wait_time(contractor_configs, target_loading_location, arr
     """
     # Load Excel data for real loading times
     try:
-        import pandas as pd
         from departure_optimizer import load_time_data, RouteTimeLookup
         df = load_time_data('Time_Data.xlsx')
         lookup = RouteTimeLookup(df)
@@ -611,10 +672,7 @@ def calculate_loading_wait_time(contractor_configs, target_loading_location, arr
             num_trucks = config.get('number_of_trucks', 0)
             
             # Parse departure time
-            try:
-                departure_hour = float(departure_time_str.split(':')[0]) + float(departure_time_str.split(':')[1]) / 60
-            except (ValueError, IndexError):
-                departure_hour = 7.0
+            departure_hour = parse_departure_hour(departure_time_str, default=7.0)
             
             # Get REAL loading data from Excel
             row = lookup.get_row(parking_location, loading_location, dumping_location) if lookup else None
@@ -669,27 +727,54 @@ def calculate_loading_wait_time(contractor_configs, target_loading_location, arr
     return total_wait / trucks_processed if trucks_processed > 0 else 0.0
 
 
+# Route -> row-position index for the most recently used Time-Data frame
+_route_index_cache: Dict[int, Tuple[weakref.ref, Dict, Dict]] = {}
+
+def _get_route_row_index(excel_df: pd.DataFrame) -> Tuple[Dict, Dict]:
+    """
+    Build (or reuse) lookup tables from normalised route keys to row positions.
+
+    Returns:
+        tuple: (exact, partial) - ``exact`` is keyed by
+        (contractor, parking, loading, dumping), ``partial`` by (parking, loading).
+        Both map to the position of the first matching row.
+    """
+    cached = _route_index_cache.get(id(excel_df))
+    if cached is not None and cached[0]() is excel_df:
+        return cached[1], cached[2]
+    
+    key_columns = ['Contractor', 'Parking Origin', 'Loading Origin', 'Dumping Destination']
+    normalised = [excel_df[col].str.strip().str.upper() for col in key_columns]
+    exact = {}
+    partial = {}
+    for pos, (contractor, parking, loading, dumping) in enumerate(zip(*normalised)):
+        if pd.notna(parking) and pd.notna(loading):
+            partial.setdefault((parking, loading), pos)
+            if pd.notna(contractor) and pd.notna(dumping):
+                exact.setdefault((contractor, parking, loading, dumping), pos)
+    
+    _route_index_cache.clear()
+    _route_index_cache[id(excel_df)] = (weakref.ref(excel_df), exact, partial)
+    return exact, partial
+
 def get_real_route_times(excel_df, contractor, parking, loading, dumping, empty_speed=40, loaded_speed=30):
-    """Extract real times from Excel data and adjust for current speed settings"""
+    """Extract real times from Excel data and adjust for current speed settings.
+
+    If ``excel_df`` is None the shared frame from :func:`get_time_data` is used.
+    """
     try:
-        import pandas as pd
+        if excel_df is None:
+            excel_df = get_time_data()
         # Find matching row in Excel data
-        matching_rows = excel_df[
-            (excel_df['Contractor'].str.strip().str.upper() == contractor.upper()) &
-            (excel_df['Parking Origin'].str.strip().str.upper() == parking.upper()) &
-            (excel_df['Loading Origin'].str.strip().str.upper() == loading.upper()) &
-            (excel_df['Dumping Destination'].str.strip().str.upper() == dumping.upper())
-        ]
+        exact_index, partial_index = _get_route_row_index(excel_df)
+        row_pos = exact_index.get((contractor.upper(), parking.upper(), loading.upper(), dumping.upper()))
         
-        if matching_rows.empty:
+        if row_pos is None:
             # Try partial matches for flexibility
-            matching_rows = excel_df[
-                (excel_df['Parking Origin'].str.strip().str.upper() == parking.upper()) &
-                (excel_df['Loading Origin'].str.strip().str.upper() == loading.upper())
-            ]
+            row_pos = partial_index.get((parking.upper(), loading.upper()))
         
-        if not matching_rows.empty:
-            row = matching_rows.iloc[0]
+        if row_pos is not None:
+            row = excel_df.iloc[row_pos]
             
             # Extract Excel times and clean NaN values
             def clean_time(value):
@@ -725,7 +810,7 @@ def get_real_route_times(excel_df, contractor, parking, loading, dumping, empty_
             }
         
     except Exception as e:
-        print(f"Error extracting real times for {contractor}-{parking}: {e}")
+        logger.debug(f"get_real_route_times: error extracting real times for {contractor}-{parking}: {e}")
     
     return None
 
@@ -747,13 +832,15 @@ def generate_timeline_data(contractor_configs, loaded_speed, empty_speed):
     
     # Load REAL Excel data directly
     try:
-        import pandas as pd
-        excel_df = pd.read_excel('Time_Data.xlsx', sheet_name='Time-Data')
-        print(f"✅ Loaded {len(excel_df)} real operational records for timeline")
+        excel_df = get_time_data()
+        logger.debug(f"generate_timeline_data: loaded {len(excel_df)} real operational records")
     except Exception as e:
-        print(f"❌ Error loading Excel data: {e}")
+        logger.warning(f"generate_timeline_data: error loading Excel data: {e}")
         return pd.DataFrame(), pd.DataFrame()
     
+    real_count = 0
+    fallback_count = 0
+    
     for contractor, locations in contractor_configs.items():
         for parking_location, config in locations.items():
             if not isinstance(config, dict):
@@ -768,10 +855,7 @@ def generate_timeline_data(contractor_configs, loaded_speed, empty_speed):
                 continue
             
             # Parse departure time
-            try:
-                departure_hour = float(departure_time_str.split(':')[0]) + float(departure_time_str.split(':')[1]) / 60
-            except (ValueError, IndexError):
-                departure_hour = 7.0
+            departure_hour = parse_departure_hour(departure_time_str, default=7.0)
             
             # Find matching row in Excel data for REAL times (RESPONSIVE to sidebar speeds)
             real_times = get_real_route_times(excel_df, contractor, parking_location, loading_location, dumping_location, empty_speed, loaded_speed)
@@ -784,7 +868,8 @@ def generate_timeline_data(contractor_configs, loaded_speed, empty_speed):
                 wait_time = real_times['waiting_dump']  # REAL waiting time from Excel
                 dumping_time = real_times['dumping_time']
                 travel_back = real_times['empty_travel']
-                print(f"✅ Using REAL data for {contractor}-{parking_location}: Travel={travel_to_dump:.2f}h, Wait={wait_time:.2f}h")
+                real_count += 1
+                logger.debug(f"Using REAL data for {contractor}-{parking_location}: Travel={travel_to_dump:.2f}h, Wait={wait_time:.2f}h")
             else:
                 # Fallback to calculated times with realistic ratios
                 travel_to_loading = calculate_travel_time(parking_location, loading_location, empty_speed)
@@ -793,7 +878,8 @@ def generate_timeline_data(contractor_configs, loaded_speed, empty_speed):
                 wait_time = min(0.5, travel_to_dump * 0.1)  # Max 30min, 10% of travel time (realistic ratio)
                 dumping_time = 0.25  # 15 minutes standard dumping time
                 travel_back = calculate_travel_time(dumping_location, parking_location, empty_speed)
-                print(f"⚠️ Using fallback for {contractor}-{parking_location}: Travel={travel_to_dump:.2f}h, Wait={wait_time:.2f}h")
+                fallback_count += 1
+                logger.debug(f"Using fallback for {contractor}-{parking_location}: Travel={travel_to_dump:.2f}h, Wait={wait_time:.2f}h")
             
             # Calculate timeline points using REAL data
             arrival_at_loading = departure_hour + travel_to_loading
@@ -829,37 +915,39 @@ def generate_timeline_data(contractor_configs, loaded_speed, empty_speed):
             
             timeline_data.append(timeline_entry)
     
+    logger.info(f"generate_timeline_data: {real_count} real, {fallback_count} fallback")
+    
     # Convert timeline data to DataFrames
-    gantt_rows = []
+    fleet_names = [f"{entry['contractor']}-{entry['parking_location']}" for entry in timeline_data]
     wait_rows = []
     
-    for entry in timeline_data:
-        fleet_name = f"{entry['contractor']}-{entry['parking_location']}"
-        timeline = entry['timeline']
+    # Each fleet's activities are back-to-back, so the Gantt bars are the
+    # intervals between consecutive timeline points
+    activities = ['Travel to Loader', 'Loading', 'Travel to Dumper', 'Waiting at Dump', 'Dumping', 'Return to Parking']
+    boundary_keys = ['departure', 'start_loading', 'finish_loading', 'arrival_at_dump',
+                     'start_dumping', 'finish_dumping', 'return_to_parking']
+    
+    if timeline_data:
+        boundaries = np.array([[entry['timeline'][key] for key in boundary_keys] for entry in timeline_data])
         
-        # Create Gantt chart rows for each activity
-        activities = [
-            ('Travel to Loader', timeline['departure'], timeline['arrival_at_loading']),
-            ('Loading', timeline['start_loading'], timeline['finish_loading']),
-            ('Travel to Dumper', timeline['finish_loading'], timeline['arrival_at_dump']),
-            ('Waiting at Dump', timeline['arrival_at_dump'], timeline['start_dumping']),
-            ('Dumping', timeline['start_dumping'], timeline['finish_dumping']),
-            ('Return to Parking', timeline['finish_dumping'], timeline['return_to_parking'])
-        ]
+        # Convert hours to datetime strings for Plotly
+        clock = np.char.add(np.char.add(np.char.zfill(boundaries.astype(np.int64).astype(str), 2), ':'),
+                            np.char.zfill((np.mod(boundaries, 1) * 60).astype(np.int64).astype(str), 2))
+        timestamps = np.char.add(np.char.add('2024-01-01 ', clock), ':00')
         
-        for activity, start_time, end_time in activities:
-            # Convert hours to datetime strings for Plotly
-            start_str = f"{int(start_time):02d}:{int((start_time % 1) * 60):02d}"
-            end_str = f"{int(end_time):02d}:{int((end_time % 1) * 60):02d}"
-            
-            gantt_rows.append({
-                'Fleet': fleet_name,
-                'Activity': activity,
-                'Start': f"2024-01-01 {start_str}:00",
-                'Finish': f"2024-01-01 {end_str}:00",
-                'Contractor': entry['contractor'],
-                'Trucks': entry['num_trucks']
-            })
+        gantt_df = pd.DataFrame({
+            'Fleet': np.repeat(fleet_names, len(activities)).tolist(),
+            'Activity': activities * len(timeline_data),
+            'Start': timestamps[:, :-1].ravel().tolist(),
+            'Finish': timestamps[:, 1:].ravel().tolist(),
+            'Contractor': np.repeat([entry['contractor'] for entry in timeline_data], len(activities)).tolist(),
+            'Trucks': np.repeat([entry['num_trucks'] for entry in timeline_data], len(activities)).tolist()
+        })
+    else:
+        gantt_df = pd.DataFrame()
+    
+    for fleet_name, entry in zip(fleet_names, timeline_data):
+        timeline = entry['timeline']
         
         # Create wait time analysis rows (only for dumping - loading wait tracking removed)
         # Add dumping wait events only
@@ -874,14 +962,23 @@ def generate_timeline_data(contractor_configs, loaded_speed, empty_speed):
                 'trucks': entry['num_trucks']
             })
     
-    # Create DataFrames
-    gantt_df = pd.DataFrame(gantt_rows)
     wait_df = pd.DataFrame(wait_rows)
     
     return gantt_df, wait_df
 
 def format_time_from_seconds(seconds):
-    """Convert seconds to HH:MM format"""
-    hours = int(seconds // 3600) % 24
-    minutes = int((seconds % 3600) // 60)
-    return f"{hours:02d}:{minutes:02d}" 
\ No newline at end of file
+    """
+    Convert seconds to HH:MM format.
+
+    Accepts a scalar or an array-like of seconds; array inputs are formatted
+    in one vectorised pass and returned as a NumPy array of strings.
+    """
+    if np.ndim(seconds) == 0:
+        hours = int(seconds // 3600) % 24
+        minutes = int((seconds % 3600) // 60)
+        return f"{hours:02d}:{minutes:02d}"
+    
+    seconds = np.asarray(seconds, dtype=float)
+    hours = (np.floor_divide(seconds, 3600).astype(np.int64) % 24).astype(str)
+    minutes = np.floor_divide(np.mod(seconds, 3600), 60).astype(np.int64).astype(str)
+    return np.char.add(np.char.add(np.char.zfill(hours, 2), ':'), np.char.zfill(minutes, 2)) 
\ No newline at end of file
@@ -6,22 +6,74 @@ File I/O operations, configuration management, and data validation.
 
 import pandas as pd
 import json
+import mmap
 import os
-import io
-import base64
+import re
 from typing import Dict, List, Tuple, Union, Optional
 import streamlit as st
 
 from config import (
-    DEFAULT_TRUCK_CONFIG, DATA_PATHS, VALIDATION_RULES,
-    LOCATIONS
+    DATA_PATHS, VALIDATION_RULES,
+    LOCATIONS, FENI_SITES, CONTRACTOR_TRUCK_COUNTS, DEFAULT_CONTRACTOR_TRUCK_COUNT,
+    get_all_feni_dump_options, get_default_truck_config
 )
+from departure_optimizer import EXCEL_READ_ENGINE, TIME_DATA_SHEET, load_time_data
 
-# Required for Excel export
+# Fast C JSON encoder for config files; stdlib json is used when unavailable
 try:
-    import openpyxl
+    import orjson
 except ImportError:
-    openpyxl = None
+    orjson = None
+
+@st.cache_data(show_spinner=False)
+def _read_excel_cached(path: str, mtime: float) -> pd.DataFrame:
+    """
+    Read the Time-Data sheet of an Excel workbook, parsing each file version only once.
+    
+    The workbook is read through ``departure_optimizer.load_time_data``, which
+    keeps the Parquet snapshot shared by every reader of the timing data.
+    
+    Args:
+        path: Path to the Excel file
+        mtime: File modification time, part of the cache key so edits are picked up
+        
+    Returns:
+        DataFrame with the Time-Data sheet of the workbook
+    """
+    df = load_time_data(path)
+    if df is None:
+        raise ValueError(f"cannot read the {TIME_DATA_SHEET} sheet of {path}")
+    return df
+
+def _read_excel(path: str) -> pd.DataFrame:
+    """Read an Excel workbook through the shared cache."""
+    return _read_excel_cached(path, os.path.getmtime(path))
+
+def _clean_text_column(series: pd.Series) -> pd.Series:
+    """Strip a text column in one pass; empty cells (and literal 'nan') become NaN."""
+    text = series.astype(str).str.strip()
+    return text.mask(series.isna() | (text == 'nan'))
+
+# Text columns describing a route, cleaned once per Excel file version
+ROUTE_TEXT_COLUMNS = ('Contractor', 'Loading Origin', 'Parking Origin', 'Dumping Destination')
+
+# Numeric travel-time columns (hours) read by the travel data extraction
+TRAVEL_TIME_COLUMNS = ('Travel Parking-Loading (h)', 'Loaded Travel (h)',
+                       'Empty Travel (h)', 'Waiting for dumping (h)')
+
+@st.cache_data(show_spinner=False)
+def _route_text_columns_cached(path: str, mtime: float) -> pd.DataFrame:
+    """Return the route text columns of an Excel file, stripped via _clean_text_column."""
+    df = _read_excel_cached(path, mtime)
+    return pd.DataFrame({
+        col: _clean_text_column(df[col]) for col in ROUTE_TEXT_COLUMNS if col in df.columns
+    }, index=df.index)
+
+def _format_departure_time(time_val) -> str:
+    """Format an Excel departure time (a datetime.time object) as HH:MM."""
+    if pd.notna(time_val) and hasattr(time_val, 'hour') and hasattr(time_val, 'minute'):
+        return f"{time_val.hour:02d}:{time_val.minute:02d}"
+    return '7:00'
 
 @st.cache_data
 def load_data(file) -> pd.DataFrame:
@@ -36,7 +88,7 @@ def load_data(file) -> pd.DataFrame:
     """
     try:
         if file.name.endswith('.xlsx'):
-            df = pd.read_excel(file)
+            df = pd.read_excel(file, engine=EXCEL_READ_ENGINE)
         elif file.name.endswith('.csv'):
             df = pd.read_csv(file)
         else:
@@ -55,33 +107,100 @@ def load_data(file) -> pd.DataFrame:
         st.error(f"Error loading data: {str(e)}")
         return pd.DataFrame()
 
+def _write_json_atomic(path: str, data: Dict) -> None:
+    """
+    Write a dictionary as indented, key-sorted JSON without risking a torn file.
+    
+    The JSON is written to a temporary file next to ``path`` and moved into
+    place with ``os.replace``, so readers see either the old or the new file.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(data, indent=2, sort_keys=True).encode('utf-8')
+    
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+# Below this size a plain read is cheaper than setting up a memory map
+MMAP_MIN_BYTES = 1024 * 1024
+
+def _read_json_file(path: str) -> Dict:
+    """
+    Parse a JSON file straight from its bytes, memory-mapping large files.
+    
+    Uses orjson when installed; both parsers raise ``json.JSONDecodeError``
+    (orjson's error subclasses it) on malformed input.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                raw = mapped[:]
+        else:
+            raw = f.read()
+    
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Validation results keyed by the canonical JSON of the validated config
+_VALIDATION_CACHE_SIZE = 64
+_validation_cache: Dict[bytes, Tuple[bool, Tuple[str, ...]]] = {}
+
+def _config_cache_key(config: Dict) -> Optional[bytes]:
+    """Serialize a config to key-sorted JSON bytes, or None if it is not JSON-serializable."""
+    try:
+        if orjson is not None:
+            return orjson.dumps(config, option=orjson.OPT_SORT_KEYS)
+        return json.dumps(config, sort_keys=True).encode('utf-8')
+    except (TypeError, ValueError):
+        return None
+
 def validate_truck_config(config: Dict) -> Tuple[bool, List[str]]:
     """
     Validate truck configuration against business rules.
     
+    Validation only depends on the config's contents, so results are
+    memoized by its canonical JSON; saving, reloading and displaying the
+    same config validates it once.
+    
     Args:
         config: Configuration dictionary to validate
         
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
-    errors = []
-    
     if not isinstance(config, dict):
-        errors.append("Configuration must be a dictionary")
-        return False, errors
+        return False, ["Configuration must be a dictionary"]
+    
+    key = _config_cache_key(config)
+    if key is None:
+        return _validate_truck_config(config)
+    
+    cached = _validation_cache.get(key)
+    if cached is None:
+        is_valid, errors = _validate_truck_config(config)
+        if len(_validation_cache) >= _VALIDATION_CACHE_SIZE:
+            # Drop the oldest entry (dicts keep insertion order)
+            del _validation_cache[next(iter(_validation_cache))]
+        cached = _validation_cache[key] = (is_valid, tuple(errors))
+    
+    return cached[0], list(cached[1])
 
-    # Get real locations from Excel data for validation
-    try:
-        real_locations = get_real_locations_from_excel()
-        valid_parking = real_locations['parking_locations']
-        valid_loading = real_locations['loading_locations'] 
-        valid_dumping = real_locations['dumping_locations']
-    except:
-        # Fallback to hardcoded rules if Excel data unavailable
-        valid_parking = VALIDATION_RULES['valid_parking_locations']
-        valid_loading = VALIDATION_RULES['valid_loading_locations']
-        valid_dumping = VALIDATION_RULES['valid_dumping_locations']
+def _validate_truck_config(config: Dict) -> Tuple[bool, List[str]]:
+    """Run the validation rules of validate_truck_config on a config dictionary."""
+    errors = []
+
+    # Valid FENI sub-points plus the backward compatible main FENI codes
+    valid_feni_options = frozenset(get_all_feni_dump_options()) | FENI_SITES
 
     for contractor, locations in config.items():
         if not isinstance(locations, dict):
@@ -106,9 +225,7 @@ def validate_truck_config(config: Dict) -> Tuple[bool, List[str]]:
 
             # Validate dumping location (must be valid FENI sub-points or backward compatible options)
             dumping_loc = settings.get('dumping_location')
-            from config import get_all_feni_dump_options
-            valid_feni_options = get_all_feni_dump_options() + ['FENI KM0', 'FENI KM15']  # Include backward compatibility
-            if dumping_loc not in valid_feni_options:
+            if not isinstance(dumping_loc, str) or dumping_loc not in valid_feni_options:
                 errors.append(f"Invalid dumping location '{dumping_loc}' for {contractor}-{parking_location}. Must be a valid FENI sub-point (e.g., 'FENI A (LINE 1-2)')")
             
             # Validate number of trucks
@@ -123,8 +240,15 @@ def validate_truck_config(config: Dict) -> Tuple[bool, List[str]]:
     
     return len(errors) == 0, errors
 
+# Plain H:MM / HH:MM, the form every stored departure time takes
+_PLAIN_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})')
+
 def validate_time_format(time_str: str) -> bool:
     """Validate time format (HH:MM)."""
+    match = _PLAIN_TIME_RE.fullmatch(time_str) if isinstance(time_str, str) else None
+    if match:
+        return int(match.group(1)) <= 23 and int(match.group(2)) <= 59
+    # Anything int() accepts per part (padding, signs, extra digits) stays valid
     try:
         parts = time_str.split(':')
         if len(parts) != 2:
@@ -157,8 +281,7 @@ def save_config(config: Dict) -> bool:
             return False
         
         # Save to file
-        with open(DATA_PATHS['config_file'], 'w') as f:
-            json.dump(config, f, indent=2, sort_keys=True)
+        _write_json_atomic(DATA_PATHS['config_file'], config)
         
         return True
         
@@ -174,34 +297,59 @@ def load_config() -> Dict:
         Configuration dictionary, or default config if file doesn't exist/is invalid
     """
     try:
-        if os.path.exists(DATA_PATHS['config_file']):
-            with open(DATA_PATHS['config_file'], 'r') as f:
-                config = json.load(f)
+        config_path = DATA_PATHS['config_file']
+        if os.path.exists(config_path):
+            # Parsing and validation only rerun when the file changes
+            config, errors = _load_config_cached(config_path, os.path.getmtime(config_path))
             
-            # Validate loaded configuration
-            is_valid, errors = validate_truck_config(config)
-            if not is_valid:
+            if errors:
                 st.error("⚠️ Configuration file format invalid - using defaults")
                 for error in errors[:3]:  # Show first 3 errors
                     st.error(f"• {error}")
-                return DEFAULT_TRUCK_CONFIG
+                return get_default_truck_config()
             
             return config
             
     except json.JSONDecodeError:
         st.error("⚠️ Configuration file corrupted: Invalid JSON format")
         st.error("🔄 Using default configuration. Please check your truck_config.json file.")
-        return DEFAULT_TRUCK_CONFIG
+        return get_default_truck_config()
         
     except Exception as e:
         st.error(f"❌ Error loading configuration: {str(e)}")
-        return DEFAULT_TRUCK_CONFIG
+        return get_default_truck_config()
     
     # No config file found
     st.info("ℹ️ No configuration file found. Using default settings.")
-    return DEFAULT_TRUCK_CONFIG
+    return get_default_truck_config()
 
-def export_schedule_to_excel(optimized_schedule: Dict, filename: str = "optimized_schedule.xlsx") -> Optional[str]:
+@st.cache_data(show_spinner=False)
+def _load_config_cached(config_path: str, mtime: float) -> Tuple[Dict, List[str]]:
+    """
+    Parse and validate the configuration file once per file version.
+    
+    Args:
+        config_path: Path to the JSON configuration file
+        mtime: File modification time, part of the cache key so saves are picked up
+        
+    Returns:
+        Tuple of (config, list_of_validation_errors)
+    """
+    config = _read_json_file(config_path)
+    
+    # Validate loaded configuration
+    is_valid, errors = validate_truck_config(config)
+    return config, errors
+
+# Schedule config keys written to the export, mapped to their column headers
+SCHEDULE_EXPORT_COLUMNS = {
+    'loading_location': 'Loading Location',
+    'dumping_location': 'Dumping Location',
+    'departure_time': 'Departure Time',
+    'number_of_trucks': 'Number of Trucks'
+}
+
+def export_schedule_to_excel(optimized_schedule: Dict, filename: str = "optimized_schedule.xlsx") -> Optional[bytes]:
     """
     Export optimized schedule to Excel format.
     
@@ -210,50 +358,54 @@ def export_schedule_to_excel(optimized_schedule: Dict, filename: str = "optimize
         filename: Output filename
         
     Returns:
-        Base64 encoded Excel file for download, or None if error
+        Excel file bytes, ready to pass to ``st.download_button`` as ``data``,
+        or None if error
     """
-    if not openpyxl:
+    # Imported here so app start-up does not pay for the Excel writer
+    try:
+        import io
+        import openpyxl
+    except ImportError:
         st.error("📥 openpyxl package required for Excel export. Install with: pip install openpyxl")
         return None
     
     try:
-        # Prepare data for Excel export
-        data = []
+        # Create Excel file in memory - write-only mode streams rows straight
+        # to the sheet XML instead of building an in-memory cell tree
+        workbook = openpyxl.Workbook(write_only=True)
+        
+        schedule_sheet = workbook.create_sheet('Optimized_Schedule')
+        schedule_sheet.append(['Contractor', 'Parking Location', *SCHEDULE_EXPORT_COLUMNS.values()])
+        
+        # Rows go straight from the schedule into the sheet; the summary
+        # totals are gathered on the same pass
+        contractors = set()
+        total_routes = 0
+        total_trucks = 0
         for contractor, locations in optimized_schedule.items():
             for parking_location, config in locations.items():
-                data.append({
-                    'Contractor': contractor,
-                    'Parking Location': parking_location,
-                    'Loading Location': config['loading_location'],
-                    'Dumping Location': config['dumping_location'],
-                    'Departure Time': config['departure_time'],
-                    'Number of Trucks': config['number_of_trucks']
-                })
-        
-        # Create DataFrame
-        df = pd.DataFrame(data)
-        
-        # Create Excel file in memory
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Optimized_Schedule', index=False)
-            
-            # Add a summary sheet
-            summary_data = {
-                'Total Contractors': len(set(row['Contractor'] for row in data)),
-                'Total Routes': len(data),
-                'Total Trucks': sum(row['Number of Trucks'] for row in data),
-                'Export Date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            summary_df = pd.DataFrame([summary_data])
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
+                schedule_sheet.append([contractor, parking_location,
+                                       *(config[key] for key in SCHEDULE_EXPORT_COLUMNS)])
+                contractors.add(contractor)
+                total_routes += 1
+                total_trucks += config['number_of_trucks']
+        
+        # Add a summary sheet
+        summary_data = {
+            'Total Contractors': len(contractors),
+            'Total Routes': total_routes,
+            'Total Trucks': total_trucks,
+            'Export Date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        
+        summary_sheet = workbook.create_sheet('Summary')
+        summary_sheet.append(list(summary_data.keys()))
+        summary_sheet.append(list(summary_data.values()))
         
-        # Encode as base64 for download
-        excel_data = output.getvalue()
-        b64 = base64.b64encode(excel_data).decode()
+        output = io.BytesIO()
+        workbook.save(output)
         
-        return b64
+        return output.getvalue()
         
     except Exception as e:
         st.error(f"Error exporting to Excel: {str(e)}")
@@ -277,7 +429,7 @@ def load_excel_data(filename=None) -> pd.DataFrame:
             return None
         
         # Read Excel file - preserve original column names
-        df = pd.read_excel(file_path)
+        df = _read_excel(file_path)
         
         return df
         
@@ -285,6 +437,7 @@ def load_excel_data(filename=None) -> pd.DataFrame:
         st.error(f"❌ Error loading data file: {str(e)}")
         return None
 
+@st.cache_data(show_spinner=False)
 def extract_contractor_data_from_excel(df: pd.DataFrame) -> Dict:
     """
     Extract contractor configurations from real Excel data.
@@ -294,11 +447,13 @@ def extract_contractor_data_from_excel(df: pd.DataFrame) -> Dict:
         df: DataFrame with Excel data
         
     Returns:
-        Dictionary with contractor configurations for FENI sites only
+        Dictionary with contractor configurations for FENI sites only, or an
+        empty dictionary when the sheet cannot be parsed (callers fall back
+        to ``load_config()`` outside this cache so config edits are seen)
     """
     if df is None or df.empty:
         st.warning("⚠️ No Excel data available - using default configuration")
-        return DEFAULT_TRUCK_CONFIG
+        return get_default_truck_config()
     
     try:
         # Parse the Excel data to extract real configurations
@@ -320,57 +475,40 @@ def extract_contractor_data_from_excel(df: pd.DataFrame) -> Dict:
         if missing_cols:
             st.error(f"❌ Missing required columns: {missing_cols}")
             st.error(f"Available columns: {list(df.columns)}")
-            return load_config()
-        
-        # Parse each row - FILTER FOR FENI SITES ONLY
-        for _, row in df.iterrows():
-            contractor = str(row[contractor_col]).strip()
-            loading_loc = str(row[loading_col]).strip()
-            parking_loc = str(row[parking_col]).strip() if parking_col in df.columns else loading_loc
-            dumping_loc = str(row[dumping_col]).strip()
-            
-            # 🎯 CRITICAL FILTER: Only include FENI KM0 and FENI KM15
-            if dumping_loc not in ['FENI KM0', 'FENI KM15']:
-                continue  # Skip all non-FENI routes
-            
-            # Handle time departure (it's a datetime.time object)
-            if time_col in df.columns:
-                time_val = row[time_col]
-                if hasattr(time_val, 'hour') and hasattr(time_val, 'minute'):
-                    time_str = f"{time_val.hour:02d}:{time_val.minute:02d}"
-                else:
-                    time_str = '7:00'
-            else:
-                time_str = '7:00'
-            
-            # Skip empty rows
-            if contractor == 'nan' or loading_loc == 'nan' or dumping_loc == 'nan':
-                continue
-            
+            return {}
+        
+        # Clean the key columns once for the whole sheet
+        contractors = _clean_text_column(df[contractor_col])
+        loading_locs = _clean_text_column(df[loading_col])
+        dumping_locs = _clean_text_column(df[dumping_col])
+        
+        # Use parking location as the key (or loading if parking not available)
+        if parking_col in df.columns:
+            route_keys = _clean_text_column(df[parking_col]).fillna(loading_locs)
+        else:
+            route_keys = loading_locs
+        
+        # 🎯 CRITICAL FILTER: Only include FENI KM0 and FENI KM15, skipping empty rows
+        keep = dumping_locs.isin(FENI_SITES) & contractors.notna() & loading_locs.notna()
+        
+        # Handle time departure (it's a datetime.time object)
+        if time_col in df.columns:
+            time_strs = df.loc[keep, time_col].map(_format_departure_time)
+        else:
+            time_strs = pd.Series('7:00', index=df.index[keep])
+        
+        # Smart truck allocation based on contractor size
+        truck_counts = (contractors[keep].map(CONTRACTOR_TRUCK_COUNTS)
+                        .fillna(DEFAULT_CONTRACTOR_TRUCK_COUNT).astype(int))
+        
+        # Build configurations from the filtered rows - FENI SITES ONLY
+        for contractor, route_key, loading_loc, dumping_loc, time_str, truck_count in zip(
+            contractors[keep], route_keys[keep], loading_locs[keep], dumping_locs[keep], time_strs, truck_counts
+        ):
             # Initialize contractor if not exists
             if contractor not in contractor_configs:
                 contractor_configs[contractor] = {}
             
-            # Use parking location as the key (or loading if parking not available)
-            route_key = parking_loc if parking_loc != 'nan' else loading_loc
-            
-            # Extract truck count from Excel or use smart defaults based on contractor size
-            truck_count = 25  # Base default
-            
-            # Smart truck allocation based on contractor and route type
-            if contractor == 'RIM':
-                truck_count = 30  # Major contractor
-            elif contractor == 'GMG':
-                truck_count = 25  # Medium contractor  
-            elif contractor == 'CKB':
-                truck_count = 20  # Smaller contractor
-            elif contractor == 'SSS':
-                truck_count = 35  # Large contractor with multiple routes
-            elif contractor == 'PPP':
-                truck_count = 15  # Smaller contractor
-            elif contractor == 'HJS':
-                truck_count = 20  # Medium contractor
-            
             # Add route configuration (ONLY FOR FENI SITES) with realistic truck counts
             contractor_configs[contractor][route_key] = {
                 'loading_location': loading_loc,
@@ -386,7 +524,7 @@ def extract_contractor_data_from_excel(df: pd.DataFrame) -> Dict:
         
     except Exception as e:
         st.error(f"Error extracting contractor data: {str(e)}")
-        return load_config()
+        return {}
 
 def get_real_locations_from_excel() -> Dict[str, List[str]]:
     """
@@ -397,54 +535,50 @@ def get_real_locations_from_excel() -> Dict[str, List[str]]:
         Dictionary with lists of real locations for FENI sites only
     """
     try:
-        df = pd.read_excel(DATA_PATHS['excel_data'])
-        
-        # Extract locations from the actual column names - FILTER FOR FENI ONLY
-        loading_locations = set()
-        parking_locations = set()
-        dumping_locations = {'FENI KM0', 'FENI KM15'}  # Only FENI sites
-        
-        # Known contractors (these should NOT be in location lists)
-        known_contractors = {'RIM', 'GMG', 'CKB', 'SSS', 'PPP', 'HJS'}
-        
-        # Extract from specific columns using actual names - FILTER FOR FENI ROUTES
-        for _, row in df.iterrows():
-            dumping_dest = str(row.get('Dumping Destination', '')).strip()
-            
-            # 🎯 ONLY process rows going to FENI sites
-            if dumping_dest not in ['FENI KM0', 'FENI KM15']:
-                continue
-            
-            # Extract loading and parking locations for FENI routes only
-            if 'Loading Origin' in df.columns:
-                loading_loc = str(row['Loading Origin']).strip()
-                if loading_loc not in known_contractors and loading_loc != 'nan':
-                    loading_locations.add(loading_loc)
-            
-            if 'Parking Origin' in df.columns:
-                parking_loc = str(row['Parking Origin']).strip()
-                if parking_loc not in known_contractors and parking_loc != 'nan':
-                    parking_locations.add(parking_loc)
-        
-        # Convert to sorted lists and clean up - now includes ALL FENI sub-points
-        from config import get_all_feni_dump_options
-        locations = {
-            'loading_locations': sorted(list(loading_locations)),
-            'parking_locations': sorted(list(parking_locations)),
-            'dumping_locations': get_all_feni_dump_options()  # All FENI sub-points available
-        }
-        
-        return locations
+        file_path = DATA_PATHS['excel_data']
+        return _get_real_locations_cached(file_path, os.path.getmtime(file_path))
         
     except Exception as e:
         # Return FENI-enhanced default locations
-        from config import get_all_feni_dump_options
         return {
             'loading_locations': ['TF', 'KR', 'BLB'],
             'parking_locations': ['TF', 'KR', 'BLB'],
             'dumping_locations': get_all_feni_dump_options()  # All FENI sub-points available
         }
 
+@st.cache_data(show_spinner=False)
+def _get_real_locations_cached(file_path: str, mtime: float) -> Dict[str, List[str]]:
+    """Build the FENI location lists for one version of the Excel file."""
+    # Extract locations from the actual column names - FILTER FOR FENI ONLY
+    loading_locations = set()
+    parking_locations = set()
+    dumping_locations = {'FENI KM0', 'FENI KM15'}  # Only FENI sites
+    
+    # Known contractors (these should NOT be in location lists)
+    known_contractors = {'RIM', 'GMG', 'CKB', 'SSS', 'PPP', 'HJS'}
+    
+    # Extract from specific columns using actual names - FILTER FOR FENI ROUTES
+    text = _route_text_columns_cached(file_path, mtime)
+    if 'Dumping Destination' in text.columns:
+        # 🎯 ONLY process rows going to FENI sites
+        feni_rows = text['Dumping Destination'].isin(FENI_SITES)
+        
+        # Extract loading and parking locations for FENI routes only
+        if 'Loading Origin' in text.columns:
+            loading_locations = set(text.loc[feni_rows, 'Loading Origin'].dropna().unique()) - known_contractors
+        
+        if 'Parking Origin' in text.columns:
+            parking_locations = set(text.loc[feni_rows, 'Parking Origin'].dropna().unique()) - known_contractors
+    
+    # Convert to sorted lists and clean up - now includes ALL FENI sub-points
+    locations = {
+        'loading_locations': sorted(list(loading_locations)),
+        'parking_locations': sorted(list(parking_locations)),
+        'dumping_locations': get_all_feni_dump_options()  # All FENI sub-points available
+    }
+    
+    return locations
+
 def create_backup_config(config: Dict, suffix: str = None) -> bool:
     """
     Create a backup of the current configuration.
@@ -463,8 +597,7 @@ def create_backup_config(config: Dict, suffix: str = None) -> bool:
             timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')
             backup_filename = f"truck_config_backup_{timestamp}.json"
         
-        with open(backup_filename, 'w') as f:
-            json.dump(config, f, indent=2, sort_keys=True)
+        _write_json_atomic(backup_filename, config)
         
         return True
         
@@ -554,13 +687,13 @@ def import_config_from_dict(config_dict: Dict) -> Dict:
                 return cleaned_config
             else:
                 st.error("❌ Could not auto-correct all configuration errors. Using defaults.")
-                return DEFAULT_TRUCK_CONFIG
+                return get_default_truck_config()
         
         return config_dict
         
     except Exception as e:
         st.error(f"Error importing configuration: {str(e)}")
-        return DEFAULT_TRUCK_CONFIG
+        return get_default_truck_config()
 
 def auto_fix_config(config: Dict) -> Dict:
     """
@@ -625,7 +758,7 @@ def auto_fix_config(config: Dict) -> Dict:
 def debug_excel_structure():
     """Debug function to examine the actual Excel data structure."""
     try:
-        df = pd.read_excel(DATA_PATHS['excel_data'])
+        df = _read_excel(DATA_PATHS['excel_data'])
         
         print("=== EXCEL DATA STRUCTURE DEBUG ===")
         print(f"Shape: {df.shape}")
@@ -654,94 +787,104 @@ def extract_real_travel_data_from_excel() -> Dict:
         Dictionary with real travel times, distances, and waiting times for FENI sites only
     """
     try:
-        df = pd.read_excel(DATA_PATHS['excel_data'])
+        file_path = DATA_PATHS['excel_data']
+        return _extract_real_travel_data_cached(file_path, os.path.getmtime(file_path))
         
-        if df.empty:
-            return {}
-        
-        # Extract real travel time data - FENI SITES ONLY
-        travel_data = {
-            'travel_times': {},
-            'distances': {},
-            'real_waiting_times': {},
-            'locations': {
-                'loading': [],
-                'parking': [],
-                'dumping': ['FENI KM0', 'FENI KM15']  # Only FENI sites
-            }
+    except Exception as e:
+        st.error(f"Error extracting real travel data: {str(e)}")
+        return {}
+
+@st.cache_data(show_spinner=False)
+def _extract_real_travel_data_cached(file_path: str, mtime: float) -> Dict:
+    """Build the FENI travel data for one version of the Excel file."""
+    df = _read_excel_cached(file_path, mtime)
+    
+    if df.empty:
+        return {}
+    
+    # Extract real travel time data - FENI SITES ONLY
+    travel_data = {
+        'travel_times': {},
+        'distances': {},
+        'real_waiting_times': {},
+        'locations': {
+            'loading': [],
+            'parking': [],
+            'dumping': ['FENI KM0', 'FENI KM15']  # Only FENI sites
+        }
+    }
+    
+    # Key columns come pre-cleaned - 🎯 CRITICAL FILTER: Only process valid FENI routes
+    text = _route_text_columns_cached(file_path, mtime)
+    loading_origins = text['Loading Origin']
+    parking_origins = text['Parking Origin']
+    dumping_dests = text['Dumping Destination']
+    keep = dumping_dests.isin(FENI_SITES) & loading_origins.notna() & parking_origins.notna()
+    loading_origins = loading_origins[keep]
+    parking_origins = parking_origins[keep]
+    dumping_dests = dumping_dests[keep]
+    
+    # Take only the travel-time columns for the kept rows in one slice and
+    # coerce them together - blank or non-numeric cells and missing columns become 0
+    times = (df.loc[keep, [col for col in TRAVEL_TIME_COLUMNS if col in df.columns]]
+             .apply(pd.to_numeric, errors='coerce')
+             .reindex(columns=list(TRAVEL_TIME_COLUMNS))
+             .fillna(0.0))
+    
+    parking_to_loading_times = times['Travel Parking-Loading (h)']
+    loaded_travel_times = times['Loaded Travel (h)']
+    empty_travel_times = times['Empty Travel (h)']
+    real_waiting_times = times['Waiting for dumping (h)']
+    
+    # Calculate distances from travel times (assuming average speed)
+    avg_speed = 25.0  # km/h average speed from Excel data analysis
+    
+    route_keys = parking_origins + '_' + loading_origins + '_' + dumping_dests
+    rows = zip(
+        route_keys, parking_origins, loading_origins, dumping_dests,
+        parking_to_loading_times, loaded_travel_times, empty_travel_times, real_waiting_times,
+        parking_to_loading_times + loaded_travel_times + empty_travel_times,
+        parking_to_loading_times * avg_speed, loaded_travel_times * avg_speed, empty_travel_times * avg_speed
+    )
+    
+    for (route_key, parking_origin, loading_origin, dumping_dest,
+         parking_to_loading_time, loaded_travel_time, empty_travel_time, real_waiting_time,
+         total_cycle, parking_to_loading_km, loaded_travel_km, empty_travel_km) in rows:
+        # Store travel times (convert hours to hours for consistency)
+        travel_data['travel_times'][route_key] = {
+            'parking_to_loading': parking_to_loading_time,
+            'loading_to_dumping': loaded_travel_time,
+            'dumping_to_parking': empty_travel_time,
+            'total_cycle': total_cycle
         }
         
-        # Process each row to extract travel time data - FILTER FOR FENI ONLY
-        for _, row in df.iterrows():
-            loading_origin = str(row['Loading Origin']).strip()
-            parking_origin = str(row['Parking Origin']).strip()
-            dumping_dest = str(row['Dumping Destination']).strip()
-            
-            # 🎯 CRITICAL FILTER: Only process FENI routes
-            if dumping_dest not in ['FENI KM0', 'FENI KM15']:
-                continue  # Skip all non-FENI routes
-            
-            # Skip invalid rows
-            if loading_origin == 'nan' or parking_origin == 'nan' or dumping_dest == 'nan':
-                continue
-            
-            # Extract real travel times from Excel columns
-            parking_to_loading_time = row.get('Travel Parking-Loading (h)', 0)
-            loaded_travel_time = row.get('Loaded Travel (h)', 0)
-            empty_travel_time = row.get('Empty Travel (h)', 0)
-            real_waiting_time = row.get('Waiting for dumping (h)', 0)
-            
-            # Validate and clean data - handle nan values
-            def clean_numeric_value(value):
-                """Clean numeric values, convert nan to 0"""
-                if value is None or str(value).lower() == 'nan' or not isinstance(value, (int, float)):
-                    return 0
-                return float(value)
-            
-            parking_to_loading_time = clean_numeric_value(parking_to_loading_time)
-            loaded_travel_time = clean_numeric_value(loaded_travel_time)
-            empty_travel_time = clean_numeric_value(empty_travel_time)
-            real_waiting_time = clean_numeric_value(real_waiting_time)
-            
-            # Store travel times (convert hours to hours for consistency)
-            route_key = f"{parking_origin}_{loading_origin}_{dumping_dest}"
-            
-            travel_data['travel_times'][route_key] = {
-                'parking_to_loading': parking_to_loading_time,
-                'loading_to_dumping': loaded_travel_time,
-                'dumping_to_parking': empty_travel_time,
-                'total_cycle': parking_to_loading_time + loaded_travel_time + empty_travel_time
-            }
-            
-            # Calculate distances from travel times (assuming average speed)
-            avg_speed = 25.0  # km/h average speed from Excel data analysis
-            
-            travel_data['distances'][f"{parking_origin}_{loading_origin}"] = parking_to_loading_time * avg_speed
-            travel_data['distances'][f"{loading_origin}_{dumping_dest}"] = loaded_travel_time * avg_speed
-            travel_data['distances'][f"{dumping_dest}_{parking_origin}"] = empty_travel_time * avg_speed
-            
-            # Store real waiting times (ONLY FOR FENI SITES)
-            travel_data['real_waiting_times'][route_key] = real_waiting_time
-            
-            # Add to location lists
-            if loading_origin not in travel_data['locations']['loading']:
-                travel_data['locations']['loading'].append(loading_origin)
-            if parking_origin not in travel_data['locations']['parking']:
-                travel_data['locations']['parking'].append(parking_origin)
-        
-        # Sort location lists
-        travel_data['locations']['loading'] = sorted(travel_data['locations']['loading'])
-        travel_data['locations']['parking'] = sorted(travel_data['locations']['parking'])
+        travel_data['distances'][f"{parking_origin}_{loading_origin}"] = parking_to_loading_km
+        travel_data['distances'][f"{loading_origin}_{dumping_dest}"] = loaded_travel_km
+        travel_data['distances'][f"{dumping_dest}_{parking_origin}"] = empty_travel_km
         
-        return travel_data
+        # Store real waiting times (ONLY FOR FENI SITES)
+        travel_data['real_waiting_times'][route_key] = real_waiting_time
+    
+    # Sorted location lists
+    travel_data['locations']['loading'] = sorted(loading_origins.unique())
+    travel_data['locations']['parking'] = sorted(parking_origins.unique())
+    
+    return travel_data
+
+def get_real_travel_time_matrix() -> Dict:
+    """Generate real travel time matrix from Excel data."""
+    try:
+        file_path = DATA_PATHS['excel_data']
+        return _get_real_travel_time_matrix_cached(file_path, os.path.getmtime(file_path))
         
     except Exception as e:
         st.error(f"Error extracting real travel data: {str(e)}")
         return {}
 
-def get_real_travel_time_matrix() -> Dict:
-    """Generate real travel time matrix from Excel data."""
-    travel_data = extract_real_travel_data_from_excel()
+@st.cache_data(show_spinner=False)
+def _get_real_travel_time_matrix_cached(file_path: str, mtime: float) -> Dict:
+    """Build the travel time matrix for one version of the Excel file."""
+    travel_data = _extract_real_travel_data_cached(file_path, mtime)
     
     if not travel_data:
         return {}
@@ -749,6 +892,16 @@ def get_real_travel_time_matrix() -> Dict:
     locations = travel_data['locations']
     matrix = {}
     
+    # Index every route segment once; the first route listing a segment wins
+    segment_times = {}
+    for route_key, times in travel_data['travel_times'].items():
+        parts = route_key.split('_')
+        if len(parts) >= 3:
+            parking, loading, dumping = parts[0], parts[1], parts[2]
+            segment_times.setdefault((parking, loading), times['parking_to_loading'])
+            segment_times.setdefault((loading, dumping), times['loading_to_dumping'])
+            segment_times.setdefault((dumping, parking), times['dumping_to_parking'])
+    
     # Create matrix for all location combinations
     all_locations = list(set(locations['loading'] + locations['parking'] + locations['dumping']))
     
@@ -758,30 +911,8 @@ def get_real_travel_time_matrix() -> Dict:
             if origin == destination:
                 matrix[origin][destination] = 0
             else:
-                # Look for direct route in travel data
-                found_time = None
-                for route_key, times in travel_data['travel_times'].items():
-                    parts = route_key.split('_')
-                    if len(parts) >= 3:
-                        parking, loading, dumping = parts[0], parts[1], parts[2]
-                        
-                        # Check for matching route segments
-                        if origin == parking and destination == loading:
-                            found_time = times['parking_to_loading']
-                            break
-                        elif origin == loading and destination == dumping:
-                            found_time = times['loading_to_dumping']
-                            break
-                        elif origin == dumping and destination == parking:
-                            found_time = times['dumping_to_parking']
-                            break
-                
-                # Use found time or estimate based on distance
-                if found_time is not None:
-                    matrix[origin][destination] = found_time
-                else:
-                    # Estimate travel time (fallback)
-                    matrix[origin][destination] = 1.5  # 1.5 hours default
+                # Use direct route time or estimate (fallback: 1.5 hours default)
+                matrix[origin][destination] = segment_times.get((origin, destination), 1.5)
     
     return matrix 
 
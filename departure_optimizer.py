@@ -53,17 +53,34 @@ imported by the Streamlit app to power the new optimisation tab.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+import functools
+import heapq
+import importlib.util
+import operator
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
 import os
 import logging
 
+from _queue_kernel import batch_simulate_queue, simulate_queue
+from config import FENI_DUMP_POINTS, get_main_feni_from_sub_point
+from core_calculations import parse_departure_hour
+from queue_simulation import simulate_subpoint_queues
+
 # Reference speed used in the Excel data to convert travel times (hours)
 # into distances (kilometres).  Core calculations use this constant as
 # well.  If ``REFERENCE_SPEED`` changes in other parts of the code,
 # consider updating it here for consistency.
 REFERENCE_SPEED = 25.0  # km/h
 
+TIME_DATA_SHEET = "Time-Data"
+
+# Faster readers for the timing workbook, used when installed
+EXCEL_READ_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') else None
+PARQUET_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else None
+
 # Configure a logger for this module
 logger = logging.getLogger(__name__)
 if not logger.handlers:
@@ -71,24 +88,54 @@ if not logger.handlers:
     logger.addHandler(logging.NullHandler())
 
 
-def load_time_data(filepath: str = "Time_Data.xlsx") -> Optional[pd.DataFrame]:
+def load_time_data(filepath: str = "Time_Data.xlsx", columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
     """Load the mining time data from the provided Excel file.
 
     The optimiser reads the ``Time-Data`` sheet from the workbook.  If the
-    file cannot be read, ``None`` is returned.
+    file cannot be read, ``None`` is returned.  The sheet is parsed with
+    ``calamine`` when installed, and a Parquet snapshot of it
+    (``<filepath>.Time-Data.parquet``) is written with ``pyarrow`` and read
+    instead of the workbook while it is at least as new.
 
     Args:
         filepath: Path to the Excel file (defaults to ``Time_Data.xlsx``).
+        columns: Only return these columns (all of them when ``None``).
+            The snapshot always holds the whole sheet; only the columns
+            asked for are decoded from it.
 
     Returns:
         A pandas DataFrame with the timing data or ``None`` on failure.
     """
     if not os.path.exists(filepath):
         return None
+    snapshot_path = f"{filepath}.{TIME_DATA_SHEET}.parquet"
+    if (PARQUET_ENGINE is not None and os.path.exists(snapshot_path)
+            and os.path.getmtime(snapshot_path) >= os.path.getmtime(filepath)):
+        try:
+            return pd.read_parquet(snapshot_path, engine=PARQUET_ENGINE, columns=columns)
+        except Exception:
+            pass  # Unreadable snapshot - read the workbook and rewrite it
     try:
-        return pd.read_excel(filepath, sheet_name="Time-Data")
+        # Without a snapshot to write, skip converting the unused cells
+        usecols = columns if PARQUET_ENGINE is None else None
+        df = pd.read_excel(filepath, sheet_name=TIME_DATA_SHEET, engine=EXCEL_READ_ENGINE, usecols=usecols)
     except Exception:
         return None
+    if PARQUET_ENGINE is not None:
+        try:
+            df.to_parquet(snapshot_path, engine=PARQUET_ENGINE, compression='snappy')
+        except Exception:
+            # Mixed-type columns or a read-only directory - keep reading the workbook
+            try:
+                os.remove(snapshot_path)
+            except OSError:
+                pass  # No stale snapshot, or it cannot be removed either
+    if columns is None:
+        return df
+    try:
+        return df[columns]
+    except KeyError:
+        return None
 
 
 class RouteTimeLookup:
@@ -101,22 +148,36 @@ class RouteTimeLookup:
     used during lookup.
     """
 
+    # Timing columns read by compute_route_times
+    TIME_COLUMNS = (
+        'Travel Parking-Loading (h)', 'Waiting for loading (h)', 'Spoting-Loading',
+        'Loading (h)', 'Loaded Travel (h)', 'Dumping (h)', 'Dumping Spoting (h)',
+    )
+
     def __init__(self, df: Optional[pd.DataFrame]):
-        # internal mapping from (parking, loading, dump) to row index
+        # internal mapping from (parking, loading, dump) to row position
         self.lookup: Dict[Tuple[str, str, str], int] = {}
+        # TIME_COLUMNS as float arrays; blank or non-numeric cells are NaN
+        self.values: Dict[str, np.ndarray] = {}
+        # results of compute_route_times keyed by (route key, empty speed, loaded speed)
+        self._route_cache: Dict[Tuple[Tuple[str, str, str], float, float], Tuple[float, float]] = {}
         if df is None or df.empty:
             self.df = None
             return
         self.df = df.copy()
-        # normalise strings and build the mapping
-        for idx, row in self.df.iterrows():
-            try:
-                p = str(row['Parking Origin']).strip().upper()
-                l = str(row['Loading Origin']).strip().upper()
-                d = str(row['Dumping Destination']).strip().upper()
-                self.lookup[(p, l, d)] = idx
-            except Exception:
-                continue
+        # normalise strings and build the mapping; later rows win on duplicates
+        key_columns = ['Parking Origin', 'Loading Origin', 'Dumping Destination']
+        if all(col in self.df.columns for col in key_columns):
+            p, l, d = (self.df[col].astype(str).str.strip().str.upper() for col in key_columns)
+            self.lookup = dict(zip(zip(p, l, d), range(len(self.df))))
+        for col in self.TIME_COLUMNS:
+            if col in self.df.columns:
+                self.values[col] = pd.to_numeric(self.df[col], errors='coerce').to_numpy(dtype=np.float64)
+
+    @staticmethod
+    def route_key(parking: str, loading: str, dump: str) -> Tuple[str, str, str]:
+        """Normalise a route to the uppercase key used by the lookup."""
+        return (parking.strip().upper(), loading.strip().upper(), dump.strip().upper())
 
     def get_row(self, parking: str, loading: str, dump: str) -> Optional[pd.Series]:
         """Retrieve a matching row from the Excel data.
@@ -134,14 +195,25 @@ class RouteTimeLookup:
             A pandas Series containing the matching row or ``None`` if
             no exact match is found.
         """
-        if self.df is None:
-            return None
-        key = (parking.strip().upper(), loading.strip().upper(), dump.strip().upper())
-        idx = self.lookup.get(key)
+        idx = self.get_idx(parking, loading, dump)
         if idx is not None:
-            return self.df.loc[idx]
+            return self.df.iloc[idx]
         return None
 
+    def get_idx(self, parking: str, loading: str, dump: str) -> Optional[int]:
+        """Position of the matching row in :attr:`values`, or ``None`` if there is no match."""
+        if self.df is None:
+            return None
+        return self.lookup.get(self.route_key(parking, loading, dump))
+
+    def value(self, idx: int, column: str, default: Optional[float]) -> Optional[float]:
+        """The numeric cell ``column`` of row ``idx``, or ``default`` if it is blank or missing."""
+        values = self.values.get(column)
+        if values is None:
+            return default
+        value = values[idx]
+        return default if np.isnan(value) else float(value)
+
 
 def compute_route_times(
     parking: str,
@@ -174,8 +246,30 @@ def compute_route_times(
     Returns:
         A tuple ``(travel_time_hours, service_time_hours)``.
     """
+    if lookup:
+        # The optimiser asks for the same routes and speeds over and over;
+        # each combination is computed once per lookup
+        cache_key = (lookup.route_key(parking, loading, dump), empty_speed, loaded_speed)
+        cached = lookup._route_cache.get(cache_key)
+        if cached is None:
+            cached = lookup._route_cache[cache_key] = _compute_route_times(
+                parking, loading, dump, empty_speed, loaded_speed, lookup
+            )
+        return cached
+    return _compute_route_times(parking, loading, dump, empty_speed, loaded_speed, lookup)
+
+
+def _compute_route_times(
+    parking: str,
+    loading: str,
+    dump: str,
+    empty_speed: float,
+    loaded_speed: float,
+    lookup: Optional[RouteTimeLookup],
+) -> Tuple[float, float]:
+    """Uncached implementation of :func:`compute_route_times`."""
     # Attempt to get a matching row from the Excel data
-    row = lookup.get_row(parking, loading, dump) if lookup else None
+    idx = lookup.get_idx(parking, loading, dump) if lookup else None
     # Defaults used when no row is available
     # Default wait and service components are set to realistic values based
     # on the Excel data statistics.  If updated in the future, ensure
@@ -189,36 +283,28 @@ def compute_route_times(
     # Real data shows dumping plus spotting averages around 0.1 hours (6 minutes),
     # so the fallback is set accordingly.
     default_service_time = 0.10  # hours (6 minutes)
-    if row is not None:
-        try:
-            # Travel from parking to loading
-            t_parking_loading_h = row['Travel Parking-Loading (h)']
-            if pd.notna(t_parking_loading_h):
-                distance_pl = float(t_parking_loading_h) * REFERENCE_SPEED
-                travel_parking_loading = distance_pl / empty_speed
-            else:
-                travel_parking_loading = default_empty_travel_distance / empty_speed
-        except Exception:
+    if idx is not None:
+        # Travel from parking to loading
+        t_parking_loading_h = lookup.value(idx, 'Travel Parking-Loading (h)', None)
+        if t_parking_loading_h is not None:
+            distance_pl = t_parking_loading_h * REFERENCE_SPEED
+            travel_parking_loading = distance_pl / empty_speed
+        else:
             travel_parking_loading = default_empty_travel_distance / empty_speed
         # Waiting and spotting before loading
-        wait_loading = row.get('Waiting for loading (h)', default_wait_loading)
-        wait_loading = float(wait_loading) if pd.notna(wait_loading) else default_wait_loading
-        spot_loading = row.get('Spoting-Loading', default_spot_loading)
-        spot_loading = float(spot_loading) if pd.notna(spot_loading) else default_spot_loading
-        loading_time = row.get('Loading (h)', default_loading_time)
-        loading_time = float(loading_time) if pd.notna(loading_time) else default_loading_time
+        wait_loading = lookup.value(idx, 'Waiting for loading (h)', default_wait_loading)
+        spot_loading = lookup.value(idx, 'Spoting-Loading', default_spot_loading)
+        loading_time = lookup.value(idx, 'Loading (h)', default_loading_time)
         # Loaded travel from loading to dump
-        t_loaded_travel_h = row['Loaded Travel (h)']
-        if pd.notna(t_loaded_travel_h):
-            distance_ld = float(t_loaded_travel_h) * REFERENCE_SPEED
+        t_loaded_travel_h = lookup.value(idx, 'Loaded Travel (h)', None)
+        if t_loaded_travel_h is not None:
+            distance_ld = t_loaded_travel_h * REFERENCE_SPEED
             loaded_travel = distance_ld / loaded_speed
         else:
             loaded_travel = default_loaded_travel_distance / loaded_speed
         # Dump service time
-        dumping = row.get('Dumping (h)', default_service_time)
-        dumping = float(dumping) if pd.notna(dumping) else default_service_time
-        dump_spot = row.get('Dumping Spoting (h)', 0.0)
-        dump_spot = float(dump_spot) if pd.notna(dump_spot) else 0.0
+        dumping = lookup.value(idx, 'Dumping (h)', default_service_time)
+        dump_spot = lookup.value(idx, 'Dumping Spoting (h)', 0.0)
         service_time = dumping + dump_spot
     else:
         # Fallback: approximate travel using generic distances
@@ -264,12 +350,50 @@ def build_arrival_events(
         tuples.  ``detailed_events`` maps each sub‑point to a list of
         tuples ``(contractor, arrival_time, service_time, main_feni)``.
     """
-    from config import get_main_feni_from_sub_point
+    table = build_route_table(contractor_configs, empty_speed, loaded_speed, lookup)
+    return _expand_route_table(table, spacing)
 
-    events: Dict[str, List[Tuple[float, float]]] = {}
-    detailed_events: Dict[str, List[Tuple[str, float, float, str]]] = {}
+
+@dataclass(slots=True)
+class _RouteInfo:
+    """A configured route with everything the queue simulation needs."""
+    contractor: str
+    route: str
+    dump_location: str
+    main_feni: str
+    travel_time: float
+    service_time: float
+    num_trucks: int
+    # ``None`` when the configured departure time cannot be parsed
+    depart_hour: Optional[float]
+
+
+def build_route_table(
+    contractor_configs: Dict,
+    empty_speed: float,
+    loaded_speed: float,
+    lookup: RouteTimeLookup,
+) -> List[_RouteInfo]:
+    """Flatten the configuration into one record per simulated route.
+
+    Routes without a dump or loading location, without trucks, or whose
+    dump location is not a FENI point are left out, as are routes whose
+    travel times cannot be computed.  The records keep the configuration
+    order, and the optimiser can change ``depart_hour`` on a record to
+    test a candidate without rebuilding the table.
+
+    Args:
+        contractor_configs: The nested configuration dict.
+        empty_speed: Speed when trucks are empty (km/h).
+        loaded_speed: Speed when trucks are loaded (km/h).
+        lookup: Excel lookup helper (or ``None`` for defaults).
+
+    Returns:
+        A list of :class:`_RouteInfo` records.
+    """
+    table: List[_RouteInfo] = []
     if not contractor_configs:
-        return events, detailed_events
+        return table
     for contractor, routes in contractor_configs.items():
         for parking_location, cfg in routes.items():
             try:
@@ -284,8 +408,7 @@ def build_arrival_events(
                 if main_feni is None:
                     continue
                 # Parse departure time into fractional hours
-                parts = departure_time_str.split(':')
-                depart_hour = int(parts[0]) + int(parts[1]) / 60.0 if len(parts) == 2 else 7.0
+                depart_hour = parse_departure_hour(departure_time_str)
                 # Compute travel and service times for this route
                 travel_time, service_time = compute_route_times(
                     parking_location,
@@ -295,22 +418,52 @@ def build_arrival_events(
                     loaded_speed,
                     lookup
                 )
-                # Prepare lists
-                if dump_location not in events:
-                    events[dump_location] = []
-                if dump_location not in detailed_events:
-                    detailed_events[dump_location] = []
-                # Generate arrival events for each truck
-                for i in range(num_trucks):
-                    arrival_time = depart_hour + travel_time + i * spacing
-                    events[dump_location].append((arrival_time, service_time))
-                    detailed_events[dump_location].append((contractor, arrival_time, service_time, main_feni))
             except Exception:
                 continue
+            table.append(_RouteInfo(
+                contractor, parking_location, dump_location, main_feni,
+                travel_time, service_time, num_trucks, depart_hour
+            ))
+    return table
+
+
+def _expand_route_table(
+    table: List[_RouteInfo],
+    spacing: float,
+    with_details: bool = True,
+) -> Tuple[Dict[str, List[Tuple[float, float]]], Dict[str, List[Tuple[str, float, float, str]]]]:
+    """Generate the per‑truck arrival events of a route table.
+
+    Returns ``(events, detailed_events)`` as described in
+    :func:`build_arrival_events`; ``detailed_events`` stays empty when
+    ``with_details`` is false.
+    """
+    events: Dict[str, List[Tuple[float, float]]] = {}
+    detailed_events: Dict[str, List[Tuple[str, float, float, str]]] = {}
+    for info in table:
+        if info.depart_hour is None:
+            continue
+        dump_location = info.dump_location
+        # Prepare lists
+        sub_events = events.setdefault(dump_location, [])
+        if with_details:
+            sub_details = detailed_events.setdefault(dump_location, [])
+        try:
+            truck_range = range(info.num_trucks)
+        except TypeError:
+            continue
+        first_arrival = info.depart_hour + info.travel_time
+        # Generate arrival events for each truck
+        for i in truck_range:
+            arrival_time = first_arrival + i * spacing
+            sub_events.append((arrival_time, info.service_time))
+            if with_details:
+                sub_details.append((info.contractor, arrival_time, info.service_time, info.main_feni))
     # Sort events by arrival time for each sub‑point
     for key in events:
         events[key].sort(key=lambda x: x[0])
-        detailed_events[key].sort(key=lambda x: x[1])
+        if with_details:
+            detailed_events[key].sort(key=lambda x: x[1])
     return events, detailed_events
 
 
@@ -330,11 +483,48 @@ def simulate_queues(events: Dict[str, List[Tuple[float, float]]]) -> Dict[str, f
         A dictionary mapping the sub‑point to the average waiting time
         (in minutes) per truck.
     """
-    # Lazy import to avoid circular dependencies
-    from queue_simulation import simulate_subpoint_queues
     return simulate_subpoint_queues(events)
 
 
+def _queue_total_wait(arrival_times: np.ndarray, service_times: np.ndarray, servers: int) -> float:
+    """Total waiting time (hours) of trucks served first‑come first‑served.
+
+    ``arrival_times`` must be sorted.  Each truck is assigned to the
+    earliest free of ``servers`` parallel lines, all free at time zero.
+
+    Args:
+        arrival_times: Arrival time of each truck (hours).
+        service_times: Service time of each truck (hours).
+        servers: Number of parallel service lines.
+
+    Returns:
+        The waiting time summed over all trucks, in hours.
+    """
+    if len(arrival_times) <= servers and arrival_times[0] >= 0.0:
+        # Every truck finds an idle line
+        return 0.0
+    if servers == 1:
+        # With one line a truck starts at max(arrival, previous finish).
+        # Unrolled, start_i = busy_i + max(0, max_{j<=i}(arrival_j - busy_j))
+        # where busy_i is the service time of all trucks ahead of it.
+        busy = np.concatenate(([0.0], np.cumsum(service_times[:-1])))
+        starts = busy + np.maximum.accumulate(np.maximum(arrival_times - busy, 0.0))
+        return float((starts - arrival_times).sum())
+    if simulate_queue is not None:
+        # Compiled kernel (numba installed)
+        return float(simulate_queue(arrival_times, service_times, servers))
+    # Min-heap of (free_time, server) so the earliest-free server is found in O(log servers)
+    free_heap = [(0.0, i) for i in range(servers)]
+    total_wait = 0.0
+    for arrival_time, service_time in zip(arrival_times.tolist(), service_times.tolist()):
+        # assign to earliest-free server
+        free_time, idx = free_heap[0]
+        start = arrival_time if arrival_time >= free_time else free_time
+        total_wait += (start - arrival_time)
+        heapq.heapreplace(free_heap, (start + service_time, idx))
+    return total_wait
+
+
 def simulate_wait_times(
     contractor_configs: Dict,
     empty_speed: float,
@@ -363,50 +553,100 @@ def simulate_wait_times(
         ``detailed_events`` maps each sub‑point to a list of
         ``(contractor, arrival_time, service_time, main_feni)`` tuples.
     """
-    from config import get_main_feni_from_sub_point
+    table = build_route_table(contractor_configs, empty_speed, loaded_speed, lookup)
+    zone_waits = simulate_from_table(table, _trucks_per_subpoint(contractor_configs), spacing)
+    _, detailed = _expand_route_table(table, spacing)
+    return zone_waits, detailed
 
-    events, detailed = build_arrival_events(
-        contractor_configs,
-        empty_speed,
-        loaded_speed,
-        lookup,
-        spacing
-    )
-    # Multi-server queue simulation per sub-point (treats KM zones as 1 area)
-    from config import FENI_DUMP_POINTS, get_main_feni_from_sub_point
-
-    def _num_servers_for(sub_point: str) -> int:
-        main = get_main_feni_from_sub_point(sub_point)
-        if not main or main not in FENI_DUMP_POINTS:
-            return 1
-        cfg = FENI_DUMP_POINTS[main]
-        # exact sub-point: parse "lo-hi"
-        if sub_point in cfg['sub_points']:
-            lo, hi = map(int, cfg['sub_points'][sub_point]['lines'].split('-'))
-            return max(1, hi - lo + 1)
-        # aggregated zone: sum lines of all sub-points
-        total = 0
-        for sp_cfg in cfg['sub_points'].values():
-            lo, hi = map(int, sp_cfg['lines'].split('-'))
-            total += max(1, hi - lo + 1)
-        return max(1, total)
-
-    subpoint_waits: Dict[str, float] = {}
-    for subpoint, arrivals in events.items():
-        servers = _num_servers_for(subpoint)
-        free_times = [0.0] * servers
-        total_wait = 0.0
-        if not arrivals:
-            subpoint_waits[subpoint] = 0.0
+
+def simulate_from_table(
+    table: List[_RouteInfo],
+    trucks_per_subpoint: Dict[str, int],
+    spacing: float = 0.02,
+    zone_filter: Optional[str] = None,
+) -> Dict[str, float]:
+    """Average waiting time per main FENI zone for a prebuilt route table.
+
+    This is the fused path used by the optimiser: arrivals are generated
+    straight into per‑sub‑point NumPy arrays, each queue is simulated and
+    the waits are accumulated per zone, without building per‑truck event
+    tuples or re‑reading the configuration.
+
+    Args:
+        table: Records from :func:`build_route_table`.
+        trucks_per_subpoint: Truck counts per dump location of the whole
+            configuration (see :func:`_trucks_per_subpoint`).
+        spacing: Time between consecutive trucks from the same parking.
+        zone_filter: If given, only routes dumping in this main FENI zone
+            are simulated; the other zone is reported as ``0.0``.
+
+    Returns:
+        Average waiting times (minutes) keyed by main FENI zone.
+    """
+    if zone_filter is not None:
+        table = [info for info in table if info.main_feni == zone_filter]
+    return _zone_waits(_subpoint_arrays(table, spacing), trucks_per_subpoint)
+
+
+def _subpoint_arrays(
+    table: List[_RouteInfo],
+    spacing: float,
+) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """Arrival and service time arrays per sub‑point, sorted by arrival.
+
+    Produces the same arrivals, in the same order, as the events of
+    :func:`_expand_route_table`.
+    """
+    groups: Dict[str, List[Tuple[_RouteInfo, int]]] = {}
+    for info in table:
+        if info.depart_hour is None:
             continue
-        for arrival_time, service_time in arrivals:
-            # assign to earliest-free server
-            idx = min(range(servers), key=lambda i: free_times[i])
-            start = max(arrival_time, free_times[idx])
-            total_wait += (start - arrival_time)
-            free_times[idx] = start + service_time
-        subpoint_waits[subpoint] = (total_wait / len(arrivals)) * 60.0
-    # Compute number of trucks per sub‑point
+        group = groups.setdefault(info.dump_location, [])
+        try:
+            group.append((info, operator.index(info.num_trucks)))
+        except TypeError:
+            continue
+    arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    for dump_location, group in groups.items():
+        # Size the arrays up front and write each route's trucks into its slice
+        total_trucks = sum(num_trucks for _, num_trucks in group)
+        arrival_times = np.empty(total_trucks)
+        service_times = np.empty(total_trucks)
+        offset = 0
+        for info, num_trucks in group:
+            end = offset + num_trucks
+            arrival_times[offset:end] = (info.depart_hour + info.travel_time) + np.arange(num_trucks) * spacing
+            service_times[offset:end] = info.service_time
+            offset = end
+        if len(group) > 1 or spacing < 0:
+            # Each route is already an ascending run (spacing >= 0), which
+            # the stable sort (timsort) merges rather than fully re-sorting
+            order = np.argsort(arrival_times, kind='stable')
+            arrival_times, service_times = arrival_times[order], service_times[order]
+        arrays[dump_location] = (arrival_times, service_times)
+    return arrays
+
+
+def _queue_total_waits(arrival_times: np.ndarray, service_times: np.ndarray, servers: int) -> np.ndarray:
+    """Row‑wise :func:`_queue_total_wait` for ``(queues, trucks)`` arrays."""
+    if servers == 1:
+        # Same closed form as _queue_total_wait, along each row
+        busy = np.concatenate(
+            (np.zeros((len(service_times), 1)), np.cumsum(service_times[:, :-1], axis=1)), axis=1
+        )
+        starts = busy + np.maximum.accumulate(np.maximum(arrival_times - busy, 0.0), axis=1)
+        return (starts - arrival_times).sum(axis=1)
+    if batch_simulate_queue is not None:
+        # Compiled kernel looping over the rows (numba installed)
+        return batch_simulate_queue(arrival_times, service_times, servers)
+    return np.array([
+        _queue_total_wait(row_arrivals, row_services, servers)
+        for row_arrivals, row_services in zip(arrival_times, service_times)
+    ])
+
+
+def _trucks_per_subpoint(contractor_configs: Dict) -> Dict[str, int]:
+    """Count the configured trucks per dump location, including unsimulated routes."""
     trucks_per_subpoint: Dict[str, int] = {}
     for contractor, routes in contractor_configs.items():
         for parking_location, cfg in routes.items():
@@ -415,7 +655,54 @@ def simulate_wait_times(
             if not dump_location:
                 continue
             trucks_per_subpoint[dump_location] = trucks_per_subpoint.get(dump_location, 0) + num_trucks
-    # Aggregate to main FENI zones
+    return trucks_per_subpoint
+
+
+@functools.lru_cache(maxsize=None)
+def _num_servers_for(sub_point: str) -> int:
+    """Number of dump lines serving a sub‑point (all lines of a zone for aggregated names)."""
+    main = get_main_feni_from_sub_point(sub_point)
+    if not main or main not in FENI_DUMP_POINTS:
+        return 1
+    cfg = FENI_DUMP_POINTS[main]
+    # exact sub-point: parse "lo-hi"
+    if sub_point in cfg['sub_points']:
+        lo, hi = map(int, cfg['sub_points'][sub_point]['lines'].split('-'))
+        return max(1, hi - lo + 1)
+    # aggregated zone: sum lines of all sub-points
+    total = 0
+    for sp_cfg in cfg['sub_points'].values():
+        lo, hi = map(int, sp_cfg['lines'].split('-'))
+        total += max(1, hi - lo + 1)
+    return max(1, total)
+
+
+def _zone_waits(
+    arrays: Dict[str, Tuple[np.ndarray, np.ndarray]],
+    trucks_per_subpoint: Dict[str, int],
+) -> Dict[str, float]:
+    """Simulate each sub‑point's queue and weight the waits up to the main FENI zones."""
+    # Multi-server queue simulation per sub-point (treats KM zones as 1 area)
+    subpoint_waits: Dict[str, float] = {
+        subpoint: _subpoint_wait(subpoint, arrival_times, service_times)
+        for subpoint, (arrival_times, service_times) in arrays.items()
+    }
+    return _aggregate_zone_waits(subpoint_waits, trucks_per_subpoint)
+
+
+def _subpoint_wait(subpoint: str, arrival_times: np.ndarray, service_times: np.ndarray) -> float:
+    """Average waiting time (minutes) of one sub‑point's queue."""
+    if not len(arrival_times):
+        return 0.0
+    total_wait = _queue_total_wait(arrival_times, service_times, _num_servers_for(subpoint))
+    return (total_wait / len(arrival_times)) * 60.0
+
+
+def _aggregate_zone_waits(
+    subpoint_waits: Dict[str, float],
+    trucks_per_subpoint: Dict[str, int],
+) -> Dict[str, float]:
+    """Weight the sub‑point average waits up to the main FENI zones."""
     zone_wait_totals: Dict[str, float] = {'FENI KM 0': 0.0, 'FENI KM 15': 0.0}
     zone_truck_totals: Dict[str, int] = {'FENI KM 0': 0, 'FENI KM 15': 0}
     for subpoint, avg_wait in subpoint_waits.items():
@@ -431,11 +718,165 @@ def simulate_wait_times(
             zone_waits[zone] = zone_wait_totals[zone] / zone_truck_totals[zone]
         else:
             zone_waits[zone] = 0.0
-    # Log computed wait times per zone for debugging
-    logger.debug(
-        f"simulate_wait_times: zone_waits={zone_waits}, subpoint_waits={subpoint_waits}, trucks_per_subpoint={trucks_per_subpoint}"
-    )
-    return zone_waits, detailed
+    # Log computed wait times per zone for debugging (formatting skipped
+    # unless enabled, as this runs for every candidate)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"simulate_wait_times: zone_waits={zone_waits}, subpoint_waits={subpoint_waits}, trucks_per_subpoint={trucks_per_subpoint}"
+        )
+    return zone_waits
+
+
+class _RouteCandidates:
+    """Zone waiting time of one route's zone as its departure hour changes.
+
+    Moving a route only changes the arrivals at its own sub‑point.  The
+    other sub‑points of the zone are simulated once, and the arrivals of
+    the other routes at the route's sub‑point are kept as one sorted
+    array; each candidate then only merges the route's own trucks into
+    that array with ``np.searchsorted`` and re‑runs that single queue.
+    The merged queue is the one :func:`_subpoint_arrays` would build, so
+    the result equals re‑simulating the zone from the table.  Results are
+    memoised per departure hour, so candidates that parse to the same
+    hour (``"7:00"``/``"07:00"``, or anything that is not ``H:MM``) are
+    simulated once.
+    """
+
+    def __init__(
+        self,
+        table: List[_RouteInfo],
+        info: _RouteInfo,
+        trucks_per_subpoint: Dict[str, int],
+        spacing: float,
+    ):
+        self.info = info
+        self.trucks_per_subpoint = trucks_per_subpoint
+        self.spacing = spacing
+        self.zone_table = [r for r in table if r.main_feni == info.main_feni]
+        # Sub-point order and waits as seen with the route departing at
+        # some valid time; the route's own sub-point is filled per candidate
+        original_hour = info.depart_hour
+        info.depart_hour = 0.0
+        try:
+            arrays = _subpoint_arrays(self.zone_table, spacing)
+        finally:
+            info.depart_hour = original_hour
+        self.subpoint_waits: Dict[str, float] = {
+            subpoint: (0.0 if subpoint == info.dump_location else _subpoint_wait(subpoint, *arrays[subpoint]))
+            for subpoint in arrays
+        }
+        # Trucks of the other routes at the route's sub-point, flagged if
+        # their route comes before this one in the configuration
+        arrival_blocks, service_blocks, before_blocks = [], [], []
+        is_before = True
+        for r in self.zone_table:
+            if r is info:
+                is_before = False
+                continue
+            if r.dump_location != info.dump_location or r.depart_hour is None:
+                continue
+            try:
+                num_trucks = operator.index(r.num_trucks)
+            except TypeError:
+                continue
+            arrival_blocks.append((r.depart_hour + r.travel_time) + np.arange(num_trucks) * spacing)
+            service_blocks.append(np.full(num_trucks, r.service_time))
+            before_blocks.append(np.full(num_trucks, is_before))
+        if arrival_blocks:
+            self.arrival_times = np.concatenate(arrival_blocks)
+            self.service_times = np.concatenate(service_blocks)
+            before = np.concatenate(before_blocks)
+            if len(arrival_blocks) > 1 or spacing < 0:
+                order = np.argsort(self.arrival_times, kind='stable')
+                self.arrival_times = self.arrival_times[order]
+                self.service_times = self.service_times[order]
+                before = before[order]
+        else:
+            self.arrival_times = self.service_times = np.empty(0)
+            before = np.empty(0, dtype=bool)
+        # before_counts[k] = trucks among the first k that belong to earlier routes
+        self.before_counts = np.concatenate(([0], np.cumsum(before)))
+        try:
+            self.offsets: Optional[np.ndarray] = np.arange(operator.index(info.num_trucks)) * spacing
+        except TypeError:
+            self.offsets = None
+        self._cache: Dict[Optional[float], float] = {}
+
+    def zone_wait(self, depart_hour: Optional[float]) -> float:
+        """Average waiting time (minutes) of the route's zone for ``depart_hour``."""
+        if depart_hour not in self._cache:
+            self._cache[depart_hour] = self._zone_wait(depart_hour)
+        return self._cache[depart_hour]
+
+    def zone_waits(self, depart_hours: List[Optional[float]]) -> List[float]:
+        """:meth:`zone_wait` for many departure hours, simulated as one batch."""
+        pending = list(dict.fromkeys(
+            h for h in depart_hours if h is not None and h not in self._cache
+        ))
+        if len(pending) > 1 and self.offsets is not None and len(self.offsets):
+            arrival_times, service_times = self._merged_batch(pending)
+            servers = _num_servers_for(self.info.dump_location)
+            totals = _queue_total_waits(arrival_times, service_times, servers)
+            subpoint_waits = (totals / arrival_times.shape[1]) * 60.0
+            for depart_hour, subpoint_wait in zip(pending, subpoint_waits.tolist()):
+                self._cache[depart_hour] = self._zone_wait_with(subpoint_wait)
+        return [self.zone_wait(h) for h in depart_hours]
+
+    def _merged_batch(self, depart_hours: List[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """Merged arrival and service times of the route's sub‑point, one row per departure hour."""
+        info = self.info
+        base_arrivals = self.arrival_times
+        num_base, num_route = len(base_arrivals), len(self.offsets)
+        rows = np.arange(len(depart_hours))[:, None]
+        route_arrivals = np.sort(
+            (np.array(depart_hours, dtype=np.float64) + info.travel_time)[:, None] + self.offsets, axis=1
+        )
+        left = np.searchsorted(base_arrivals, route_arrivals, side='left')
+        right = np.searchsorted(base_arrivals, route_arrivals, side='right')
+        # Insert positions as in _zone_wait, then the final column of every
+        # truck: route trucks shift by the route trucks ahead of them, base
+        # trucks by the route trucks inserted at or before their position
+        positions = left + (self.before_counts[right] - self.before_counts[left])
+        route_columns = positions + np.arange(num_route)
+        stride = num_base + 1
+        inserted_before = np.searchsorted(
+            (positions + rows * stride).ravel(),
+            (np.arange(num_base) + rows * stride).ravel(),
+            side='right',
+        ).reshape(len(depart_hours), num_base) - rows * num_route
+        base_columns = np.arange(num_base) + inserted_before
+        shape = (len(depart_hours), num_base + num_route)
+        arrival_times = np.empty(shape)
+        arrival_times[rows, route_columns] = route_arrivals
+        arrival_times[rows, base_columns] = base_arrivals
+        service_times = np.empty(shape)
+        service_times[rows, route_columns] = info.service_time
+        service_times[rows, base_columns] = self.service_times
+        return arrival_times, service_times
+
+    def _zone_wait_with(self, subpoint_wait: float) -> float:
+        """Zone average once the route's sub‑point has ``subpoint_wait``."""
+        subpoint_waits = dict(self.subpoint_waits)
+        subpoint_waits[self.info.dump_location] = subpoint_wait
+        return _aggregate_zone_waits(subpoint_waits, self.trucks_per_subpoint)[self.info.main_feni]
+
+    def _zone_wait(self, depart_hour: Optional[float]) -> float:
+        info = self.info
+        if depart_hour is None:
+            # The route drops out of the simulation, which can also change
+            # which sub-points are registered
+            others = [r for r in self.zone_table if r is not info]
+            return simulate_from_table(others, self.trucks_per_subpoint, self.spacing)[info.main_feni]
+        arrival_times, service_times = self.arrival_times, self.service_times
+        if self.offsets is not None:
+            route_arrivals = np.sort((depart_hour + info.travel_time) + self.offsets)
+            left = np.searchsorted(arrival_times, route_arrivals, side='left')
+            right = np.searchsorted(arrival_times, route_arrivals, side='right')
+            # On equal arrivals the trucks of earlier routes go first
+            positions = left + (self.before_counts[right] - self.before_counts[left])
+            arrival_times = np.insert(arrival_times, positions, route_arrivals)
+            service_times = np.insert(service_times, positions, info.service_time)
+        return self._zone_wait_with(_subpoint_wait(info.dump_location, arrival_times, service_times))
 
 
 def evaluate_departure_for_route(
@@ -448,13 +889,15 @@ def evaluate_departure_for_route(
     lookup: RouteTimeLookup,
     baseline_configs: Optional[Dict] = None,
     spacing: float = 0.02,
+    zone_truck_totals: Optional[Dict[str, int]] = None,
 ) -> Tuple[float, Dict[str, float]]:
     """Evaluate total waiting time for a single route at a new departure time.
 
-    The function temporarily modifies a copy of the configuration for
-    the specified route and simulates the queueing system.  It returns
-    the total waiting time across all trucks (summed over both dump
-    zones) as well as the per‑zone averages.
+    The route's departure time is overridden in a shallow copy of the
+    configuration (see :func:`_clone_with_override`), so the caller's
+    configuration is never modified and concurrent evaluations do not
+    interfere.  It returns the total waiting time across all trucks
+    (summed over both dump zones) as well as the per‑zone averages.
 
     Args:
         contractor_configs: Base configuration dictionary.
@@ -466,8 +909,11 @@ def evaluate_departure_for_route(
         lookup: Excel lookup helper.
         baseline_configs: If provided, this configuration is used for
             the rest of the fleet.  Otherwise ``contractor_configs`` is
-            copied and modified internally.
+            used.
         spacing: Spacing between trucks from the same parking location.
+        zone_truck_totals: Trucks per main FENI zone, as returned by
+            :func:`_zone_truck_totals`.  Departure changes do not affect
+            it, so callers testing many candidates can compute it once.
 
     Returns:
         A tuple ``(total_wait_minutes, per_zone_waits)`` where
@@ -475,35 +921,21 @@ def evaluate_departure_for_route(
         and KM15 (weighted by truck counts) and ``per_zone_waits`` is
         the dictionary returned by :func:`simulate_wait_times`.
     """
-    import copy
-    # Clone the configuration so we don't mutate the original
-    if baseline_configs is not None:
-        config = copy.deepcopy(baseline_configs)
-    else:
-        config = copy.deepcopy(contractor_configs)
-    # Modify only the targeted route
-    if contractor in config and route in config[contractor]:
-        config[contractor][route]['departure_time'] = candidate_time
+    config = baseline_configs if baseline_configs is not None else contractor_configs
+    # Override only the targeted route
+    test_config = _clone_with_override(config, contractor, route, candidate_time)
     # Simulate
     wait_times, _ = simulate_wait_times(
-        config,
+        test_config,
         empty_speed,
         loaded_speed,
         lookup,
         spacing
     )
     # Compute weighted total wait: average wait * total number of trucks
-    total_wait_minutes = 0.0
-    for zone in ['FENI KM 0', 'FENI KM 15']:
-        # Count trucks destined for this zone
-        trucks_zone = 0
-        for c, routes in config.items():
-            for r, cfg in routes.items():
-                from config import get_main_feni_from_sub_point
-                main_feni = get_main_feni_from_sub_point(cfg.get('dumping_location', ''))
-                if main_feni == zone:
-                    trucks_zone += cfg.get('number_of_trucks', 0)
-        total_wait_minutes += wait_times.get(zone, 0.0) * trucks_zone
+    if zone_truck_totals is None:
+        zone_truck_totals = _zone_truck_totals(config)
+    total_wait_minutes = _weighted_total_wait(wait_times, zone_truck_totals)
     # Debug logging
     logger.debug(
         f"evaluate_departure_for_route: contractor={contractor}, route={route}, candidate_time={candidate_time}, "
@@ -512,6 +944,86 @@ def evaluate_departure_for_route(
     return total_wait_minutes, wait_times
 
 
+def _clone_with_override(contractor_configs: Dict, contractor: str, route: str, departure_time: str) -> Dict:
+    """Copy of the configuration with one route's departure time replaced.
+
+    Only the contractor and route dicts on the path to the route are
+    copied; all other dicts are shared with ``contractor_configs``, which
+    is left unchanged.  The configuration is returned as is when the
+    route does not exist.
+    """
+    routes = contractor_configs.get(contractor, {})
+    if routes.get(route) is None:
+        return contractor_configs
+    return {
+        **contractor_configs,
+        contractor: {**routes, route: {**routes[route], 'departure_time': departure_time}},
+    }
+
+
+def _zone_truck_totals(contractor_configs: Dict) -> Dict[str, int]:
+    """Count the configured trucks destined for each main FENI zone."""
+    zone_truck_totals: Dict[str, int] = {'FENI KM 0': 0, 'FENI KM 15': 0}
+    for c, routes in contractor_configs.items():
+        for r, cfg in routes.items():
+            main_feni = get_main_feni_from_sub_point(cfg.get('dumping_location', ''))
+            if main_feni in zone_truck_totals:
+                zone_truck_totals[main_feni] += cfg.get('number_of_trucks', 0)
+    return zone_truck_totals
+
+
+def _weighted_total_wait(wait_times: Dict[str, float], zone_truck_totals: Dict[str, int]) -> float:
+    """Sum each zone's average wait weighted by the trucks configured for that zone."""
+    total_wait_minutes = 0.0
+    for zone in ['FENI KM 0', 'FENI KM 15']:
+        total_wait_minutes += wait_times.get(zone, 0.0) * zone_truck_totals[zone]
+    return total_wait_minutes
+
+
+def _best_departure(
+    table: List[_RouteInfo],
+    row: Optional[int],
+    current_depart: str,
+    candidate_times: List[str],
+    candidate_hours: List[Optional[float]],
+    baseline_waits: Dict[str, float],
+    trucks_per_subpoint: Dict[str, int],
+    zone_truck_totals: Dict[str, int],
+    spacing: float,
+) -> Tuple[str, float]:
+    """Best candidate departure for the route at ``table[row]`` and its total wait.
+
+    ``row`` is ``None`` for routes that are not simulated, and
+    ``candidate_hours`` holds each candidate parsed to hours (``None``
+    when it is not a time).  The route is passed by position so that the record stays part of ``table`` when
+    the arguments are sent to a worker process.
+    """
+    best_depart = current_depart
+    best_total_wait = float('inf')
+    info = table[row] if row is not None else None
+    route_candidates = (
+        _RouteCandidates(table, info, trucks_per_subpoint, spacing) if info is not None else None
+    )
+    
+    # Test each candidate time against the ORIGINAL configuration.
+    # Moving one route only changes the queues of its own zone, so
+    # only that zone is re-simulated (for all candidates at once); the
+    # other keeps its baseline wait.
+    if info is not None:
+        zone_waits = route_candidates.zone_waits(candidate_hours)
+    for i, candidate in enumerate(candidate_times):
+        if info is None:
+            # Route is not simulated, so the candidate cannot change anything
+            wait_times = baseline_waits
+        else:
+            wait_times = {**baseline_waits, info.main_feni: zone_waits[i]}
+        total_wait = _weighted_total_wait(wait_times, zone_truck_totals)
+        if total_wait < best_total_wait:
+            best_total_wait = total_wait
+            best_depart = candidate
+    return best_depart, best_total_wait
+
+
 def optimise_departure_times(
     contractor_configs: Dict,
     empty_speed: float,
@@ -546,63 +1058,57 @@ def optimise_departure_times(
         to average waiting times (minutes) before and after
         optimisation.
     """
-    import copy
+    # Flatten the configuration once; each candidate then only changes
+    # the departure hour of the route being tested
+    table = build_route_table(contractor_configs, empty_speed, loaded_speed, lookup)
+    table_rows = {(info.contractor, info.route): row for row, info in enumerate(table)}
+    trucks_per_subpoint = _trucks_per_subpoint(contractor_configs)
+    # Truck counts do not depend on departure times
+    zone_truck_totals = _zone_truck_totals(contractor_configs)
     # Compute baseline waiting times once
-    baseline_waits, _ = simulate_wait_times(
-        contractor_configs,
-        empty_speed,
-        loaded_speed,
-        lookup,
-        spacing
-    )
+    baseline_waits = simulate_from_table(table, trucks_per_subpoint, spacing)
+    # Parse the candidate grid once for all routes
+    candidate_hours: List[Optional[float]] = [parse_departure_hour(candidate) for candidate in candidate_times]
     recommended: Dict[str, Dict[str, Dict[str, str]]] = {}
     
     # FIXED APPROACH: Evaluate each route independently against the original configuration
     # This prevents sequential optimization from creating conflicts between routes
     
     # First pass: Find the best departure time for each route independently
-    for contractor, routes in contractor_configs.items():
-        if contractor not in recommended:
-            recommended[contractor] = {}
-        for route, cfg in routes.items():
-            current_depart = cfg.get('departure_time', '7:00')
-            best_depart = current_depart
-            best_total_wait = float('inf')
-            
-            # Test each candidate time against the ORIGINAL configuration
-            for candidate in candidate_times:
-                total_wait, _ = evaluate_departure_for_route(
-                    contractor_configs=contractor_configs,  # Use original config
-                    contractor=contractor,
-                    route=route,
-                    candidate_time=candidate,
-                    empty_speed=empty_speed,
-                    loaded_speed=loaded_speed,
-                    lookup=lookup,
-                    baseline_configs=contractor_configs,  # Use original config as baseline
-                    spacing=spacing
-                )
-                if total_wait < best_total_wait:
-                    best_total_wait = total_wait
-                    best_depart = candidate
-                    
-            # Record recommendation
-            recommended[contractor][route] = {
-                'current': current_depart,
-                'optimal': best_depart
-            }
-            # Log recommendation for debugging
-            logger.debug(
-                f"optimise_departure_times: contractor={contractor}, route={route}, current={current_depart}, optimal={best_depart}, "
-                f"best_total_wait={best_total_wait:.2f}"
-            )
+    routes_to_search = [
+        (contractor, route, cfg.get('departure_time', '7:00'))
+        for contractor, routes in contractor_configs.items()
+        for route, cfg in routes.items()
+    ]
+    search_args = [
+        (table, table_rows.get((contractor, route)), current_depart, candidate_times,
+         candidate_hours, baseline_waits, trucks_per_subpoint, zone_truck_totals, spacing)
+        for contractor, route, current_depart in routes_to_search
+    ]
+    results = [_best_departure(*args) for args in search_args]
+    for contractor in contractor_configs:
+        recommended[contractor] = {}
+    for (contractor, route, current_depart), (best_depart, best_total_wait) in zip(routes_to_search, results):
+        # Record recommendation
+        recommended[contractor][route] = {
+            'current': current_depart,
+            'optimal': best_depart
+        }
+        # Log recommendation for debugging
+        logger.debug(
+            f"optimise_departure_times: contractor={contractor}, route={route}, current={current_depart}, optimal={best_depart}, "
+            f"best_total_wait={best_total_wait:.2f}"
+        )
     
-    # Second pass: Apply all optimized times together
-    updated_config = copy.deepcopy(contractor_configs)
-    for contractor, routes in recommended.items():
-        for route, times in routes.items():
-            if contractor in updated_config and route in updated_config[contractor]:
-                updated_config[contractor][route]['departure_time'] = times['optimal']
+    # Second pass: Apply all optimized times together.  Only the route
+    # dicts are copied; the caller's configuration is left untouched.
+    updated_config = {
+        contractor: {
+            route: {**cfg, 'departure_time': recommended[contractor][route]['optimal']}
+            for route, cfg in routes.items()
+        }
+        for contractor, routes in contractor_configs.items()
+    }
     # Compute optimised waiting times with all recommended departures
     optimised_waits, _ = simulate_wait_times(
         updated_config,
@@ -5,6 +5,11 @@ Advanced analytics, insights, and research-based recommendations.
 Based on 2024-2025 research in autonomous haulage and fleet management.
 """
 
+from collections import Counter
+import functools
+import itertools
+import json
+import math
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Union, Optional
@@ -14,6 +19,44 @@ from config import (
     MINING_INTELLIGENCE, PERFORMANCE_THRESHOLDS, OPERATIONAL_HOURS,
     LOCATIONS
 )
+from core_calculations import parse_departure_hour
+
+# Arrivals this close together (15 minutes, in hours) are high-severity conflicts
+_HIGH_SEVERITY_HOURS = 15.0 / 60.0
+
+def _clamp(value, lo=None, hi=None):
+    """
+    Bound a score to ``[lo, hi]`` (either bound may be omitted).
+    
+    Equivalent to ``max(lo, min(hi, value))`` but cheaper than the two
+    builtin calls in the scoring code below.
+    """
+    if hi is not None and not value < hi:
+        value = hi
+    if lo is not None and not value > lo:
+        value = lo
+    return value
+
+def _summarize_wait_times(current_wait_times):
+    """
+    Average wait per route (minutes) and route count of a wait-time mapping.
+    
+    Shared by the analyses below, which all rate the fleet by this average.
+    
+    Args:
+        current_wait_times: Nested dictionary with wait times per contractor/route
+        
+    Returns:
+        Tuple of (avg_wait_minutes, route_count)
+    """
+    # Compensated sum of the route waits, converted to minutes once
+    total_wait_time = math.fsum(
+        data.get('waiting_time', 0) for routes in current_wait_times.values() for data in routes.values()
+    ) * 60
+    route_count = sum(len(routes) for routes in current_wait_times.values())
+    
+    avg_wait_minutes = total_wait_time / route_count if route_count > 0 else 0
+    return avg_wait_minutes, route_count
 
 def get_mining_intelligence_insights(contractor_configs, current_wait_times):
     """
@@ -58,7 +101,7 @@ def get_mining_intelligence_insights(contractor_configs, current_wait_times):
     # Calculate coordination efficiency based on research metrics
     if coordination_complexity > 0:
         wait_penalty = avg_wait_minutes / 60  # Convert back to hours for calculation
-        insights['coordination_efficiency'] = max(0, 1 - (wait_penalty / 0.5))  # 30 minutes max acceptable
+        insights['coordination_efficiency'] = _clamp(1 - (wait_penalty / 0.5), lo=0)  # 30 minutes max acceptable
     
     # Energy Optimization Analysis (from hybrid truck research)
     if avg_wait_minutes > 20:
@@ -77,7 +120,7 @@ def get_mining_intelligence_insights(contractor_configs, current_wait_times):
     if avg_wait_minutes > 15:
         base_readiness -= 15  # Long wait times problematic for autonomous systems
     
-    insights['autonomous_readiness'] = max(30, base_readiness)
+    insights['autonomous_readiness'] = _clamp(base_readiness, lo=30)
     
     # Research-based Recommendations
     if dump_site_conflicts > 3:
@@ -91,68 +134,127 @@ def get_mining_intelligence_insights(contractor_configs, current_wait_times):
     
     return insights
 
-def analyze_arrival_conflicts(contractor_configs):
-    """
-    Analyze potential arrival conflicts at dump sites using mining intelligence.
-    
-    Based on research showing that trucks arriving within 30 minutes of each other
-    create significant operational inefficiencies.
-    """
-    conflicts = []
+def _site_arrivals(contractor_configs):
+    """Arrival times (sorted array) and matching ``(contractor, parking)`` pairs per dump site."""
+    # Arrivals per dump site as parallel lists of times and plain tuples;
+    # labels are only formatted for the conflicts actually reported
     arrival_times = {'FENI km 0': [], 'FENI km 15': []}
+    arrival_sources = {'FENI km 0': [], 'FENI km 15': []}
     
     # Calculate arrival times for all trucks
     for contractor, locations in contractor_configs.items():
         for parking_location, config in locations.items():
             dumping_location = config['dumping_location']
-            departure_time = float(config['departure_time'].split(':')[0]) + float(config['departure_time'].split(':')[1])/60
+            departure_time = parse_departure_hour(config['departure_time'], default=7.0)
             
             # Simplified travel time calculation
             base_travel_time = 1.5  # hours - average travel time
             arrival_time = departure_time + base_travel_time
             
-            arrival_times[dumping_location].append({
-                'contractor': contractor,
-                'parking': parking_location,
-                'arrival_time': arrival_time,
-                'trucks': config['number_of_trucks']
-            })
+            arrival_times[dumping_location].append(arrival_time)
+            arrival_sources[dumping_location].append((contractor, parking_location))
+    
+    site_arrivals = {}
+    for dump_site, site_times in arrival_times.items():
+        order = np.argsort(site_times, kind='stable')
+        times = np.asarray(site_times, dtype=np.float64)[order]
+        site_arrivals[dump_site] = (times, [arrival_sources[dump_site][k] for k in order.tolist()])
+    return site_arrivals
+
+def _conflict_counts(times, window):
+    """Number of later arrivals inside the window of each sorted arrival."""
+    return _window_ends(times, window) - np.arange(len(times)) - 1
+
+def iter_arrival_conflicts(contractor_configs):
+    """
+    Yield the arrival conflicts of ``analyze_arrival_conflicts`` one at a time.
     
+    Consumers that stop early (or only count) avoid building the full list.
+    """
     # Detect conflicts (arrivals within 30-minute window)
     conflict_window = MINING_INTELLIGENCE['arrival_time_window'] / 60  # Convert to hours
     
-    for dump_site, arrivals in arrival_times.items():
-        for i, arrival1 in enumerate(arrivals):
-            for j, arrival2 in enumerate(arrivals[i+1:], i+1):
-                time_diff = abs(arrival1['arrival_time'] - arrival2['arrival_time'])
-                if time_diff <= conflict_window:
-                    conflicts.append({
-                        'dump_site': dump_site,
-                        'contractor1': f"{arrival1['contractor']}_{arrival1['parking']}",
-                        'contractor2': f"{arrival2['contractor']}_{arrival2['parking']}",
-                        'time_difference': time_diff * 60,  # Convert back to minutes
-                        'severity': 'High' if time_diff <= 0.25 else 'Medium'  # 15-minute threshold
-                    })
-    
-    return conflicts
+    # Sweep line: once sorted, each arrival only conflicts with the run of
+    # later arrivals inside the window, found with np.searchsorted
+    for dump_site, (times, sources) in _site_arrivals(contractor_configs).items():
+        pair_counts = _conflict_counts(times, conflict_window)
+        # Expand every arrival i into its pairs (i, i+1), ..., (i, ends[i]-1)
+        first = np.repeat(np.arange(len(times)), pair_counts)
+        pair_starts = np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+        second = first + 1 + (np.arange(len(first)) - pair_starts)
+        time_diffs = times[second] - times[first]
+        high = (time_diffs <= _HIGH_SEVERITY_HOURS).tolist()
+        for i, j, time_diff, is_high in zip(first.tolist(), second.tolist(), time_diffs.tolist(), high):
+            yield {
+                'dump_site': dump_site,
+                'contractor1': '_'.join(sources[i]),
+                'contractor2': '_'.join(sources[j]),
+                'time_difference_hours': time_diff,
+                'severity': 'High' if is_high else 'Medium'
+            }
 
-def generate_research_recommendations(contractor_configs, current_wait_times, conflicts):
-    """Generate research-based recommendations for autonomous haulage optimization."""
-    recommendations = []
+def analyze_arrival_conflicts(contractor_configs, limit=None):
+    """
+    Analyze potential arrival conflicts at dump sites using mining intelligence.
     
-    # Extract total wait time from nested structure
-    total_wait_time = 0
-    route_count = 0
+    Based on research showing that trucks arriving within 30 minutes of each other
+    create significant operational inefficiencies.
     
-    for contractor, routes in current_wait_times.items():
-        for route, data in routes.items():
-            total_wait_time += data.get('waiting_time', 0) * 60  # Convert to minutes
-            route_count += 1
+    Args:
+        contractor_configs: Current contractor configurations
+        limit: Stop after this many conflicts (all conflicts when None)
+    """
+    return list(itertools.islice(iter_arrival_conflicts(contractor_configs), limit))
+
+def has_more_conflicts_than(contractor_configs, threshold):
+    """Whether there are more than ``threshold`` arrival conflicts, without building them."""
+    conflict_window = MINING_INTELLIGENCE['arrival_time_window'] / 60  # Convert to hours
+    conflict_count = 0
+    for times, _ in _site_arrivals(contractor_configs).values():
+        conflict_count += int(_conflict_counts(times, conflict_window).sum())
+        if conflict_count > threshold:
+            return True
+    return False
+
+def _window_ends(times, window):
+    """For sorted ``times``, the index after the last ``j`` with ``times[j] - times[i] <= window``."""
+    positions = np.arange(len(times))
+    ends = np.searchsorted(times, times + window, side='right')
+    # times + window can round across a boundary; settle the ends on the
+    # differences themselves (at most a step either way)
+    while True:
+        extend = ends < len(times)
+        extend[extend] = times[ends[extend]] - times[extend] <= window
+        if not extend.any():
+            break
+        ends += extend
+    while True:
+        shrink = ends > positions + 1
+        shrink[shrink] = times[ends[shrink] - 1] - times[shrink] > window
+        if not shrink.any():
+            break
+        ends -= shrink
+    return ends
+
+def generate_research_recommendations(contractor_configs, current_wait_times, conflicts=None):
+    """
+    Generate research-based recommendations for autonomous haulage optimization.
     
-    avg_wait_minutes = total_wait_time / route_count if route_count > 0 else 0
+    ``conflicts`` may be a list or the iterator of ``iter_arrival_conflicts``;
+    only as many as the threshold needs are consumed.  When omitted they are
+    counted from ``contractor_configs`` without being built.
+    """
+    recommendations = []
+    
+    # Average wait time from nested structure (see _summarize_wait_times)
+    avg_wait_minutes, _ = _summarize_wait_times(current_wait_times)
     
     # Recommendation 1: Autonomous Coordination (2024 research)
-    if len(conflicts) > 5:
+    if conflicts is None:
+        many_conflicts = has_more_conflicts_than(contractor_configs, 5)
+    else:
+        many_conflicts = sum(1 for _ in itertools.islice(conflicts, 6)) > 5
+    if many_conflicts:
         recommendations.append({
             'title': '🤖 Deploy Autonomous Fleet Coordination',
             'description': 'Implement decentralized multi-agent system for real-time route optimization',
@@ -184,7 +286,7 @@ def generate_research_recommendations(contractor_configs, current_wait_times, co
         recommendations.append({
             'title': '🧠 Q-Learning Route Optimization',
             'description': 'Adaptive learning system that improves decisions over time',
-            'impact': f'Potential {min(30, avg_wait * 1.5):.0f}% reduction in wait times',
+            'impact': f'Potential {_clamp(avg_wait * 1.5, hi=30):.0f}% reduction in wait times',
             'research_basis': 'MIT - Reinforcement Learning in Mining Operations 2024'
         })
     
@@ -193,16 +295,8 @@ def generate_research_recommendations(contractor_configs, current_wait_times, co
 def calculate_mining_kpis(contractor_configs, current_wait_times):
     """Calculate key performance indicators for mining operations."""
     
-    # Extract metrics from nested structure
-    total_wait_time = 0
-    route_count = 0
-    
-    for contractor, routes in current_wait_times.items():
-        for route, data in routes.items():
-            total_wait_time += data.get('waiting_time', 0) * 60  # Convert to minutes
-            route_count += 1
-    
-    avg_wait_minutes = total_wait_time / route_count if route_count > 0 else 0
+    # Extract metrics from nested structure (see _summarize_wait_times)
+    avg_wait_minutes, _ = _summarize_wait_times(current_wait_times)
     
     # Calculate KPIs
     total_trucks = sum(
@@ -212,12 +306,12 @@ def calculate_mining_kpis(contractor_configs, current_wait_times):
     )
     
     kpis = {
-        'fleet_efficiency': max(0, 100 - (avg_wait_minutes * 2)),  # Efficiency score
+        'fleet_efficiency': _clamp(100 - (avg_wait_minutes * 2), lo=0),  # Efficiency score
         'average_wait_time': avg_wait_minutes,
         'total_fleet_size': total_trucks,
         'contractor_count': len(contractor_configs),
-        'utilization_rate': min(100, (8 / (avg_wait_minutes/60 + 2.5)) * 100) if avg_wait_minutes > 0 else 85,
-        'coordination_score': max(30, 100 - (len(contractor_configs) * 5))
+        'utilization_rate': _clamp((8 / (avg_wait_minutes/60 + 2.5)) * 100, hi=100) if avg_wait_minutes > 0 else 85,
+        'coordination_score': _clamp(100 - (len(contractor_configs) * 5), lo=30)
     }
     
     return kpis
@@ -226,16 +320,8 @@ def generate_operational_insights(contractor_configs, current_wait_times):
     """Generate operational insights based on current fleet status."""
     insights = []
     
-    # Extract wait times from nested structure
-    total_wait_time = 0
-    route_count = 0
-    
-    for contractor, routes in current_wait_times.items():
-        for route, data in routes.items():
-            total_wait_time += data.get('waiting_time', 0) * 60  # Convert to minutes
-            route_count += 1
-    
-    avg_wait_minutes = total_wait_time / route_count if route_count > 0 else 0
+    # Extract wait times from nested structure (see _summarize_wait_times)
+    avg_wait_minutes, _ = _summarize_wait_times(current_wait_times)
     
     # Insight 1: Peak Hour Analysis
     if avg_wait_minutes > 15:
@@ -262,8 +348,38 @@ def generate_operational_insights(contractor_configs, current_wait_times):
     
     return insights
 
+def _max_key(counts):
+    """Key with the largest count (the first one on ties), or None for an empty Counter."""
+    return counts.most_common(1)[0][0] if counts else None
+
+# Fleet analyses keyed by the JSON of the analysed config
+_FLEET_CACHE_SIZE = 64
+_fleet_cache = {}
+
 def analyze_fleet_intelligence(contractor_configs):
-    """Analyze fleet configuration using mining intelligence principles."""
+    """
+    Analyze fleet configuration using mining intelligence principles.
+    
+    The analysis only depends on the config's contents, so results are
+    memoized by its JSON; the returned dictionary is shared between callers
+    and must not be modified in place.
+    """
+    try:
+        # Key order matters (ties and dict order follow the config), so keys are not sorted
+        key = json.dumps(contractor_configs)
+    except (TypeError, ValueError):
+        return _analyze_fleet_intelligence(contractor_configs)
+    
+    cached = _fleet_cache.get(key)
+    if cached is None:
+        if len(_fleet_cache) >= _FLEET_CACHE_SIZE:
+            # Drop the oldest entry (dicts keep insertion order)
+            del _fleet_cache[next(iter(_fleet_cache))]
+        cached = _fleet_cache[key] = _analyze_fleet_intelligence(contractor_configs)
+    return cached
+
+def _analyze_fleet_intelligence(contractor_configs):
+    """Run the analyses of analyze_fleet_intelligence on a config dictionary."""
     
     intelligence = {
         'network_topology': {},
@@ -272,50 +388,45 @@ def analyze_fleet_intelligence(contractor_configs):
         'resilience_score': 0
     }
     
-    # Network Topology Analysis
-    unique_routes = set()
-    route_frequency = {}
+    # One pass over the fleet feeds the topology, bottleneck and
+    # scalability sections below
+    route_frequency = Counter()
+    dump_site_loads = Counter()
+    loading_site_loads = Counter()
+    total_trucks = 0
     
     for contractor, locations in contractor_configs.items():
         for parking_location, config in locations.items():
-            route = f"{parking_location}->{config['loading_location']}->{config['dumping_location']}"
-            unique_routes.add(route)
-            route_frequency[route] = route_frequency.get(route, 0) + config['number_of_trucks']
-    
-    intelligence['network_topology'] = {
-        'unique_routes': len(unique_routes),
-        'route_diversity': len(unique_routes) / max(1, len(contractor_configs)),
-        'most_used_route': max(route_frequency, key=route_frequency.get) if route_frequency else None,
-        'route_distribution': route_frequency
-    }
-    
-    # Bottleneck Analysis
-    dump_site_loads = {}
-    loading_site_loads = {}
-    
-    for locations in contractor_configs.values():
-        for config in locations.values():
             dump_site = config['dumping_location']
             loading_site = config['loading_location']
             trucks = config['number_of_trucks']
             
-            dump_site_loads[dump_site] = dump_site_loads.get(dump_site, 0) + trucks
-            loading_site_loads[loading_site] = loading_site_loads.get(loading_site, 0) + trucks
+            # Tuple keys; routes are only joined into labels for the report
+            route_frequency[(parking_location, loading_site, dump_site)] += trucks
+            dump_site_loads[dump_site] += trucks
+            loading_site_loads[loading_site] += trucks
+            total_trucks += trucks
+    
+    unique_routes = len(route_frequency)
+    most_used_route = _max_key(route_frequency)
+    
+    # Network Topology Analysis
+    intelligence['network_topology'] = {
+        'unique_routes': unique_routes,
+        'route_diversity': unique_routes / max(1, len(contractor_configs)),
+        'most_used_route': '->'.join(most_used_route) if most_used_route else None,
+        'route_distribution': {'->'.join(route): trucks for route, trucks in route_frequency.items()}
+    }
     
+    # Bottleneck Analysis
     intelligence['bottleneck_analysis'] = {
-        'dump_site_bottleneck': max(dump_site_loads, key=dump_site_loads.get) if dump_site_loads else None,
-        'loading_site_bottleneck': max(loading_site_loads, key=loading_site_loads.get) if loading_site_loads else None,
-        'dump_site_loads': dump_site_loads,
-        'loading_site_loads': loading_site_loads
+        'dump_site_bottleneck': _max_key(dump_site_loads),
+        'loading_site_bottleneck': _max_key(loading_site_loads),
+        'dump_site_loads': dict(dump_site_loads),
+        'loading_site_loads': dict(loading_site_loads)
     }
     
     # Scalability Metrics
-    total_trucks = sum(
-        config['number_of_trucks'] 
-        for locations in contractor_configs.values() 
-        for config in locations.values()
-    )
-    
     total_contractors = len(contractor_configs)
     avg_trucks_per_contractor = total_trucks / max(1, total_contractors)
     
@@ -323,17 +434,17 @@ def analyze_fleet_intelligence(contractor_configs):
         'current_capacity': total_trucks,
         'contractor_efficiency': avg_trucks_per_contractor,
         'growth_potential': 'High' if total_trucks < 200 else 'Medium' if total_trucks < 400 else 'Limited',
-        'diversification_ratio': len(unique_routes) / max(1, total_contractors)
+        'diversification_ratio': unique_routes / max(1, total_contractors)
     }
     
     # Resilience Score (ability to handle disruptions)
-    route_redundancy = len(unique_routes) / max(1, len(set(dump_site_loads.keys())))
-    contractor_redundancy = total_contractors / max(1, len(set(dump_site_loads.keys())))
+    route_redundancy = unique_routes / max(1, len(dump_site_loads))
+    contractor_redundancy = total_contractors / max(1, len(dump_site_loads))
     
     resilience_factors = [
-        min(1.0, route_redundancy),  # Route diversity
-        min(1.0, contractor_redundancy),  # Contractor diversity
-        min(1.0, total_trucks / 100),  # Fleet size factor
+        _clamp(route_redundancy, hi=1.0),  # Route diversity
+        _clamp(contractor_redundancy, hi=1.0),  # Contractor diversity
+        _clamp(total_trucks / 100, hi=1.0),  # Fleet size factor
     ]
     
     intelligence['resilience_score'] = sum(resilience_factors) / len(resilience_factors) * 100
@@ -344,16 +455,8 @@ def get_real_time_recommendations(contractor_configs, current_wait_times):
     """Generate real-time actionable recommendations."""
     recommendations = []
     
-    # Extract wait times from nested structure  
-    total_wait_time = 0
-    route_count = 0
-    
-    for contractor, routes in current_wait_times.items():
-        for route, data in routes.items():
-            total_wait_time += data.get('waiting_time', 0) * 60  # Convert to minutes
-            route_count += 1
-    
-    avg_wait_minutes = total_wait_time / route_count if route_count > 0 else 0
+    # Extract wait times from nested structure (see _summarize_wait_times)
+    avg_wait_minutes, _ = _summarize_wait_times(current_wait_times)
     
     # Real-time recommendations
     if avg_wait_minutes > 30:  # High wait time
@@ -29,13 +29,48 @@ Functions
 """
 
 from typing import Dict, List, Tuple
+import heapq
 import logging
 
+import numpy as np
+
+from _queue_kernel import multi_server_queue_kernel, simulate_all_queues
 from config import FENI_DUMP_POINTS, get_main_feni_from_sub_point
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_line_count(subpoint_name: str, line_str: str) -> int:
+    """Number of lines in a ``"start-end"`` range string (1 if it is not a range)."""
+    try:
+        parts = line_str.split('-')
+        if len(parts) == 2:
+            start = int(parts[0])
+            end = int(parts[1])
+            return max(1, end - start + 1)
+    except Exception:
+        logger.debug(f"Failed to parse line count for {subpoint_name}: {line_str}")
+    return 1
+
+
+def _build_server_counts() -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Line counts per explicit sub‑point (first definition wins) and per main FENI zone."""
+    subpoint_counts: Dict[str, int] = {}
+    main_feni_counts: Dict[str, int] = {}
+    for main_feni, cfg in FENI_DUMP_POINTS.items():
+        total = 0
+        for sp, sp_cfg in cfg['sub_points'].items():
+            count = _parse_line_count(sp, sp_cfg.get('lines', ''))
+            subpoint_counts.setdefault(sp, count)
+            total += count
+        main_feni_counts[main_feni] = max(1, total)
+    return subpoint_counts, main_feni_counts
+
+
+# FENI_DUMP_POINTS is constant, so the line ranges are parsed once at import
+_SUBPOINT_SERVER_COUNT, _MAIN_FENI_SERVER_COUNT = _build_server_counts()
+
+
 def get_server_count(subpoint_name: str) -> int:
     """Determine the number of service lines for a given sub‑point.
 
@@ -46,6 +81,9 @@ def get_server_count(subpoint_name: str) -> int:
     sub‑points in the corresponding zone.  If the name cannot be
     resolved, a fallback of 2 servers is returned.
 
+    The line ranges are parsed once at import, so this is a dictionary
+    lookup.
+
     Args:
         subpoint_name: The dump location string.
 
@@ -55,37 +93,11 @@ def get_server_count(subpoint_name: str) -> int:
     if not subpoint_name:
         return 2
     # Check explicit sub‑point definitions
-    for main_feni, cfg in FENI_DUMP_POINTS.items():
-        if subpoint_name in cfg['sub_points']:
-            line_str = cfg['sub_points'][subpoint_name].get('lines', '')
-            try:
-                parts = line_str.split('-')
-                if len(parts) == 2:
-                    start = int(parts[0])
-                    end = int(parts[1])
-                    return max(1, end - start + 1)
-            except Exception:
-                logger.debug(f"Failed to parse line count for {subpoint_name}: {line_str}")
-            return 1
-    # Handle aggregated names by summing across sub‑points
-    main_feni = get_main_feni_from_sub_point(subpoint_name)
-    if main_feni and main_feni in FENI_DUMP_POINTS:
-        total = 0
-        for sp, sp_cfg in FENI_DUMP_POINTS[main_feni]['sub_points'].items():
-            line_str = sp_cfg.get('lines', '')
-            try:
-                parts = line_str.split('-')
-                if len(parts) == 2:
-                    start = int(parts[0])
-                    end = int(parts[1])
-                    total += max(1, end - start + 1)
-                else:
-                    total += 1
-            except Exception:
-                total += 1
-        return max(1, total)
-    # Fallback if unresolved
-    return 2
+    count = _SUBPOINT_SERVER_COUNT.get(subpoint_name)
+    if count is not None:
+        return count
+    # Aggregated names use the zone total; unresolved names fall back to 2
+    return _MAIN_FENI_SERVER_COUNT.get(get_main_feni_from_sub_point(subpoint_name), 2)
 
 
 def multi_server_queue(arrivals: List[Tuple[float, float]], num_servers: int) -> Tuple[float, float]:
@@ -110,17 +122,40 @@ def multi_server_queue(arrivals: List[Tuple[float, float]], num_servers: int) ->
     """
     if not arrivals:
         return 0.0, 0.0
-    server_free_times = [0.0] * max(1, num_servers)
+    servers = max(1, num_servers)
+    if len(arrivals) <= servers and arrivals[0][0] >= 0.0:
+        # Every truck finds an idle server, so nobody waits
+        end_time = max(arrival_time + service_time for arrival_time, service_time in arrivals)
+        return 0.0, (max(end_time, 0.0) if len(arrivals) < servers else end_time)
+    if multi_server_queue_kernel is not None:
+        # Compiled kernel (numba installed) on contiguous columns
+        pairs = np.array(arrivals, dtype=np.float64)
+        total_wait, end_time = multi_server_queue_kernel(
+            np.ascontiguousarray(pairs[:, 0]), np.ascontiguousarray(pairs[:, 1]), servers
+        )
+        return (total_wait / len(arrivals)) * 60.0, float(end_time)
+    if servers == 1:
+        # A single server is just the previous truck's finish time
+        free_time = 0.0
+        total_wait = 0.0
+        for arrival_time, service_time in arrivals:
+            wait = max(0.0, free_time - arrival_time)
+            total_wait += wait
+            free_time = (arrival_time + wait) + service_time
+        return (total_wait / len(arrivals)) * 60.0, free_time
+    # Min-heap of (free_time, server): the earliest available server (lowest
+    # number on ties) is popped in O(log servers)
+    server_heap = [(0.0, i) for i in range(servers)]
     total_wait = 0.0
     for arrival_time, service_time in arrivals:
         # Find earliest available server
-        idx = min(range(len(server_free_times)), key=lambda i: server_free_times[i])
-        wait = max(0.0, server_free_times[idx] - arrival_time)
+        free_time, idx = server_heap[0]
+        wait = max(0.0, free_time - arrival_time)
         total_wait += wait
         start_service = arrival_time + wait
-        server_free_times[idx] = start_service + service_time
+        heapq.heapreplace(server_heap, (start_service + service_time, idx))
     avg_wait_minutes = (total_wait / len(arrivals)) * 60.0
-    end_time = max(server_free_times)
+    end_time = max(free_time for free_time, _ in server_heap)
     return avg_wait_minutes, end_time
 
 
@@ -136,6 +171,8 @@ def simulate_subpoint_queues(events: Dict[str, List[Tuple[float, float]]]) -> Di
         A dictionary mapping each sub‑point to the average waiting time
         (in minutes).
     """
+    if simulate_all_queues is not None:
+        return _simulate_subpoint_queues_compiled(events)
     results: Dict[str, float] = {}
     for subpoint, arrivals in events.items():
         if not arrivals:
@@ -148,3 +185,28 @@ def simulate_subpoint_queues(events: Dict[str, List[Tuple[float, float]]]) -> Di
             f"Simulated {len(arrivals)} arrivals at {subpoint} with {servers} servers: avg wait = {avg_wait:.2f} min"
         )
     return results
+
+
+def _simulate_subpoint_queues_compiled(events: Dict[str, List[Tuple[float, float]]]) -> Dict[str, float]:
+    """:func:`simulate_subpoint_queues` with all sub‑points in one parallel numba call.
+
+    The events are flattened into one arrival/service array pair with
+    per‑sub‑point offsets.
+    """
+    subpoints = [subpoint for subpoint, arrivals in events.items() if arrivals]
+    counts = np.array([len(events[subpoint]) for subpoint in subpoints], dtype=np.int64)
+    offsets = np.zeros(len(subpoints) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    pairs = np.array(
+        [pair for subpoint in subpoints for pair in events[subpoint]], dtype=np.float64
+    ).reshape(-1, 2)
+    servers = np.array([max(1, get_server_count(subpoint)) for subpoint in subpoints], dtype=np.int64)
+    totals = np.zeros(len(subpoints))
+    simulate_all_queues(
+        offsets, np.ascontiguousarray(pairs[:, 0]), np.ascontiguousarray(pairs[:, 1]), servers, totals
+    )
+    waits = {
+        subpoint: (total_wait / count) * 60.0
+        for subpoint, total_wait, count in zip(subpoints, totals.tolist(), counts.tolist())
+    }
+    return {subpoint: waits.get(subpoint, 0.0) for subpoint in events}
@@ -10,12 +10,86 @@ This optimizer implements:
 4. Real operational constraints and timing data
 """
 
-import pandas as pd
+import functools
+import heapq
+import re
+import sys
 import numpy as np
 import itertools
 from typing import Dict, List, Tuple, Optional
-import random
-import copy
+
+from _queue_kernel import dump_queue_kernel
+from core_calculations import parse_departure_hour
+from departure_optimizer import TIME_DATA_SHEET, load_time_data
+
+# Excel columns identifying a route, in lookup-key order
+_ROUTE_KEY_COLUMNS = ['Contractor', 'Parking Origin', 'Loading Origin', 'Dumping Destination']
+
+# (route_data field, Excel column, default for empty cells)
+_ROUTE_TIME_COLUMNS = [
+    ('travel_parking_loading', 'Travel Parking-Loading (h)', 1.0),
+    ('waiting_for_loading', 'Waiting for loading (h)', 0.3),
+    ('loading_time', 'Loading (h)', 0.08),
+    ('loaded_travel', 'Loaded Travel (h)', 2.5),
+    ('waiting_for_dumping', 'Waiting for dumping (h)', 0.3),
+    ('dumping_time', 'Dumping (h)', 0.08),
+    ('cycle_time', 'Cycle Time (h)', 6.0),
+]
+
+# Genetic algorithm: schedules per generation and chance to re-draw each route's time
+_GA_POPULATION = 40
+_GA_MUTATION_RATE = 0.1
+
+# Dump simulations memoized per optimizer
+_DUMP_CACHE_SIZE = 256
+
+# Relative slack on the brute-force lower bound, far above float rounding
+_LOWER_BOUND_TOLERANCE = 1e-9
+
+# Fallback timing data: statistical averages from the real data
+_FALLBACK_TIMES = {
+    'travel_parking_loading': 1.279,  # Real average: 76.7 min
+    'waiting_for_loading': 0.359,     # Real average: 21.5 min
+    'loading_time': 0.076,            # Real average: 4.6 min
+    'loaded_travel': 2.592,           # Real average: 155.5 min
+    'waiting_for_dumping': 0.314,     # Real average: 18.8 min
+    'dumping_time': 0.082,            # Real average: 4.9 min
+    'cycle_time': 6.836               # Real average: 410.1 min
+}
+
+# Handle both Excel format (FENI KM0) and config format (FENI A (LINE 1-2)):
+# a location belongs to a zone if it contains any of the zone's markers
+_KM0_MARKERS = re.compile('|'.join(map(re.escape, [
+    'KM0', 'KM 0', 'LINE 1-2', 'LINE 3-4', 'LINE 5-6', 'LINE 7-8',
+    'LINE 9-10', 'LINE 11-12', 'LINE 13-14', 'LINE 15-16',
+])))
+_KM15_MARKERS = re.compile('|'.join(map(re.escape, [
+    'KM15', 'KM 15', 'LINE 65-66', 'LINE 67-68', 'LINE 69-70', 'LINE 71-72',
+])))
+
+
+@functools.lru_cache(maxsize=256)
+def _main_dump_zone(dumping_location):
+    """Main zone of a dump location; configs only use a handful of them"""
+    dumping_upper = dumping_location.upper()
+    if _KM0_MARKERS.search(dumping_upper):
+        return 'FENI KM0'
+    elif _KM15_MARKERS.search(dumping_upper):
+        return 'FENI KM15'
+    return None
+
+
+# Hours of the hourly analysis (5:00 AM to 9:00 AM) with each zone's base
+# wait (minutes) and congestion divisor per hour.  Peak hours (6-8 AM) have
+# higher congestion
+_HOURLY_HOURS = [5, 6, 7, 8, 9]
+# FENI KM0 (2 servers, lower traffic)
+_KM0_BASE_WAITS = np.array([12.0, 18.0, 18.0, 15.0, 12.0])
+_KM0_CONGESTION = np.array([15.0, 10.0, 10.0, 12.0, 15.0])
+# FENI KM15 (3 servers, higher traffic, longer distances)
+_KM15_BASE_WAITS = np.array([22.0, 35.0, 35.0, 28.0, 22.0])
+_KM15_CONGESTION = np.array([12.0, 8.0, 8.0, 10.0, 12.0])
+
 
 class RealTimeDataProcessor:
     """Process real timing data from Time_Data.xlsx"""
@@ -23,12 +97,26 @@ class RealTimeDataProcessor:
     def __init__(self, excel_file='Time_Data.xlsx'):
         self.df = None
         self.route_data = {}
+        # First route_data key of each contractor, for routes not in the data
+        self.contractor_routes = {}
+        # Interned upper-case spelling of every name looked up so far
+        self._upper_names = {}
         self.load_data(excel_file)
     
     def load_data(self, excel_file):
-        """Load and process real timing data"""
+        """Load and process real timing data
+        
+        The sheet comes from ``departure_optimizer.load_time_data``, which
+        keeps a Parquet snapshot next to the workbook, so the Excel file is
+        only parsed again after it changes.
+        """
         try:
-            self.df = pd.read_excel(excel_file, sheet_name='Time-Data')
+            # Only the route key and timing columns are decoded
+            self.df = load_time_data(
+                excel_file, columns=_ROUTE_KEY_COLUMNS + [column for _, column, _ in _ROUTE_TIME_COLUMNS]
+            )
+            if self.df is None:
+                raise ValueError(f"cannot read the {TIME_DATA_SHEET} sheet of {excel_file}")
             print(f"✅ Loaded {len(self.df)} real operational records")
             self._build_route_lookup()
         except Exception as e:
@@ -36,51 +124,98 @@ class RealTimeDataProcessor:
     
     def _build_route_lookup(self):
         """Build lookup table for route timing data"""
-        for _, row in self.df.iterrows():
-            key = (
-                str(row['Contractor']).strip().upper(),
-                str(row['Parking Origin']).strip().upper(), 
-                str(row['Loading Origin']).strip().upper(),
-                str(row['Dumping Destination']).strip().upper()
-            )
-            
-            self.route_data[key] = {
-                'travel_parking_loading': float(row['Travel Parking-Loading (h)']) if pd.notna(row['Travel Parking-Loading (h)']) else 1.0,
-                'waiting_for_loading': float(row['Waiting for loading (h)']) if pd.notna(row['Waiting for loading (h)']) else 0.3,
-                'loading_time': float(row['Loading (h)']) if pd.notna(row['Loading (h)']) else 0.08,
-                'loaded_travel': float(row['Loaded Travel (h)']) if pd.notna(row['Loaded Travel (h)']) else 2.5,
-                'waiting_for_dumping': float(row['Waiting for dumping (h)']) if pd.notna(row['Waiting for dumping (h)']) else 0.3,
-                'dumping_time': float(row['Dumping (h)']) if pd.notna(row['Dumping (h)']) else 0.08,
-                'cycle_time': float(row['Cycle Time (h)']) if pd.notna(row['Cycle Time (h)']) else 6.0
-            }
+        # Whole-column conversions instead of boxing every row with iterrows()
+        keys = zip(*(self.df[column].map(str).str.strip().str.upper() for column in _ROUTE_KEY_COLUMNS))
+        columns = [
+            self.df[column].to_numpy(dtype=float, na_value=default).tolist()
+            for _, column, default in _ROUTE_TIME_COLUMNS
+        ]
+        fields = [field for field, _, _ in _ROUTE_TIME_COLUMNS]
+        
+        for key, times in zip(keys, zip(*columns)):
+            # Interned names, so lookups with interned keys compare by identity
+            key = tuple(map(sys.intern, key))
+            self.route_data[key] = dict(zip(fields, times))
+            self.contractor_routes.setdefault(key[0], key)
     
     def get_route_times(self, contractor, parking, loading, dumping):
         """Get real timing data for a specific route"""
-        key = (contractor.upper(), parking.upper(), loading.upper(), dumping.upper())
+        key = (self._upper(contractor), self._upper(parking), self._upper(loading), self._upper(dumping))
         
         if key in self.route_data:
             return self.route_data[key]
         
         # Try to find similar route by contractor
-        similar_keys = [k for k in self.route_data.keys() if k[0] == contractor.upper()]
-        if similar_keys:
-            return self.route_data[similar_keys[0]]
+        similar_key = self.contractor_routes.get(key[0])
+        if similar_key is not None:
+            return self.route_data[similar_key]
         
         # Fallback: use statistical averages
         return self._get_fallback_times(contractor, parking, loading, dumping)
     
+    def _upper(self, name):
+        """Interned ``name.upper()``; configs reuse a few names, so each is converted once"""
+        upper = self._upper_names.get(name)
+        if upper is None:
+            upper = self._upper_names[name] = sys.intern(name.upper())
+        return upper
+    
     def _get_fallback_times(self, contractor, parking, loading, dumping):
-        """Get fallback timing data when exact match not found"""
-        # Use statistical averages from the real data
-        return {
-            'travel_parking_loading': 1.279,  # Real average: 76.7 min
-            'waiting_for_loading': 0.359,     # Real average: 21.5 min
-            'loading_time': 0.076,            # Real average: 4.6 min
-            'loaded_travel': 2.592,           # Real average: 155.5 min
-            'waiting_for_dumping': 0.314,     # Real average: 18.8 min
-            'dumping_time': 0.082,            # Real average: 4.9 min
-            'cycle_time': 6.836               # Real average: 410.1 min
-        }
+        """Get fallback timing data when exact match not found
+        
+        The averages never change, so every call returns the same shared
+        dictionary; callers must not modify it.
+        """
+        return _FALLBACK_TIMES
+
+
+def _two_server_queue(arrival_times, service_times):
+    """Total and longest wait of simulate_dump_arrays with 2 servers, unrolled
+    
+    The earliest free server is picked with one comparison (server 0 on
+    ties), with the same arithmetic as the general loop.
+    """
+    free0 = free1 = 0.0
+    total_wait_time = 0.0
+    max_wait = 0.0
+    for arrival_time, service_time in zip(arrival_times, service_times):
+        if free0 <= free1:
+            service_start = free0 if free0 > arrival_time else arrival_time
+            free0 = service_start + service_time
+        else:
+            service_start = free1 if free1 > arrival_time else arrival_time
+            free1 = service_start + service_time
+        wait_time = service_start - arrival_time
+        total_wait_time += wait_time
+        if wait_time > max_wait:
+            max_wait = wait_time
+    return total_wait_time, max_wait
+
+
+def _three_server_queue(arrival_times, service_times):
+    """Total and longest wait of simulate_dump_arrays with 3 servers, unrolled"""
+    free0 = free1 = free2 = 0.0
+    total_wait_time = 0.0
+    max_wait = 0.0
+    for arrival_time, service_time in zip(arrival_times, service_times):
+        if free0 <= free1 and free0 <= free2:
+            service_start = free0 if free0 > arrival_time else arrival_time
+            free0 = service_start + service_time
+        elif free1 <= free2:
+            service_start = free1 if free1 > arrival_time else arrival_time
+            free1 = service_start + service_time
+        else:
+            service_start = free2 if free2 > arrival_time else arrival_time
+            free2 = service_start + service_time
+        wait_time = service_start - arrival_time
+        total_wait_time += wait_time
+        if wait_time > max_wait:
+            max_wait = wait_time
+    return total_wait_time, max_wait
+
+
+# Unrolled queue loops by number of servers
+_SERVER_QUEUE_LOOPS = {2: _two_server_queue, 3: _three_server_queue}
 
 
 class MultiServerQueueSimulator:
@@ -93,13 +228,16 @@ class MultiServerQueueSimulator:
             'FENI KM15': 3   # 3 servers at KM15 (realistic)  
         }
     
-    def simulate_dump_queue(self, arrivals: List[Tuple[float, float]], num_servers: int) -> Dict:
+    def simulate_dump_queue(self, arrivals: List[Tuple[float, float]], num_servers: int,
+                            record_events: bool = False) -> Dict:
         """
         Simulate multi-server queue with real arrival and service times
         
         Args:
             arrivals: List of (arrival_time_hours, service_time_hours)
             num_servers: Number of servers at dump site
+            record_events: Also list every truck's arrival, service start,
+                wait and server under ``'events'`` (``None`` otherwise)
             
         Returns:
             Dict with queue statistics
@@ -107,22 +245,56 @@ class MultiServerQueueSimulator:
         if not arrivals:
             return {'total_wait_time': 0, 'avg_wait_per_truck': 0, 'max_wait': 0, 'queue_length': 0}
         
-        # Sort arrivals by time
-        arrivals = sorted(arrivals, key=lambda x: x[0])
+        arrival_times, service_times = (np.array(column, dtype=np.float64) for column in zip(*arrivals))
+        return self.simulate_dump_arrays(arrival_times, service_times, num_servers, record_events)
+    
+    def simulate_dump_arrays(self, arrival_times: np.ndarray, service_times: np.ndarray, num_servers: int,
+                             record_events: bool = False) -> Dict:
+        """
+        simulate_dump_queue on parallel arrays of arrival and service times
         
-        # Track server availability times
-        server_free_times = [0.0] * num_servers
+        The optimizer keeps each route's trucks as arrays, so a dump's
+        arrivals are concatenated and sorted without building tuples.
+        """
+        if len(arrival_times) == 0:
+            return {'total_wait_time': 0, 'avg_wait_per_truck': 0, 'max_wait': 0, 'queue_length': 0}
+        
+        # Sort arrivals by time (stable, ties keep their order).  The
+        # optimizer passes one ascending run per route, which the stable
+        # sort (timsort) detects and merges in near-linear time
+        order = np.argsort(arrival_times, kind='stable')
+        arrival_times = arrival_times[order]
+        service_times = service_times[order]
+        
+        if dump_queue_kernel is not None:
+            return self._simulate_dump_queue_compiled(arrival_times, service_times, num_servers, record_events)
+        
+        # The dump sites have 2 and 3 servers; those get unrolled loops
+        queue_loop = None if record_events else _SERVER_QUEUE_LOOPS.get(num_servers)
+        if queue_loop is not None:
+            total_wait_time, max_wait = queue_loop(arrival_times.tolist(), service_times.tolist())
+            return {
+                'total_wait_time': total_wait_time,
+                'avg_wait_per_truck': total_wait_time / len(arrival_times),
+                'max_wait': max_wait,
+                'queue_length': len(arrival_times),
+                'events': None
+            }
+        
+        # Track server availability times in a min-heap of (free_time, server),
+        # so the earliest available server (lowest number on ties) is at the top
+        server_heap = [(0.0, server) for server in range(num_servers)]
         
         total_wait_time = 0.0
         max_wait = 0.0
-        queue_events = []
+        queue_events = [] if record_events else None
         
-        for arrival_time, service_time in arrivals:
+        for arrival_time, service_time in zip(arrival_times.tolist(), service_times.tolist()):
             # Find earliest available server
-            earliest_server = min(range(num_servers), key=lambda i: server_free_times[i])
+            free_time, earliest_server = server_heap[0]
             
             # Calculate actual service start time
-            service_start = max(arrival_time, server_free_times[earliest_server])
+            service_start = max(arrival_time, free_time)
             
             # Calculate wait time
             wait_time = service_start - arrival_time
@@ -130,20 +302,47 @@ class MultiServerQueueSimulator:
             max_wait = max(max_wait, wait_time)
             
             # Update server availability
-            server_free_times[earliest_server] = service_start + service_time
+            heapq.heapreplace(server_heap, (service_start + service_time, earliest_server))
             
-            queue_events.append({
-                'arrival': arrival_time,
-                'service_start': service_start,
-                'wait_time': wait_time,
-                'server': earliest_server
-            })
+            if record_events:
+                queue_events.append({
+                    'arrival': arrival_time,
+                    'service_start': service_start,
+                    'wait_time': wait_time,
+                    'server': earliest_server
+                })
         
         return {
             'total_wait_time': total_wait_time,
-            'avg_wait_per_truck': total_wait_time / len(arrivals),
+            'avg_wait_per_truck': total_wait_time / len(arrival_times),
             'max_wait': max_wait,
-            'queue_length': len(arrivals),
+            'queue_length': len(arrival_times),
+            'events': queue_events
+        }
+    
+    def _simulate_dump_queue_compiled(self, arrival_times, service_times, num_servers, record_events=False):
+        """simulate_dump_arrays on sorted arrivals with the numba kernel"""
+        starts = np.empty(len(arrival_times))
+        assigned = np.empty(len(arrival_times), dtype=np.int64)
+        total_wait_time, max_wait = dump_queue_kernel(arrival_times, service_times, num_servers, starts, assigned)
+        
+        queue_events = None
+        if record_events:
+            queue_events = [
+                {
+                    'arrival': arrival_time,
+                    'service_start': service_start,
+                    'wait_time': service_start - arrival_time,
+                    'server': server
+                }
+                for arrival_time, service_start, server in zip(arrival_times.tolist(), starts.tolist(), assigned.tolist())
+            ]
+        
+        return {
+            'total_wait_time': float(total_wait_time),
+            'avg_wait_per_truck': float(total_wait_time) / len(arrival_times),
+            'max_wait': float(max_wait),
+            'queue_length': len(arrival_times),
             'events': queue_events
         }
 
@@ -160,19 +359,36 @@ class RealOptimizer:
         # Operational constraints
         self.time_window = ['5:00', '5:30', '6:00', '6:30', '7:00', '7:30', '8:00', '8:30', '9:00']
         self.min_gap_between_trucks = 0.02  # 1.2 minutes (real operational constraint)
+        self._departure_hours = {time: parse_departure_hour(time, default=7.0) for time in self.time_window}
+        
+        # calculate_real_travel_time results by (contractor, parking, loading, dumping, departure)
+        self._travel_cache = {}
+        # _simulate_dump results by dump site and arrivals
+        self._dump_cache = {}
     
     def calculate_real_travel_time(self, contractor, parking, loading, dumping, departure_time_str):
-        """Calculate real travel time using actual Excel data"""
+        """Calculate real travel time using actual Excel data
+        
+        The result only depends on the arguments, and the brute-force search
+        asks for the same routes and departure times over and over, so each
+        combination is computed once per optimizer.
+        """
+        key = (contractor, parking, loading, dumping, departure_time_str)
+        cached = self._travel_cache.get(key)
+        if cached is None:
+            cached = self._travel_cache[key] = self._calculate_real_travel_time(*key)
+        return cached
+    
+    def _calculate_real_travel_time(self, contractor, parking, loading, dumping, departure_time_str):
+        """Uncached calculate_real_travel_time"""
         
         # Get real timing data
         route_times = self.time_processor.get_route_times(contractor, parking, loading, dumping)
         
-        # Parse departure time
-        try:
-            parts = departure_time_str.split(':')
-            departure_hour = float(parts[0]) + float(parts[1]) / 60.0
-        except:
-            departure_hour = 7.0
+        # Parse departure time (the time window is parsed up front)
+        departure_hour = self._departure_hours.get(departure_time_str)
+        if departure_hour is None:
+            departure_hour = parse_departure_hour(departure_time_str, default=7.0)
         
         # Calculate total travel time to dump using real data
         total_travel_time = (
@@ -190,20 +406,38 @@ class RealOptimizer:
         
         return arrival_time, service_time, route_times
     
-    def simulate_current_system(self, config=None):
-        """Simulate current system using real data"""
+    def simulate_current_system(self, config=None, overrides=None):
+        """Simulate current system using real data
+        
+        ``overrides`` maps ``(contractor, parking)`` to a departure time
+        used instead of the one in the config, so candidate schedules can be
+        simulated without copying the whole configuration.
+        """
+        dump_routes, route_details = self._route_arrivals(config, overrides)
+        return self._simulate_dumps(dump_routes), route_details
+    
+    def _route_arrivals(self, config=None, overrides=None):
+        """Truck arrivals of every route, grouped by dump site
+        
+        Returns ``(dump_routes, route_details)`` where ``dump_routes`` maps
+        each dump site to ``{(contractor, parking): arrivals}`` in config
+        order, so one route's arrivals can be swapped without rebuilding
+        the others.
+        """
+        if overrides is None:
+            overrides = {}
         if config is None:
             config = self.contractor_configs
         
         # Group arrivals by dump location
-        dump_arrivals = {}
+        dump_routes = {}
         route_details = {}
         
         for contractor, routes in config.items():
             for parking, route_config in routes.items():
                 loading = route_config['loading_location']
                 dumping = route_config['dumping_location']
-                departure_time = route_config['departure_time']
+                departure_time = overrides.get((contractor, parking), route_config['departure_time'])
                 num_trucks = route_config['number_of_trucks']
                 
                 if num_trucks == 0:
@@ -219,13 +453,12 @@ class RealOptimizer:
                 if not main_dump:
                     continue
                 
-                if main_dump not in dump_arrivals:
-                    dump_arrivals[main_dump] = []
+                if main_dump not in dump_routes:
+                    dump_routes[main_dump] = {}
                 
-                # Generate staggered arrivals for multiple trucks (real operational constraint)
-                for i in range(num_trucks):
-                    truck_arrival = arrival_time + (i * self.min_gap_between_trucks)
-                    dump_arrivals[main_dump].append((truck_arrival, service_time))
+                dump_routes[main_dump][(contractor, parking)] = self._truck_arrivals(
+                    arrival_time, service_time, num_trucks
+                )
                 
                 # Store route details for analysis
                 route_key = f"{contractor}_{parking}"
@@ -242,31 +475,180 @@ class RealOptimizer:
                     'main_dump': main_dump
                 }
         
-        # Simulate queues at each dump site
-        dump_results = {}
-        for dump_site, arrivals in dump_arrivals.items():
-            num_servers = self.queue_simulator.dump_servers.get(dump_site, 1)
-            result = self.queue_simulator.simulate_dump_queue(arrivals, num_servers)
-            dump_results[dump_site] = result
+        return dump_routes, route_details
+    
+    def _truck_arrivals(self, arrival_time, service_time, num_trucks):
+        """Staggered arrival times and service times of one route's trucks, as two arrays
         
-        return dump_results, route_details
+        The arrival times ascend, so each route is an already sorted run when
+        a dump's routes are concatenated and sorted.
+        """
+        # Generate staggered arrivals for multiple trucks (real operational constraint)
+        trucks = np.arange(num_trucks)
+        return arrival_time + trucks * self.min_gap_between_trucks, np.full(len(trucks), service_time, dtype=np.float64)
+    
+    def _simulate_dump(self, dump_site, routes):
+        """Queue statistics of one dump site from its routes' arrivals
+        
+        Results are memoized by the arrivals themselves: the final schedule,
+        candidates equal to a route's current time written differently
+        ('06:00' and '6:00') and the genetic algorithm's schedules that only
+        change the other dump repeat earlier simulations.  The returned
+        dictionary is shared and must not be modified.
+        """
+        key = (dump_site, tuple(
+            (route, times.tobytes(), services.tobytes()) for route, (times, services) in routes.items()
+        ))
+        result = self._dump_cache.get(key)
+        if result is None:
+            if len(self._dump_cache) >= _DUMP_CACHE_SIZE:
+                # Drop the oldest entry (dicts keep insertion order)
+                del self._dump_cache[next(iter(self._dump_cache))]
+            result = self._dump_cache[key] = self.queue_simulator.simulate_dump_arrays(
+                *self._dump_queue_args(dump_site, routes)
+            )
+        return result
+    
+    def _dump_queue_args(self, dump_site, routes):
+        """simulate_dump_arrays arguments for one dump site's routes"""
+        arrival_times = np.concatenate([times for times, _ in routes.values()])
+        service_times = np.concatenate([services for _, services in routes.values()])
+        return arrival_times, service_times, self.queue_simulator.dump_servers.get(dump_site, 1)
+    
+    def _route_wait_lower_bound(self, dump_routes, dump_results, main_dump, route):
+        """Lower bound on the total wait over every departure time of ``route``
+        
+        Adding a truck to a first-come first-served queue never shortens the
+        other trucks' waits, so wherever the route departs the total is at
+        least the total without its trucks.  The bound is lowered by a
+        relative tolerance so rounding in the differently ordered sums can
+        never prune a candidate the full simulation would accept.
+        """
+        lower_bound = sum(
+            result['total_wait_time'] for dump_site, result in dump_results.items() if dump_site != main_dump
+        )
+        other_routes = {key: arrivals for key, arrivals in dump_routes[main_dump].items() if key != route}
+        if other_routes:
+            lower_bound += self._simulate_dump(main_dump, other_routes)['total_wait_time']
+        return lower_bound * (1 - _LOWER_BOUND_TOLERANCE)
+    
+    def _compare_zones(self, test_results, baseline_results):
+        """Compare each zone's average wait against the baseline
+        
+        Returns ``(km0, km15, acceptable)`` where ``km0`` and ``km15`` are
+        ``(baseline_minutes, test_minutes, relative_improvement)``.
+        """
+        # Calculate individual zone performance
+        km0_test_wait = test_results.get('FENI KM0', {}).get('avg_wait_per_truck', 0) * 60
+        km15_test_wait = test_results.get('FENI KM15', {}).get('avg_wait_per_truck', 0) * 60
+        
+        km0_baseline_wait = baseline_results.get('FENI KM0', {}).get('avg_wait_per_truck', 0) * 60
+        km15_baseline_wait = baseline_results.get('FENI KM15', {}).get('avg_wait_per_truck', 0) * 60
+        
+        # REALISTIC OPTIMIZATION: Accept if overall system improves without making any zone dramatically worse
+        # Calculate relative improvements
+        km0_improvement = (km0_baseline_wait - km0_test_wait) / max(km0_baseline_wait, 1)
+        km15_improvement = (km15_baseline_wait - km15_test_wait) / max(km15_baseline_wait, 1)
+        
+        # Accept if (besides the total system wait improving):
+        # 1. No zone gets worse by more than 15% (realistic tolerance) AND  
+        # 2. At least one zone improves by 5% or more
+        km0_acceptable = km0_improvement >= -0.15  # Max 15% worse
+        km15_acceptable = km15_improvement >= -0.15  # Max 15% worse
+        some_improvement = (km0_improvement >= 0.05) or (km15_improvement >= 0.05)  # At least 5% improvement somewhere
+        
+        return (
+            (km0_baseline_wait, km0_test_wait, km0_improvement),
+            (km15_baseline_wait, km15_test_wait, km15_improvement),
+            km0_acceptable and km15_acceptable and some_improvement
+        )
+    
+    def _genetic_refinement(self, baseline_routes, baseline_details, baseline_results, seed_overrides,
+                            seed_total_wait, generations, random_state=None):
+        """Evolve whole departure schedules with a genetic algorithm
+        
+        A schedule is one option index per route (option 0 keeps the
+        current time, the others are the time window).  The population is
+        seeded with ``seed_overrides`` and evolves with tournament
+        selection, uniform crossover, mutation and elitism, all as numpy
+        operations on the ``(population, routes)`` index array.  A schedule's
+        fitness is its total wait if it passes the same checks as the brute
+        force against the baseline, infinity otherwise.
+        
+        Returns ``(overrides, total_wait)`` of the best schedule found.
+        """
+        rng = np.random.default_rng(random_state)
+        baseline_total_wait = sum(result['total_wait_time'] for result in baseline_results.values())
+        
+        routes = []
+        options = []
+        route_arrivals = []
+        for route_info in baseline_details.values():
+            route = (route_info['contractor'], route_info['parking'])
+            times = [route_info['departure_time']] + [time for time in self.time_window if time != route_info['departure_time']]
+            arrivals = []
+            for time in times:
+                arrival_time, service_time, _ = self.calculate_real_travel_time(
+                    route[0], route[1], route_info['loading'], route_info['dumping'], time
+                )
+                arrivals.append(self._truck_arrivals(arrival_time, service_time, route_info['num_trucks']))
+            routes.append((route, route_info['main_dump']))
+            options.append(times)
+            route_arrivals.append(arrivals)
+        option_counts = np.array([len(times) for times in options])
+        
+        fitness_cache = {}
+        
+        def fitness(genome):
+            key = tuple(genome.tolist())
+            if key not in fitness_cache:
+                dump_routes = {dump_site: dict(routes_at_dump) for dump_site, routes_at_dump in baseline_routes.items()}
+                for (route, main_dump), arrivals, option in zip(routes, route_arrivals, key):
+                    dump_routes[main_dump][route] = arrivals[option]
+                test_results = self._simulate_dumps(dump_routes)
+                total_wait = sum(result['total_wait_time'] for result in test_results.values())
+                *_, zones_acceptable = self._compare_zones(test_results, baseline_results)
+                fitness_cache[key] = total_wait if total_wait < baseline_total_wait and zones_acceptable else np.inf
+            return fitness_cache[key]
+        
+        seed = np.array([times.index(seed_overrides.get(route, times[0])) for (route, _), times in zip(routes, options)])
+        population = rng.integers(0, option_counts, size=(_GA_POPULATION, len(routes)))
+        population[0] = seed
+        best_genome, best_total_wait = seed, seed_total_wait
+        
+        for _ in range(generations):
+            scores = np.array([fitness(genome) for genome in population])
+            elite = int(np.argmin(scores))
+            if scores[elite] < best_total_wait:
+                best_genome, best_total_wait = population[elite].copy(), scores[elite]
+            
+            # Tournament selection of two parents per child
+            contenders = rng.integers(0, _GA_POPULATION, size=(2, 2, _GA_POPULATION))
+            parents = np.where(scores[contenders[:, 0]] <= scores[contenders[:, 1]], contenders[:, 0], contenders[:, 1])
+            # Uniform crossover, then mutation to random options
+            children = np.where(
+                rng.random(population.shape) < 0.5, population[parents[0]], population[parents[1]]
+            )
+            mutate = rng.random(population.shape) < _GA_MUTATION_RATE
+            children[mutate] = rng.integers(0, option_counts, size=population.shape)[mutate]
+            # Elitism: the best schedule so far always survives
+            children[0] = best_genome
+            population = children
+        
+        overrides = {
+            route: times[option]
+            for ((route, _), times, option) in zip(routes, options, best_genome.tolist())
+            if option != 0
+        }
+        return overrides, float(best_total_wait)
+    
+    def _simulate_dumps(self, dump_routes):
+        """Simulate queues at each dump site"""
+        return {dump_site: self._simulate_dump(dump_site, routes) for dump_site, routes in dump_routes.items()}
     
     def _get_main_dump_zone(self, dumping_location):
         """Map dump location to main zone"""
-        dumping_upper = dumping_location.upper()
-        
-        # Handle both Excel format (FENI KM0) and config format (FENI A (LINE 1-2))
-        if ('KM0' in dumping_upper or 'KM 0' in dumping_upper or 
-            'LINE 1-2' in dumping_upper or 'LINE 3-4' in dumping_upper or 
-            'LINE 5-6' in dumping_upper or 'LINE 7-8' in dumping_upper or
-            'LINE 9-10' in dumping_upper or 'LINE 11-12' in dumping_upper or
-            'LINE 13-14' in dumping_upper or 'LINE 15-16' in dumping_upper):
-            return 'FENI KM0'
-        elif ('KM15' in dumping_upper or 'KM 15' in dumping_upper or
-              'LINE 65-66' in dumping_upper or 'LINE 67-68' in dumping_upper or
-              'LINE 69-70' in dumping_upper or 'LINE 71-72' in dumping_upper):
-            return 'FENI KM15'
-        return None
+        return _main_dump_zone(dumping_location)
     
     def simulate_hourly_analysis(self, config=None):
         """Generate realistic hourly waiting time analysis"""
@@ -288,50 +670,20 @@ class RealOptimizer:
                 elif main_dump == 'FENI KM15':
                     km15_truck_count += num_trucks
         
-        # Realistic hourly waiting time simulation
-        hourly_results = {}
+        # Realistic hourly waiting time simulation for all hours at once:
+        # base wait plus a congestion factor, with ±10% variation
+        variation = np.random.uniform(0.9, 1.1, size=(len(_HOURLY_HOURS), 2))
+        km0_wait = (_KM0_BASE_WAITS + km0_truck_count / _KM0_CONGESTION) * variation[:, 0]
+        km15_wait = (_KM15_BASE_WAITS + km15_truck_count / _KM15_CONGESTION) * variation[:, 1]
         
-        for hour in range(5, 10):  # 5:00 AM to 9:00 AM
-            hour_str = f"{hour:02d}:00"
-            
-            # Realistic waiting time calculation based on operational patterns
-            # Peak hours (6-8 AM) have higher congestion
-            
-            # FENI KM0 (2 servers, lower traffic)
-            if hour in [6, 7]:  # Peak hours
-                km0_base_wait = 18.0 + (km0_truck_count / 10)  # Congestion factor
-            elif hour == 8:  # Moderate peak
-                km0_base_wait = 15.0 + (km0_truck_count / 12)
-            else:  # Off-peak hours (5, 9)
-                km0_base_wait = 12.0 + (km0_truck_count / 15)
-            
-            # FENI KM15 (3 servers, higher traffic, longer distances)
-            if hour in [6, 7]:  # Peak hours
-                km15_base_wait = 35.0 + (km15_truck_count / 8)  # Higher congestion
-            elif hour == 8:  # Moderate peak
-                km15_base_wait = 28.0 + (km15_truck_count / 10)
-            else:  # Off-peak hours (5, 9)
-                km15_base_wait = 22.0 + (km15_truck_count / 12)
-            
-            # Add realistic variation based on hour
-            import random
-            km0_wait = km0_base_wait * random.uniform(0.9, 1.1)  # ±10% variation
-            km15_wait = km15_base_wait * random.uniform(0.9, 1.1)  # ±10% variation
-            
-            # Ensure reasonable minimums
-            km0_wait = max(km0_wait, 8.0)  # Minimum 8 min (service time + minimal queue)
-            km15_wait = max(km15_wait, 15.0)  # Minimum 15 min (longer distance + minimal queue)
-            
-            # Ensure reasonable maximums
-            km0_wait = min(km0_wait, 45.0)  # Maximum 45 min
-            km15_wait = min(km15_wait, 60.0)  # Maximum 60 min
-            
-            hourly_results[hour_str] = {
-                'km0_wait': km0_wait,
-                'km15_wait': km15_wait
-            }
+        # Ensure reasonable minimums (service time + minimal queue) and maximums
+        km0_wait = np.clip(km0_wait, 8.0, 45.0)
+        km15_wait = np.clip(km15_wait, 15.0, 60.0)
         
-        return hourly_results
+        return {
+            f"{hour:02d}:00": {'km0_wait': km0, 'km15_wait': km15}
+            for hour, km0, km15 in zip(_HOURLY_HOURS, km0_wait.tolist(), km15_wait.tolist())
+        }
     
     def simulate_optimized_hourly_analysis(self, baseline_hourly, optimization_log):
         """Generate optimized hourly analysis showing real improvements"""
@@ -370,13 +722,22 @@ class RealOptimizer:
         
         return optimized_hourly
 
-    def optimize_departure_times(self, max_iterations=100):
-        """Real mathematical optimization using brute force + genetic algorithm"""
+    def optimize_departure_times(self, max_iterations=100, genetic=False, random_state=None):
+        """Real mathematical optimization using brute force + genetic algorithm
+        
+        With ``genetic=True`` the brute-force schedule then seeds a genetic
+        algorithm that runs for up to ``max_iterations`` generations
+        (``random_state`` seeds it); its schedule is kept if it is better.
+        
+        Each route's ``improvement_minutes`` in the log is the improvement of
+        the schedule with that route's and all earlier routes' times applied.
+        """
         
         print("🔄 Running REAL optimization algorithm...")
         
         # Step 1: Calculate baseline performance
-        baseline_results, baseline_details = self.simulate_current_system()
+        baseline_routes, baseline_details = self._route_arrivals()
+        baseline_results = self._simulate_dumps(baseline_routes)
         baseline_total_wait = sum(result['total_wait_time'] for result in baseline_results.values())
         
         print(f"📊 Baseline total wait time: {baseline_total_wait:.2f} hours ({baseline_total_wait*60:.1f} minutes)")
@@ -391,7 +752,12 @@ class RealOptimizer:
             return baseline_results, baseline_results, {}, baseline_details, baseline_details, baseline_hourly, baseline_hourly
         
         # Step 3: Brute force optimization for each route
-        best_config = copy.deepcopy(self.contractor_configs)
+        # Accepted departure times, applied on top of the current config,
+        # with the arrivals and queue results they produce.  A candidate
+        # only moves one route, so only that route's dump is re-simulated
+        best_overrides = {}
+        best_routes = dict(baseline_routes)
+        best_results = baseline_results
         best_total_wait = baseline_total_wait
         optimization_log = {}
         
@@ -400,51 +766,52 @@ class RealOptimizer:
             contractor = route_info['contractor']
             parking = route_info['parking']
             current_time = route_info['departure_time']
+            main_dump = route_info['main_dump']
             
             print(f"🎯 Optimizing {contractor} - {parking} (currently {current_time})")
             
             best_time_for_route = current_time
             best_wait_for_route = best_total_wait
             
-            # Test each possible departure time
-            for candidate_time in self.time_window:
-                if candidate_time == current_time:
-                    continue
-                
-                # Create test configuration
-                test_config = copy.deepcopy(best_config)
-                test_config[contractor][parking]['departure_time'] = candidate_time
-                
-                # Simulate with new departure time
-                test_results, _ = self.simulate_current_system(test_config)
+            # Test each possible departure time, unless even removing this
+            # route's trucks could not bring the total below the best
+            candidate_times = [time for time in self.time_window if time != current_time]
+            if self._route_wait_lower_bound(best_routes, best_results, main_dump, (contractor, parking)) >= best_wait_for_route:
+                candidate_times = []
+            
+            # Create test configurations
+            candidate_routes = []
+            for candidate_time in candidate_times:
+                arrival_time, service_time, _ = self.calculate_real_travel_time(
+                    contractor, parking, route_info['loading'], route_info['dumping'], candidate_time
+                )
+                candidate_routes.append({
+                    **best_routes[main_dump],
+                    (contractor, parking): self._truck_arrivals(arrival_time, service_time, route_info['num_trucks'])
+                })
+            
+            # Simulate with new departure times.  Accepting a candidate only
+            # replaces this route's arrivals, so every candidate's queue is
+            # the same whichever earlier candidate was accepted
+            candidate_results = [self._simulate_dump(main_dump, routes) for routes in candidate_routes]
+            
+            for candidate_time, test_routes, dump_result in zip(candidate_times, candidate_routes, candidate_results):
+                test_overrides = {**best_overrides, (contractor, parking): candidate_time}
+                test_results = {**best_results, main_dump: dump_result}
                 test_total_wait = sum(result['total_wait_time'] for result in test_results.values())
                 
                 # Check if this is better - ENSURE BOTH ZONES IMPROVE
-                # Calculate individual zone performance
-                km0_test_wait = test_results.get('FENI KM0', {}).get('avg_wait_per_truck', 0) * 60
-                km15_test_wait = test_results.get('FENI KM15', {}).get('avg_wait_per_truck', 0) * 60
-                
-                km0_baseline_wait = baseline_results.get('FENI KM0', {}).get('avg_wait_per_truck', 0) * 60
-                km15_baseline_wait = baseline_results.get('FENI KM15', {}).get('avg_wait_per_truck', 0) * 60
-                
-                # REALISTIC OPTIMIZATION: Accept if overall system improves without making any zone dramatically worse
-                # Calculate relative improvements
-                km0_improvement = (km0_baseline_wait - km0_test_wait) / max(km0_baseline_wait, 1)
-                km15_improvement = (km15_baseline_wait - km15_test_wait) / max(km15_baseline_wait, 1)
-                
-                # Accept if:
-                # 1. Total system wait improves AND
-                # 2. No zone gets worse by more than 15% (realistic tolerance) AND  
-                # 3. At least one zone improves by 5% or more
-                km0_acceptable = km0_improvement >= -0.15  # Max 15% worse
-                km15_acceptable = km15_improvement >= -0.15  # Max 15% worse
-                some_improvement = (km0_improvement >= 0.05) or (km15_improvement >= 0.05)  # At least 5% improvement somewhere
+                (km0_baseline_wait, km0_test_wait, km0_improvement), (km15_baseline_wait, km15_test_wait, km15_improvement), zones_acceptable = (
+                    self._compare_zones(test_results, baseline_results)
+                )
                 
-                if test_total_wait < best_wait_for_route and km0_acceptable and km15_acceptable and some_improvement:
+                if test_total_wait < best_wait_for_route and zones_acceptable:
                     best_wait_for_route = test_total_wait
                     best_time_for_route = candidate_time
                     best_total_wait = test_total_wait
-                    best_config = test_config
+                    best_overrides = test_overrides
+                    best_routes[main_dump] = test_routes
+                    best_results = test_results
                     
                     print(f"  ✅ Found improvement: {candidate_time} → {test_total_wait*60:.1f} min total wait")
                     print(f"     KM0: {km0_baseline_wait:.1f} → {km0_test_wait:.1f} min ({km0_improvement:+.1%})")
@@ -461,8 +828,31 @@ class RealOptimizer:
                 'changed': best_time_for_route != current_time
             }
         
+        # Step 3b: Optionally let a genetic algorithm improve on the
+        # route-by-route result, changing several routes at once
+        if genetic:
+            ga_overrides, ga_total_wait = self._genetic_refinement(
+                baseline_routes, baseline_details, baseline_results, best_overrides, best_total_wait,
+                max_iterations, random_state
+            )
+            if ga_total_wait < best_total_wait:
+                print(f"🧬 Genetic algorithm improved the schedule → {ga_total_wait*60:.1f} min total wait")
+                best_overrides, best_total_wait = ga_overrides, ga_total_wait
+                # As in the brute force, a route's improvement is that of the
+                # schedule with its own and the earlier routes' times applied
+                applied_overrides = {}
+                for log in optimization_log.values():
+                    route = (log['contractor'], log['parking'])
+                    log['optimal_time'] = best_overrides.get(route, log['current_time'])
+                    log['changed'] = log['optimal_time'] != log['current_time']
+                    if log['changed']:
+                        applied_overrides[route] = log['optimal_time']
+                    applied_results, _ = self.simulate_current_system(overrides=applied_overrides)
+                    applied_total_wait = sum(result['total_wait_time'] for result in applied_results.values())
+                    log['improvement_minutes'] = (baseline_total_wait - applied_total_wait) * 60
+        
         # Step 4: Calculate final optimized results
-        final_results, final_details = self.simulate_current_system(best_config)
+        final_results, final_details = self.simulate_current_system(overrides=best_overrides)
         final_total_wait = sum(result['total_wait_time'] for result in final_results.values())
         
         total_improvement = (baseline_total_wait - final_total_wait) * 60
@@ -480,12 +870,15 @@ class RealOptimizer:
         return baseline_results, final_results, optimization_log, baseline_details, final_details, baseline_hourly, optimized_hourly
 
 
-def run_real_optimization(contractor_configs, speeds):
-    """Run the real optimizer and return results"""
+def run_real_optimization(contractor_configs, speeds, genetic=False):
+    """Run the real optimizer and return results
+    
+    ``genetic`` is passed to ``RealOptimizer.optimize_departure_times``.
+    """
     optimizer = RealOptimizer(contractor_configs, speeds)
     
     try:
-        baseline_results, optimized_results, optimization_log, baseline_details, optimized_details, baseline_hourly, optimized_hourly = optimizer.optimize_departure_times()
+        baseline_results, optimized_results, optimization_log, baseline_details, optimized_details, baseline_hourly, optimized_hourly = optimizer.optimize_departure_times(genetic=genetic)
         
         return {
             'success': True,
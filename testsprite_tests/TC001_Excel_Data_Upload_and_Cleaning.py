@@ -1,124 +1,103 @@
 import asyncio
-from playwright import async_api
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+import pytest
+
+pytest.importorskip("pytest_asyncio")
+async_api = pytest.importorskip("playwright.async_api")
+
+from conftest import click_when_idle
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_excel_data_upload_and_cleaning(context):
+    # Open a new page in this test's context of the shared browser (conftest.py)
+    page = await context.new_page()
     
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto("http://localhost:8511", wait_until="commit", timeout=10000)
+    
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8511", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+    
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Scroll down or try to find any upload button or input to upload Excel dataset.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Click on '⚙️ System Settings' or explore tabs like 'Dashboard', 'Analysis', 'Optimizer' to find upload option.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section/div/div[2]/div/div/div/div[3]/div/div/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    
+    # Interact with the page elements to simulate user flow
+    # Scroll down or try to find any upload button or input to upload Excel dataset.
+    await page.mouse.wheel(0, window.innerHeight)
+    
 
-        # Click on the '⚙️ System Settings' button (index 3) to check for upload options or dataset management.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Click on '⚙️ System Settings' or explore tabs like 'Dashboard', 'Analysis', 'Optimizer' to find upload option.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/div/section/div/div[2]/div/div/div/div[3]/div/div/div/div').nth(0)
+    await click_when_idle(elem)
+    
 
-        # Click on the '📊 Dashboard' tab (index 17) to check if upload or data management options are available there.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[2]/div/div/div/div[3]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Click on the '⚙️ System Settings' button (index 3) to check for upload options or dataset management.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/div/section').nth(0)
+    await click_when_idle(elem)
+    
 
-        # Click on the '🔄 Optimizer' tab (index 18) to check if upload or data management options are available there.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[2]/div/div/div/div[3]/div/div/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Click on the '📊 Dashboard' tab (index 17) to check if upload or data management options are available there.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/div/section[2]/div/div/div/div[3]/div/div/div/button').nth(0)
+    await click_when_idle(elem)
+    
 
-        # Run the real truck simulation to test the optimizer's behavior and verify if the system correctly uses the loaded data for optimization and waiting time calculations.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[2]/div/div/div/div[3]/div/div[5]/div/div/div[8]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Click on the '🔄 Optimizer' tab (index 18) to check if upload or data management options are available there.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/div/section[2]/div/div/div/div[3]/div/div/div/button[3]').nth(0)
+    await click_when_idle(elem)
+    
 
-        # Analyze the loaded Excel data fields and mapping for completeness and correctness. Verify critical fields like loading times, travel times, dump site congestion patterns are present and correctly mapped.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[2]/div/div/div/div[3]/div/div[5]/div/div/div[15]/div/div/div/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Run the real truck simulation to test the optimizer's behavior and verify if the system correctly uses the loaded data for optimization and waiting time calculations.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/div/section[2]/div/div/div/div[3]/div/div[5]/div/div/div[8]/div/button').nth(0)
+    await click_when_idle(elem)
+    
 
-        # Assert that the system loaded the Excel dataset without errors by checking presence of key data sections
-        assert 'fleet_configuration' in page_content
-        assert 'contractors' in page_content['fleet_configuration']
-        assert 'performance_analysis' in page_content
-        assert 'truck_simulation' in page_content['performance_analysis']
-        # Assert that critical fields are present and mapped correctly
-        critical_fields = ['loading_locations', 'parking_locations', 'dumping_locations']
-        for field in critical_fields:
-            assert field in page_content['fleet_configuration'] and len(page_content['fleet_configuration'][field]) > 0, f"Missing or empty critical field: {field}"
-        # Check that each contractor has routes with required fields
-        for contractor, data in page_content['fleet_configuration']['contractors'].items():
-            assert 'routes' in data and len(data['routes']) > 0, f"No routes found for contractor {contractor}"
-            for route in data['routes']:
-                for key in ['parking', 'loading', 'dumping', 'departure_time']:
-                    assert key in route, f"Missing {key} in route for contractor {contractor}"
-        # Assert that system cleaned missing or malformed entries by checking no null trucks count in routes (except allowed null)
-        for contractor, data in page_content['fleet_configuration']['contractors'].items():
-            for route in data['routes']:
-                # trucks can be null for some routes, so no assertion on trucks count null
-                pass
-        # Assert that system provides error message or rejects dataset missing critical fields
-        # This would be checked by presence of error messages or absence of data after upload - simulate by checking error message element if available
-        error_message_locator = frame.locator('text=error').first
-        error_message_visible = await error_message_locator.is_visible()
-        assert not error_message_visible, 'Error message visible indicating dataset rejection or missing fields'
-        await asyncio.sleep(5)
+    # Analyze the loaded Excel data fields and mapping for completeness and correctness. Verify critical fields like loading times, travel times, dump site congestion patterns are present and correctly mapped.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/div/section[2]/div/div/div/div[3]/div/div[5]/div/div/div[15]/div/div/div/div/div/div/div/button').nth(0)
+    await click_when_idle(elem)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # Assert that the system loaded the Excel dataset without errors by checking presence of key data sections
+    assert 'fleet_configuration' in page_content
+    assert 'contractors' in page_content['fleet_configuration']
+    assert 'performance_analysis' in page_content
+    assert 'truck_simulation' in page_content['performance_analysis']
+    # Assert that critical fields are present and mapped correctly
+    critical_fields = ['loading_locations', 'parking_locations', 'dumping_locations']
+    for field in critical_fields:
+        assert field in page_content['fleet_configuration'] and len(page_content['fleet_configuration'][field]) > 0, f"Missing or empty critical field: {field}"
+    # Check that each contractor has routes with required fields
+    for contractor, data in page_content['fleet_configuration']['contractors'].items():
+        assert 'routes' in data and len(data['routes']) > 0, f"No routes found for contractor {contractor}"
+        for route in data['routes']:
+            for key in ['parking', 'loading', 'dumping', 'departure_time']:
+                assert key in route, f"Missing {key} in route for contractor {contractor}"
+    # Assert that system cleaned missing or malformed entries by checking no null trucks count in routes (except allowed null)
+    for contractor, data in page_content['fleet_configuration']['contractors'].items():
+        for route in data['routes']:
+            # trucks can be null for some routes, so no assertion on trucks count null
+            pass
+    # Assert that system provides error message or rejects dataset missing critical fields
+    # This would be checked by presence of error messages or absence of data after upload - simulate by checking error message element if available
+    error_message_locator = frame.locator('text=error').first
+    error_message_visible = await error_message_locator.is_visible()
+    assert not error_message_visible, 'Error message visible indicating dataset rejection or missing fields'
+    await asyncio.sleep(5)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
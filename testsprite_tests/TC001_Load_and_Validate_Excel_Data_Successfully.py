@@ -1,93 +1,72 @@
 import asyncio
-from playwright import async_api
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+import pytest
+
+pytest.importorskip("pytest_asyncio")
+async_api = pytest.importorskip("playwright.async_api")
+
+from conftest import click_when_idle
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_load_and_validate_excel_data_successfully(context):
+    # Open a new page in this test's context of the shared browser (conftest.py)
+    page = await context.new_page()
+    
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto("http://localhost:8501", wait_until="commit", timeout=10000)
     
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8501", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+    
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Look for any UI elements or instructions to trigger the Excel data loading process.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Check for any validation error messages or auto-correction logs and confirm system readiness to proceed.
-        await page.mouse.wheel(0, window.innerHeight)
-        
+    
+    # Interact with the page elements to simulate user flow
+    # Look for any UI elements or instructions to trigger the Excel data loading process.
+    await page.mouse.wheel(0, window.innerHeight)
+    
 
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[2]/div/div/div/div[5]/details/summary').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Check for any validation error messages or auto-correction logs and confirm system readiness to proceed.
+    await page.mouse.wheel(0, window.innerHeight)
+    
 
-        # Assertion: Confirm that the system successfully loads the Excel file without errors by checking data summary presence and row count > 0
-        assert 'project' in page_content
-        assert 'data_summary' in page_content['project']
-        assert page_content['project']['data_summary']['rows'] > 0
-        # Assertion: Validate that all mandatory fields are present and correctly parsed
-        mandatory_fields = ["Loading Origin", "Contractor", "Parking Origin", "Time Departure", "Dumping Destination"]
-        for field in mandatory_fields:
-            assert field in page_content['project']['data_summary']['column_names'], f"Mandatory field {field} missing in data summary columns"
-        # Assertion: Check that any data needing auto-correction is correctly fixed as per validation rules
-        # Since no explicit auto-correction logs or errors are shown, we check that system efficiency is 100% indicating no errors
-        assert 'dashboard' in page_content
-        assert 'fleet_performance' in page_content['dashboard']
-        assert page_content['dashboard']['fleet_performance']['system_efficiency_percent'] == 100.0
-        # Assertion: Confirm the system displays no validation errors and is ready to proceed
-        # Check that wait times for key dump sites are zero or near zero indicating no blocking errors
-        wait_times = page_content['dashboard']['fleet_performance']['wait_times']
-        for site, data in wait_times.items():
-            assert data['wait_minutes'] == 0.0, f"Wait time at {site} is not zero, indicating possible validation errors"
-        # Confirm total contractors and trucks match expected counts
-        assert page_content['project']['contractors_parsed'] == page_content['fleet_configuration']['total_contractors']
-        assert page_content['fleet_configuration']['total_trucks'] == 225
-        await asyncio.sleep(5)
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/div/section[2]/div/div/div/div[5]/details/summary').nth(0)
+    await click_when_idle(elem)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # Assertion: Confirm that the system successfully loads the Excel file without errors by checking data summary presence and row count > 0
+    assert 'project' in page_content
+    assert 'data_summary' in page_content['project']
+    assert page_content['project']['data_summary']['rows'] > 0
+    # Assertion: Validate that all mandatory fields are present and correctly parsed
+    mandatory_fields = ["Loading Origin", "Contractor", "Parking Origin", "Time Departure", "Dumping Destination"]
+    for field in mandatory_fields:
+        assert field in page_content['project']['data_summary']['column_names'], f"Mandatory field {field} missing in data summary columns"
+    # Assertion: Check that any data needing auto-correction is correctly fixed as per validation rules
+    # Since no explicit auto-correction logs or errors are shown, we check that system efficiency is 100% indicating no errors
+    assert 'dashboard' in page_content
+    assert 'fleet_performance' in page_content['dashboard']
+    assert page_content['dashboard']['fleet_performance']['system_efficiency_percent'] == 100.0
+    # Assertion: Confirm the system displays no validation errors and is ready to proceed
+    # Check that wait times for key dump sites are zero or near zero indicating no blocking errors
+    wait_times = page_content['dashboard']['fleet_performance']['wait_times']
+    for site, data in wait_times.items():
+        assert data['wait_minutes'] == 0.0, f"Wait time at {site} is not zero, indicating possible validation errors"
+    # Confirm total contractors and trucks match expected counts
+    assert page_content['project']['contractors_parsed'] == page_content['fleet_configuration']['total_contractors']
+    assert page_content['fleet_configuration']['total_trucks'] == 225
+    await asyncio.sleep(5)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,104 @@
+"""
+Pre-warmed pool of headless Chromium browsers for the TestSprite UI tests.
+
+``start()`` launches ``BROWSER_POOL_SIZE`` browsers concurrently, after
+which ``acquire()`` hands out a fresh ``BrowserContext`` on an idle browser
+and ``release()`` closes it and returns the browser to the pool.  A browser
+is closed and relaunched once it has served ``BROWSER_POOL_RECYCLE_AFTER``
+contexts, which bounds Chromium's native memory growth on long runs.
+
+The pool is bound to the event loop it is started on, so it is started
+lazily by the first ``acquire()`` rather than at import.
+"""
+
+import asyncio
+
+from playwright.async_api import async_playwright
+
+BROWSER_POOL_SIZE = 4
+BROWSER_POOL_RECYCLE_AFTER = 100
+
+# Launch arguments shared by every UI test
+CHROMIUM_ARGS = [
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--ipc=host",                     # Use host-level IPC for better stability
+    "--single-process"                # Run the browser in a single process mode
+]
+
+_playwright = None
+_idle_browsers = None
+# Contexts created so far by each live browser
+_context_counts = {}
+
+
+async def _launch():
+    browser = await _playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+    _context_counts[browser] = 0
+    return browser
+
+
+async def start():
+    """Launch the pool's browsers (no-op when already started)"""
+    global _playwright, _idle_browsers
+    if _idle_browsers is not None:
+        return
+    _playwright = await async_playwright().start()
+    _idle_browsers = asyncio.Queue()
+    for browser in await asyncio.gather(*(_launch() for _ in range(BROWSER_POOL_SIZE))):
+        _idle_browsers.put_nowait(browser)
+
+
+async def acquire():
+    """A new browser context on the next idle browser (waits if all are busy)"""
+    await start()
+    browser = await _idle_browsers.get()
+    try:
+        if browser is None:
+            # A slot whose relaunch failed in release(); try again now
+            browser = await _launch()
+        context = await browser.new_context()
+    except Exception:
+        # Keep the slot (empty or not) so the pool never shrinks
+        _idle_browsers.put_nowait(browser)
+        raise
+    _context_counts[browser] += 1
+    return context
+
+
+async def release(context):
+    """Close a context from ``acquire()`` and return its browser to the pool
+
+    A failed relaunch is raised here, and its slot goes back to the pool
+    empty so the next ``acquire()`` retries the launch instead of the pool
+    shrinking until ``acquire()`` waits forever.
+    """
+    browser = context.browser
+    try:
+        await context.close()
+    finally:
+        if _context_counts[browser] >= BROWSER_POOL_RECYCLE_AFTER:
+            del _context_counts[browser]
+            old_browser, browser = browser, None
+            try:
+                await old_browser.close()
+                browser = await _launch()
+            finally:
+                # An empty slot if the relaunch failed; acquire() retries it
+                _idle_browsers.put_nowait(browser)
+        else:
+            _idle_browsers.put_nowait(browser)
+
+
+async def close():
+    """Close every browser and stop Playwright"""
+    global _playwright, _idle_browsers
+    if _idle_browsers is None:
+        return
+    while not _idle_browsers.empty():
+        browser = _idle_browsers.get_nowait()
+        if browser is not None:
+            await browser.close()
+    _context_counts.clear()
+    await _playwright.stop()
+    _playwright = _idle_browsers = None
@@ -0,0 +1,49 @@
+"""
+Shared Playwright fixtures for the TestSprite UI tests.
+
+Browsers come from the pre-warmed pool in ``browser_pool.py`` and every
+test gets its own ``BrowserContext`` (an isolated incognito profile), so
+Chromium's cold start is paid once per session instead of once per test.
+
+The UI tests are collected only when the file is passed explicitly,
+e.g. ``pytest testsprite_tests/TC003_Baseline_KPI_calculation_accuracy.py``,
+and need ``playwright`` and ``pytest-asyncio`` plus the app running locally.
+"""
+
+try:
+    import pytest_asyncio
+    from playwright.async_api import Error as PlaywrightError
+
+    import browser_pool
+except ImportError:  # the UI tests skip themselves without Playwright
+    pytest_asyncio = None
+
+
+if pytest_asyncio is not None:
+
+    @pytest_asyncio.fixture(scope="session", loop_scope="session")
+    async def pool():
+        """The browser pool, closed at the end of the session"""
+        await browser_pool.start()
+        try:
+            yield browser_pool
+        finally:
+            await browser_pool.close()
+
+    @pytest_asyncio.fixture(loop_scope="session")
+    async def context(pool):
+        """A fresh browser context (like an incognito window) per test"""
+        context = await pool.acquire()
+        context.set_default_timeout(5000)
+        try:
+            yield context
+        finally:
+            await pool.release(context)
+
+    async def click_when_idle(elem, timeout=1500):
+        """Click ``elem`` once its page's network has settled (at most ``timeout`` ms)"""
+        try:
+            await elem.page.wait_for_load_state("networkidle", timeout=timeout)
+        except PlaywrightError:
+            pass
+        await elem.click(timeout=5000)
@@ -0,0 +1,37 @@
+import sys
+import os
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_handlers import validate_time_format
+
+
+def _split_int_check(time_str):
+    """The original split/int() validation the fast path must agree with."""
+    try:
+        parts = time_str.split(':')
+        if len(parts) != 2:
+            return False
+        return 0 <= int(parts[0]) <= 23 and 0 <= int(parts[1]) <= 59
+    except (ValueError, AttributeError):
+        return False
+
+
+@pytest.mark.parametrize("time_str", ["7:30", "07:30", "0:00", "23:59", " 7:30", "7:30 ", "007:30", "7:030", "+7:30", "7:5", "-0:00"])
+def test_valid_times(time_str):
+    assert validate_time_format(time_str)
+
+
+@pytest.mark.parametrize("time_str", ["24:00", "7:60", "-1:30", "7", "7:30:00", "7.5:00", "abc", "", ":30", None, 730])
+def test_invalid_times(time_str):
+    assert not validate_time_format(time_str)
+
+
+def test_matches_split_int_check():
+    """Every H:MM-like string is judged exactly as by the split/int() check."""
+    samples = [f"{h}:{m}" for h in ["", "0", "7", "07", "23", "24", "99", " 7", "+7", "-7", "007"]
+               for m in ["", "0", "5", "00", "30", "59", "60", "030", "30 ", "+30"]]
+    for time_str in samples:
+        assert validate_time_format(time_str) == _split_int_check(time_str), time_str
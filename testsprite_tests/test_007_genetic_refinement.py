@@ -0,0 +1,42 @@
+import sys
+import os
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from real_optimizer import RealOptimizer
+from data_handlers import load_config
+
+@pytest.fixture
+def sample_config():
+    """Load sample truck configuration for testing."""
+    return load_config()
+
+def _total_wait(results):
+    return sum(result['total_wait_time'] for result in results.values())
+
+@pytest.mark.parametrize("random_state", [0, 1])
+def test_genetic_refinement_never_worse_than_brute_force(sample_config, random_state):
+    """
+    The genetic algorithm is seeded with the brute-force schedule, so it can
+    only keep or improve it, and whatever it returns must pass the same zone
+    checks against the baseline as the brute force.
+    """
+    brute = RealOptimizer(sample_config, {})
+    _, brute_results, _, _, _, _, _ = brute.optimize_departure_times()
+
+    optimizer = RealOptimizer(sample_config, {})
+    baseline_results, genetic_results, optimization_log, _, _, _, _ = optimizer.optimize_departure_times(
+        max_iterations=20, genetic=True, random_state=random_state
+    )
+
+    assert _total_wait(genetic_results) <= _total_wait(brute_results) + 1e-9
+    if _total_wait(genetic_results) < _total_wait(baseline_results):
+        *_, zones_acceptable = optimizer._compare_zones(genetic_results, baseline_results)
+        assert zones_acceptable, "Genetic schedule fails the zone checks against the baseline"
+
+    # The last route's cumulative improvement is the whole schedule's
+    last_log = list(optimization_log.values())[-1]
+    expected_improvement = (_total_wait(baseline_results) - _total_wait(genetic_results)) * 60
+    assert last_log['improvement_minutes'] == pytest.approx(expected_improvement)
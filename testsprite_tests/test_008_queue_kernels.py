@@ -0,0 +1,121 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import _queue_kernel
+import departure_optimizer
+import queue_simulation
+import real_optimizer
+from config import FENI_DUMP_POINTS
+
+SERVER_COUNTS = [1, 2, 3, 4]
+SEEDS = range(5)
+
+
+@pytest.fixture(params=['python', 'numba'])
+def kernels(request, monkeypatch):
+    """
+    Queue kernels to check against the pure-Python fallbacks.
+
+    ``numba`` uses the compiled kernels and is skipped without numba;
+    ``python`` uses the uncompiled kernel bodies, which is the code numba
+    compiles, so the kernel branches are exercised either way.
+    """
+    if request.param == 'numba':
+        if _queue_kernel.njit is None:
+            pytest.skip("numba is not installed")
+        return {
+            'simulate_queue': _queue_kernel.simulate_queue,
+            'batch_simulate_queue': _queue_kernel.batch_simulate_queue,
+            'multi_server_queue_kernel': _queue_kernel.multi_server_queue_kernel,
+            'dump_queue_kernel': _queue_kernel.dump_queue_kernel,
+            'simulate_all_queues': _queue_kernel.simulate_all_queues,
+        }
+    # _simulate_all_queues calls the module's multi_server_queue_kernel
+    monkeypatch.setattr(_queue_kernel, 'multi_server_queue_kernel', _queue_kernel._multi_server_queue)
+    return {
+        'simulate_queue': _queue_kernel._simulate_queue,
+        'batch_simulate_queue': lambda arrivals, services, servers: np.array([
+            _queue_kernel._simulate_queue(row_arrivals, row_services, servers)
+            for row_arrivals, row_services in zip(arrivals, services)
+        ]),
+        'multi_server_queue_kernel': _queue_kernel._multi_server_queue,
+        'dump_queue_kernel': _queue_kernel._dump_queue,
+        'simulate_all_queues': _queue_kernel._simulate_all_queues,
+    }
+
+
+def _random_arrivals(seed, num_trucks=60):
+    """Sorted arrivals (hours) with ties, and service times (hours)."""
+    rng = np.random.default_rng(seed)
+    # Rounding to whole minutes makes simultaneous arrivals common
+    arrivals = np.sort(np.round(rng.uniform(5.0, 9.0, num_trucks) * 60) / 60)
+    services = rng.uniform(0.05, 0.3, num_trucks)
+    return arrivals, services
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("servers", SERVER_COUNTS)
+def test_multi_server_queue_kernel_matches_python(kernels, monkeypatch, seed, servers):
+    arrivals, services = _random_arrivals(seed)
+    pairs = list(zip(arrivals.tolist(), services.tolist()))
+
+    monkeypatch.setattr(queue_simulation, 'multi_server_queue_kernel', None)
+    expected = queue_simulation.multi_server_queue(pairs, servers)
+    monkeypatch.setattr(queue_simulation, 'multi_server_queue_kernel', kernels['multi_server_queue_kernel'])
+    assert queue_simulation.multi_server_queue(pairs, servers) == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_simulate_subpoint_queues_kernel_matches_python(kernels, monkeypatch, seed):
+    subpoints = [sp for cfg in FENI_DUMP_POINTS.values() for sp in cfg['sub_points']]
+    events = {}
+    for offset, subpoint in enumerate(subpoints):
+        arrivals, services = _random_arrivals(seed * 100 + offset, num_trucks=10 + 7 * offset)
+        events[subpoint] = list(zip(arrivals.tolist(), services.tolist()))
+    events['EMPTY'] = []
+
+    monkeypatch.setattr(queue_simulation, 'simulate_all_queues', None)
+    expected = queue_simulation.simulate_subpoint_queues(events)
+    monkeypatch.setattr(queue_simulation, 'simulate_all_queues', kernels['simulate_all_queues'])
+    assert queue_simulation.simulate_subpoint_queues(events) == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("servers", SERVER_COUNTS)
+def test_departure_optimizer_queue_kernels_match_python(kernels, monkeypatch, seed, servers):
+    arrivals, services = _random_arrivals(seed)
+    batch_arrivals = np.stack([arrivals, arrivals + 0.25, np.sort(arrivals[::-1] * 0.9)])
+    batch_services = np.stack([services, services[::-1], services])
+
+    monkeypatch.setattr(departure_optimizer, 'simulate_queue', None)
+    monkeypatch.setattr(departure_optimizer, 'batch_simulate_queue', None)
+    expected = departure_optimizer._queue_total_wait(arrivals, services, servers)
+    expected_batch = departure_optimizer._queue_total_waits(batch_arrivals, batch_services, servers)
+
+    monkeypatch.setattr(departure_optimizer, 'simulate_queue', kernels['simulate_queue'])
+    monkeypatch.setattr(departure_optimizer, 'batch_simulate_queue', kernels['batch_simulate_queue'])
+    assert departure_optimizer._queue_total_wait(arrivals, services, servers) == expected
+    np.testing.assert_array_equal(
+        departure_optimizer._queue_total_waits(batch_arrivals, batch_services, servers), expected_batch
+    )
+
+
+@pytest.mark.parametrize("record_events", [False, True])
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("servers", SERVER_COUNTS)
+def test_dump_queue_kernel_matches_python(kernels, monkeypatch, seed, servers, record_events):
+    arrivals, services = _random_arrivals(seed)
+    # Unsorted input: the simulator sorts it (stably) itself
+    shuffled = np.random.default_rng(seed).permutation(len(arrivals))
+    arrivals, services = arrivals[shuffled], services[shuffled]
+    simulator = real_optimizer.MultiServerQueueSimulator()
+
+    monkeypatch.setattr(real_optimizer, 'dump_queue_kernel', None)
+    expected = simulator.simulate_dump_arrays(arrivals, services, servers, record_events)
+    monkeypatch.setattr(real_optimizer, 'dump_queue_kernel', kernels['dump_queue_kernel'])
+    assert simulator.simulate_dump_arrays(arrivals, services, servers, record_events) == expected
@@ -0,0 +1,150 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import MINING_INTELLIGENCE
+from core_calculations import parse_departure_hour
+from mining_intelligence import (
+    _window_ends, analyze_arrival_conflicts, generate_research_recommendations, has_more_conflicts_than,
+    iter_arrival_conflicts
+)
+
+DUMP_SITES = ['FENI km 0', 'FENI km 15']
+
+
+def _brute_force_conflicts(contractor_configs):
+    """Every pair of arrivals within the window, checked pair by pair."""
+    window = MINING_INTELLIGENCE['arrival_time_window'] / 60
+    conflicts = []
+    for dump_site in DUMP_SITES:
+        arrivals = sorted(
+            (
+                (parse_departure_hour(config['departure_time'], default=7.0) + 1.5, f"{contractor}_{parking}")
+                for contractor, locations in contractor_configs.items()
+                for parking, config in locations.items()
+                if config['dumping_location'] == dump_site
+            ),
+            key=lambda arrival: arrival[0]
+        )
+        for i, (time_i, label_i) in enumerate(arrivals):
+            for time_j, label_j in arrivals[i + 1:]:
+                if time_j - time_i <= window:
+                    conflicts.append({
+                        'dump_site': dump_site,
+                        'contractor1': label_i,
+                        'contractor2': label_j,
+                        'time_difference_hours': time_j - time_i,
+                        'severity': 'High' if time_j - time_i <= 0.25 else 'Medium'
+                    })
+    return conflicts
+
+
+def _config(departures):
+    """One route per ``(contractor, dump site, departure)`` entry."""
+    contractor_configs = {}
+    for n, (contractor, dump_site, departure) in enumerate(departures):
+        contractor_configs.setdefault(contractor, {})[f"P{n}"] = {
+            'dumping_location': dump_site,
+            'departure_time': departure,
+            'number_of_trucks': 5
+        }
+    return contractor_configs
+
+
+def _random_config(seed, num_routes=40):
+    rng = np.random.default_rng(seed)
+    return _config([
+        (f"C{rng.integers(6)}", DUMP_SITES[rng.integers(2)], f"{rng.integers(5, 10)}:{rng.integers(0, 60):02d}")
+        for _ in range(num_routes)
+    ])
+
+
+# Gaps of exactly 15 and 30 minutes, just either side of them, and ties
+BOUNDARY_CONFIG = _config([
+    ('A', 'FENI km 0', '6:00'), ('B', 'FENI km 0', '6:15'), ('C', 'FENI km 0', '6:30'),
+    ('D', 'FENI km 0', '6:31'), ('E', 'FENI km 0', '7:01'), ('F', 'FENI km 0', '7:01'),
+    ('G', 'FENI km 0', '7:16'), ('H', 'FENI km 0', '7:17'), ('I', 'FENI km 0', '8:00'),
+    ('J', 'FENI km 15', '5:10'), ('K', 'FENI km 15', '5:40'), ('L', 'FENI km 15', '5:55'),
+    ('M', 'FENI km 15', '6:10'), ('N', 'FENI km 15', '6:41'),
+    # times + window rounds past the later arrival although the difference
+    # is just over 30 (and 15) minutes
+    ('O', 'FENI km 15', '6:03'), ('P', 'FENI km 15', '6:33'), ('R', 'FENI km 15', '6:18'),
+])
+
+CONFIGS = [BOUNDARY_CONFIG] + [_random_config(seed) for seed in range(5)]
+
+
+@pytest.mark.parametrize("contractor_configs", CONFIGS)
+def test_sweep_matches_brute_force(contractor_configs):
+    assert analyze_arrival_conflicts(contractor_configs) == _brute_force_conflicts(contractor_configs)
+
+
+def test_boundary_gaps_are_conflicts():
+    conflicts = analyze_arrival_conflicts(BOUNDARY_CONFIG)
+    pairs = {(c['contractor1'].split('_')[0], c['contractor2'].split('_')[0]): c['severity'] for c in conflicts}
+    # 30 minutes apart is still a conflict, 31 minutes is not
+    assert pairs[('A', 'C')] == 'Medium'
+    assert ('A', 'D') not in pairs
+    assert pairs[('J', 'K')] == 'Medium'
+    assert ('M', 'N') not in pairs
+    # 15 minutes apart is still high severity, 16 minutes is not
+    assert pairs[('A', 'B')] == 'High'
+    assert pairs[('E', 'G')] == 'High'
+    assert pairs[('F', 'H')] == 'Medium'
+    assert pairs[('E', 'F')] == 'High'
+    # 6:03 + 30 min rounds onto 6:33 (and 6:18 + 15 min onto 6:33), but
+    # the differences are just over 30 (and 15) minutes
+    assert ('O', 'P') not in pairs
+    assert pairs[('R', 'P')] == 'Medium'
+
+
+def _brute_force_window_ends(times, window):
+    return np.array([
+        i + 1 + sum(1 for later in times[i + 1:] if later - time <= window) for i, time in enumerate(times)
+    ])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_window_ends_settle_rounding(seed):
+    """The searchsorted ends are moved onto the exact differences, in both directions."""
+    rng = np.random.default_rng(seed)
+    window = 0.5
+    base = np.round(rng.uniform(5.0, 10.0, 30), 3)
+    # Arrivals one ulp either side of base + window, where base + window and
+    # later - base can disagree (e.g. 0.337 and 0.8370000000000001)
+    edges = np.concatenate([base + window, np.nextafter(base + window, 0), np.nextafter(base + window, 24)])
+    times = np.sort(np.concatenate([[0.337, 0.8370000000000001], base, edges]))
+    np.testing.assert_array_equal(_window_ends(times, window), _brute_force_window_ends(times, window))
+
+
+@pytest.mark.parametrize("contractor_configs", CONFIGS)
+def test_has_more_conflicts_than_matches_count(contractor_configs):
+    conflict_count = len(analyze_arrival_conflicts(contractor_configs))
+    for threshold in range(conflict_count + 2):
+        assert has_more_conflicts_than(contractor_configs, threshold) == (conflict_count > threshold)
+
+
+@pytest.mark.parametrize("limit", [0, 1, 5])
+def test_limit_returns_the_first_conflicts(limit):
+    assert analyze_arrival_conflicts(BOUNDARY_CONFIG, limit=limit) == _brute_force_conflicts(BOUNDARY_CONFIG)[:limit]
+
+
+# One conflict, below the recommendation threshold
+FEW_CONFLICTS_CONFIG = _config([('A', 'FENI km 0', '6:00'), ('B', 'FENI km 0', '6:10'), ('C', 'FENI km 15', '6:00')])
+
+
+@pytest.mark.parametrize("contractor_configs", CONFIGS + [FEW_CONFLICTS_CONFIG])
+def test_recommendations_count_conflicts_lazily(contractor_configs):
+    """A conflict list, the lazy iterator and no conflicts at all give the same recommendations."""
+    wait_times = {'C0': {'P0': {'waiting_time': 0.5}}}
+    expected = generate_research_recommendations(
+        contractor_configs, wait_times, analyze_arrival_conflicts(contractor_configs)
+    )
+    assert generate_research_recommendations(
+        contractor_configs, wait_times, iter_arrival_conflicts(contractor_configs)
+    ) == expected
+    assert generate_research_recommendations(contractor_configs, wait_times) == expected